@@ -0,0 +1,111 @@
+"""
+Compares generated framebuffers with reference images, without a display or any Qt widgets.
+
+Every reference PNG has a sidecar file with the hash of its pixels. Identical images are recognized by that hash alone,
+only if it differs is the reference image decoded and compared pixel by pixel.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy
+from PySide2.QtGui import QImage
+
+from foundry.game.level.LevelRenderer import Framebuffer, image_to_array, save_png
+
+HASH_SUFFIX = ".sha256"
+
+# color of pixels, that are different from the reference
+DIFF_COLOR = [0xFF, 0x00, 0x00]
+
+
+class ComparisonResult(NamedTuple):
+    matches: bool
+    differing_pixels: int
+    diff_image: Optional[Framebuffer]
+
+
+def framebuffer_hash(framebuffer: Framebuffer) -> str:
+    hash_ = hashlib.sha256(str(framebuffer.shape).encode("ascii"))
+    hash_.update(numpy.ascontiguousarray(framebuffer).tobytes())
+
+    return hash_.hexdigest()
+
+
+def _hash_path(ref_image_path: Path) -> Path:
+    return ref_image_path.with_name(ref_image_path.name + HASH_SUFFIX)
+
+
+def save_reference(ref_image_path: Path, framebuffer: Framebuffer):
+    save_png(framebuffer, ref_image_path)
+    _hash_path(ref_image_path).write_text(framebuffer_hash(framebuffer))
+
+
+def load_reference(ref_image_path: Path) -> Framebuffer:
+    return image_to_array(QImage(str(ref_image_path)))
+
+
+def reference_hash(ref_image_path: Path) -> Optional[str]:
+    hash_path = _hash_path(ref_image_path)
+
+    if hash_path.exists():
+        return hash_path.read_text().strip()
+
+    return None
+
+
+def make_diff_image(reference: Framebuffer, differing: numpy.ndarray) -> Framebuffer:
+    """
+    Returns a darkened, grayscale version of the reference with the differing pixels highlighted.
+    """
+    gray = (reference.mean(axis=2, keepdims=True) // 2).astype(numpy.uint8)
+
+    diff_image = numpy.repeat(gray, 3, axis=2)
+    diff_image[differing] = DIFF_COLOR
+
+    return diff_image
+
+
+def compare_framebuffers(
+    reference: Framebuffer, generated: Framebuffer, tolerance: int = 0, max_differing_pixels: int = 0
+) -> ComparisonResult:
+    """
+    :param tolerance: How much a color channel of a pixel may differ, before the pixel counts as different.
+    :param max_differing_pixels: How many pixels may be different, before the images do not match anymore.
+    """
+    if reference.shape != generated.shape:
+        return ComparisonResult(False, generated.shape[0] * generated.shape[1], generated)
+
+    channel_diff = numpy.abs(reference.astype(numpy.int16) - generated.astype(numpy.int16))
+
+    differing = (channel_diff > tolerance).any(axis=2)
+    differing_pixels = int(numpy.count_nonzero(differing))
+
+    if differing_pixels == 0:
+        return ComparisonResult(True, 0, None)
+
+    return ComparisonResult(
+        differing_pixels <= max_differing_pixels, differing_pixels, make_diff_image(reference, differing)
+    )
+
+
+def compare_with_reference(
+    ref_image_path: Path, generated: Framebuffer, tolerance: int = 0, max_differing_pixels: int = 0
+) -> ComparisonResult:
+    """
+    Compares the generated framebuffer with the reference image, checking the stored hash of the reference first.
+    """
+    generated_hash = framebuffer_hash(generated)
+    stored_hash = reference_hash(ref_image_path)
+
+    if stored_hash == generated_hash:
+        return ComparisonResult(True, 0, None)
+
+    result = compare_framebuffers(load_reference(ref_image_path), generated, tolerance, max_differing_pixels)
+
+    if stored_hash is None and result.differing_pixels == 0:
+        # reference without a hash, make the next comparison cheaper
+        _hash_path(ref_image_path).write_text(generated_hash)
+
+    return result
@@ -0,0 +1,55 @@
+"""
+Benchmarks of the hot paths of the editor, each measured over every stock level. They need pytest-benchmark.
+
+They are not collected by a plain "pytest", since they take long and write to the ROM. Run them explicitly with
+"pytest benchmarks".
+
+Save a baseline, before making a change:
+
+    pytest benchmarks --benchmark-save=baseline
+
+Compare against it afterwards, failing if the mean of any benchmark got more than 10% slower:
+
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Baselines are stored as JSON in .benchmarks/, see the pytest-benchmark documentation for all options.
+"""
+
+from typing import List
+
+import pytest
+
+from foundry import root_dir
+from foundry.batch_render import LEVEL_JOB, RenderJob, list_render_jobs
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+
+# measuring over all stock levels takes long enough, to not need many rounds
+ROUNDS = 3
+
+
+@pytest.fixture(scope="session", autouse=True)
+def rom():
+    yield ROM(root_dir.joinpath("SMB3.nes"))
+
+
+@pytest.fixture(scope="session")
+def level_jobs() -> List[RenderJob]:
+    return [job for job in list_render_jobs() if job.kind == LEVEL_JOB]
+
+
+@pytest.fixture(scope="session")
+def stock_levels(level_jobs) -> List[Level]:
+    return [Level(*job.arguments) for job in level_jobs]
+
+
+@pytest.fixture
+def run(benchmark):
+    """
+    Runs the given function ROUNDS times, with a fresh setup every round, if one is given.
+    """
+
+    def _run(function, setup=None):
+        return benchmark.pedantic(function, setup=setup, rounds=ROUNDS, iterations=1, warmup_rounds=1)
+
+    return _run
@@ -0,0 +1,104 @@
+from PySide2.QtGui import QImage, QPainter
+
+from foundry.game.File import ROM
+from foundry.game.gfx.GraphicsSet import GraphicsSet
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.objects.LevelObject import LevelObject
+from foundry.game.gfx.Palette import load_palette_group
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import LevelDrawer
+
+UNDO_STEPS = 5
+TILES_IN_GRAPHICS_SET = 256
+
+
+def test_level_loading(run, level_jobs):
+    def load_all_levels():
+        for job in level_jobs:
+            Level(*job.arguments)
+
+    run(load_all_levels)
+
+
+def test_level_object_render(run, stock_levels):
+    level_objects = [obj for level in stock_levels for obj in level.objects if isinstance(obj, LevelObject)]
+
+    def render_all_objects():
+        for level_object in level_objects:
+            level_object._render()
+
+    run(render_all_objects)
+
+
+def test_level_drawer_draw(run, stock_levels, qtbot):
+    drawer = LevelDrawer()
+
+    images = [QImage(level.get_rect(Block.SIDE_LENGTH).size(), QImage.Format_RGB888) for level in stock_levels]
+
+    def setup():
+        # only measure drawing with a cold block cache, since that is where the time goes, when opening a level
+        Block._block_cache.clear()
+
+    def draw_all_levels():
+        for level, image in zip(stock_levels, images):
+            painter = QPainter(image)
+            drawer.draw(painter, level)
+            painter.end()
+
+    run(draw_all_levels, setup)
+
+
+def test_tile_decoding(run, stock_levels):
+    tile_sources = set()
+
+    for level in stock_levels:
+        tile_sources.add((level.object_set_number, level.header.object_palette_index, level.header.graphic_set_index))
+
+    tile_sources = [
+        (load_palette_group(object_set, palette_index), GraphicsSet(graphic_set))
+        for object_set, palette_index, graphic_set in sorted(tile_sources)
+    ]
+
+    def decode_all_tiles():
+        for palette_group, graphics_set in tile_sources:
+            for tile_index in range(TILES_IN_GRAPHICS_SET):
+                Tile(tile_index, palette_group, 0, graphics_set)
+
+    run(decode_all_tiles)
+
+
+def test_undo_stack(run, stock_levels):
+    def setup():
+        # every round starts with an empty stack, so that all of them measure the same amount of states
+        for level in stock_levels:
+            level.undo_stack.clear(level.to_bytes())
+
+    def save_undo_and_redo():
+        for level in stock_levels:
+            for _ in range(UNDO_STEPS):
+                level.undo_stack.save_level_state(level.to_bytes())
+
+            for _ in range(UNDO_STEPS):
+                level.from_bytes(*level.undo_stack.undo(), new_level=False)
+
+            for _ in range(UNDO_STEPS):
+                level.from_bytes(*level.undo_stack.redo(), new_level=False)
+
+    run(save_undo_and_redo, setup)
+
+
+def test_rom_save(run, stock_levels, tmp_path):
+    rom = ROM()
+    rom_path = str(tmp_path / "SMB3.nes")
+
+    def save_all_levels():
+        for level in stock_levels:
+            (layout_address, layout_bytes), (enemy_address, enemy_bytes) = level.to_bytes()
+
+            rom.write(layout_address, layout_bytes)
+            rom.write(enemy_address, enemy_bytes)
+
+        ROM.save_to_file(rom_path)
+
+    run(save_all_levels)
@@ -1,10 +1,7 @@
 import json
-import urllib.request
-import urllib.error
 from pathlib import Path
 
-from PySide2.QtCore import QUrl
-from PySide2.QtGui import QDesktopServices, QIcon
+# Qt and urllib are imported in the functions using them, so that importing foundry stays cheap, see startup_profile
 
 root_dir = Path(__file__).parent.parent
 
@@ -20,6 +17,9 @@ discord_link = "https://discord.gg/pm87gm7"
 
 
 def open_url(url: str):
+    from PySide2.QtCore import QUrl
+    from PySide2.QtGui import QDesktopServices
+
     QDesktopServices.openUrl(QUrl(url))
 
 
@@ -36,6 +36,9 @@ def get_latest_version_name(timeout: int = 10) -> str:
     owner = "mchlnix"
     repo = "SMB3-Foundry"
 
+    import urllib.error
+    import urllib.request
+
     api_call = f"https://api.github.com/repos/{owner}/{repo}/releases"
 
     try:
@@ -52,6 +55,8 @@ def get_latest_version_name(timeout: int = 10) -> str:
 
 
 def icon(icon_name: str):
+    from PySide2.QtGui import QIcon
+
     icon_path = icon_dir / icon_name
     data_path = data_dir / icon_name
 
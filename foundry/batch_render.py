@@ -0,0 +1,171 @@
+"""
+Renders every level and world map of a ROM into PNG files, without starting the editor.
+
+The levels are taken from the level list in data/levels.dat, the world maps from the ROM itself. The work is spread
+across a pool of processes, each of which loads the ROM once.
+"""
+
+import argparse
+import re
+import sys
+import time
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelRenderer import LevelRenderer, save_png
+from smb3parse.levels import WORLD_COUNT
+from smb3parse.levels.world_map import WorldMap as _WorldMap
+from smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+LEVEL_JOB = "level"
+WORLD_MAP_JOB = "world map"
+
+
+class RenderJob(NamedTuple):
+    kind: str
+    name: str
+    file_name: str
+    arguments: tuple
+
+
+class RenderResult(NamedTuple):
+    job: RenderJob
+    seconds: float
+    error: Optional[str]
+
+
+def _file_name(name: str) -> str:
+    return re.sub(r"[^\w\-. ]", "_", name) + ".png"
+
+
+def list_render_jobs() -> List[RenderJob]:
+    jobs = []
+
+    for world_number in range(1, WORLD_COUNT + 1):
+        name = f"World {world_number} - Overworld"
+
+        jobs.append(RenderJob(WORLD_MAP_JOB, name, _file_name(name), (world_number,)))
+
+    for level_info in Level.offsets[1:]:
+        if level_info.real_obj_set == WORLD_MAP_OBJECT_SET:
+            continue
+
+        name = f"Level {level_info.game_world}-{level_info.level_in_world} - {level_info.name}"
+
+        # the level list points to the object data, directly after the header
+        level_address = level_info.rom_level_offset - Level.HEADER_LENGTH
+
+        jobs.append(
+            RenderJob(
+                LEVEL_JOB,
+                name,
+                _file_name(name),
+                (name, level_address, level_info.enemy_offset, level_info.real_obj_set),
+            )
+        )
+
+    return jobs
+
+
+_renderer: Optional[LevelRenderer] = None
+_output_dir: Optional[Path] = None
+
+
+def _init_worker(rom_path: str, output_dir: Path, block_length: int, transparency: bool):
+    global _renderer, _output_dir
+
+    ROM.load_from_file(rom_path)
+
+    _renderer = LevelRenderer(block_length, transparency)
+    _output_dir = output_dir
+
+
+def _render_job(job: RenderJob) -> RenderResult:
+    start = time.perf_counter()
+
+    try:
+        if job.kind == WORLD_MAP_JOB:
+            framebuffer = _renderer.render_world_map(_WorldMap.from_world_number(ROM(), *job.arguments))
+        else:
+            framebuffer = _renderer.render(Level(*job.arguments))
+
+        if not save_png(framebuffer, _output_dir / job.file_name):
+            raise IOError(f"Could not write {job.file_name}.")
+
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return RenderResult(job, time.perf_counter() - start, error)
+
+
+def render_all(
+    rom_path: str,
+    output_dir: Path,
+    processes: Optional[int] = None,
+    block_length: int = Block.SIDE_LENGTH,
+    transparency: bool = False,
+    jobs: Optional[List[RenderJob]] = None,
+) -> Tuple[List[RenderResult], float]:
+    """
+    Renders the given jobs, or every level and world map, into the output directory.
+
+    :return: The results, in the order they finished, and the wall clock time it took in seconds.
+    """
+    if jobs is None:
+        jobs = list_render_jobs()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+
+    with Pool(processes, _init_worker, (rom_path, output_dir, block_length, transparency)) as pool:
+        results = list(pool.imap_unordered(_render_job, jobs))
+
+    return results, time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Renders all levels and world maps of a SMB3 ROM to PNG files.")
+    parser.add_argument("rom", help="path to the ROM")
+    parser.add_argument("output_dir", type=Path, help="directory to save the PNG files into")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=cpu_count(), help="number of processes to render with (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-b",
+        "--block-length",
+        type=int,
+        default=Block.SIDE_LENGTH,
+        help=f"side length of a block in pixels, a multiple of {Block.SIDE_LENGTH} (default: %(default)s)",
+    )
+    parser.add_argument("-t", "--transparency", action="store_true", help="don't fill in the block backgrounds")
+
+    args = parser.parse_args(argv)
+
+    if args.block_length <= 0 or args.block_length % Block.SIDE_LENGTH:
+        parser.error(f"block length must be a positive multiple of {Block.SIDE_LENGTH}")
+
+    results, wall_time = render_all(args.rom, args.output_dir, args.jobs, args.block_length, args.transparency)
+
+    failed = 0
+
+    for result in sorted(results, key=lambda result: result.seconds, reverse=True):
+        if result.error is None:
+            print(f"{result.seconds:8.3f}s  {result.job.name}")
+        else:
+            failed += 1
+            print(f"  FAILED   {result.job.name}: {result.error}", file=sys.stderr)
+
+    cpu_time = sum(result.seconds for result in results)
+
+    print(
+        f"Rendered {len(results) - failed} of {len(results)} levels and world maps in {wall_time:.2f}s "
+        f"({cpu_time:.2f}s across {args.jobs} processes)."
+    )
+
+    return 1 if failed else 0
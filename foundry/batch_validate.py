@@ -0,0 +1,53 @@
+"""
+Checks every level of a ROM for the same problems, that the warning list in the editor shows, without starting it.
+"""
+
+import argparse
+from typing import List, Optional, Tuple
+
+from foundry.batch_render import LEVEL_JOB, RenderJob, list_render_jobs
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelValidator import LevelValidator
+
+
+def validate_all(rom_path: str, jobs: Optional[List[RenderJob]] = None) -> List[Tuple[RenderJob, List[str]]]:
+    """
+    Validates the levels of the given jobs, or every level in the level list.
+
+    :return: Every level with its warnings, including the levels without any.
+    """
+    ROM.load_from_file(rom_path)
+
+    if jobs is None:
+        jobs = list_render_jobs()
+
+    validator = LevelValidator()
+
+    return [(job, validator.validate(Level(*job.arguments))) for job in jobs if job.kind == LEVEL_JOB]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Checks all levels of a SMB3 ROM for problems.")
+    parser.add_argument("rom", help="path to the ROM")
+
+    args = parser.parse_args(argv)
+
+    results = validate_all(args.rom)
+
+    levels_with_warnings = 0
+
+    for job, warnings in results:
+        if not warnings:
+            continue
+
+        levels_with_warnings += 1
+
+        print(job.name)
+
+        for warning in warnings:
+            print(f"  {warning}")
+
+    print(f"{levels_with_warnings} of {len(results)} levels have warnings.")
+
+    return 1 if levels_with_warnings else 0
@@ -1,10 +1,13 @@
 import os
+from pathlib import Path
 
 import pytest
 from PySide2.QtGui import QPixmap
 
 from approval_tests.gui import ApprovalDialog
+from approval_tests.headless import compare_with_reference, save_reference
 from foundry import root_dir
+from foundry.game.level.LevelRenderer import Framebuffer, save_png
 from foundry.game.File import ROM
 from foundry.game.level.Level import Level
 from smb3parse.objects.object_set import PLAINS_OBJECT_SET
@@ -15,6 +18,15 @@ level_1_1_enemy_address = 0xC537 + 1
 level_1_2_object_address = 0x20F3A
 level_1_2_enemy_address = 0xC6BA + 1
 
+# how much a color channel may differ in headless image comparisons, before a pixel counts as different
+PIXEL_TOLERANCE = int(os.environ.get("SMB3_PIXEL_TOLERANCE", 0))
+# how many pixels may differ, before a headless image comparison fails
+MAX_DIFFERING_PIXELS = int(os.environ.get("SMB3_MAX_DIFFERING_PIXELS", 0))
+# where the generated and diff images of failed headless image comparisons are saved
+TEST_ARTIFACT_DIR = Path(os.environ.get("SMB3_TEST_ARTIFACTS", root_dir / "test_artifacts"))
+# set to save missing references of headless image comparisons, instead of failing, e. g. after adding a level
+UPDATE_REFERENCES = bool(os.environ.get("SMB3_UPDATE_REFS"))
+
 
 @pytest.fixture
 def level(rom, qtbot):
@@ -49,3 +61,40 @@ def compare_images(image_name: str, ref_image_path: str, gen_image: QPixmap):
         gen_image.toImage().save(ref_image_path)
 
         pytest.skip(f"No ref image was found. Saved new ref under {ref_image_path}.")
+
+
+def compare_framebuffer(image_name: str, ref_image_path: Path, framebuffer: Framebuffer):
+    """
+    Headless version of compare_images. Instead of asking with a dialog, the generated and a diff image are saved into
+    the test artifact directory, when the framebuffer does not match the reference. A missing reference is a failure,
+    unless SMB3_UPDATE_REFS is set, or no references were generated at all, in which case the test is skipped, like in
+    compare_images.
+    """
+    if not ref_image_path.exists():
+        if not UPDATE_REFERENCES and not ref_image_path.parent.exists():
+            pytest.skip(f"No ref images were made in {ref_image_path.parent}. Set SMB3_UPDATE_REFS=1 to save them.")
+        elif not UPDATE_REFERENCES:
+            pytest.fail(f"No ref image was found under {ref_image_path}. Set SMB3_UPDATE_REFS=1 to save it.")
+
+        ref_image_path.parent.mkdir(parents=True, exist_ok=True)
+        save_reference(ref_image_path, framebuffer)
+
+        return
+
+    result = compare_with_reference(ref_image_path, framebuffer, PIXEL_TOLERANCE, MAX_DIFFERING_PIXELS)
+
+    if result.matches:
+        return
+
+    TEST_ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+
+    generated_path = TEST_ARTIFACT_DIR / image_name
+    diff_path = TEST_ARTIFACT_DIR / f"{Path(image_name).stem}.diff.png"
+
+    save_png(framebuffer, generated_path)
+    save_png(result.diff_image, diff_path)
+
+    pytest.fail(
+        f"{image_name} did not look like the reference. {result.differing_pixels} pixels differed. "
+        f"See {generated_path} and {diff_path}."
+    )
@@ -17,6 +17,14 @@ def read_string_dict(path):
 MAX_LEVEL_SECTIONS = 65
 SMB3_LEVEL_COUNT = 298
 
+# by the scroll type index in the level header
+SCROLL_DIRECTIONS = [
+    "Locked, unless climbing/flying",
+    "Free vertical scrolling",
+    "Locked 'by start coordinates'?",
+    "Shouldn't appear in game, do not use.",
+]
+
 MapscreenPointerLocation = namedtuple("MapscreenPointerLocation", "count offset")
 ObjectInfo = namedtuple("ObjectInfo", "index subindex x y width height x2 y2 obj objtype rect drag")
 
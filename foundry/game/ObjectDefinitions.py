@@ -1,5 +1,10 @@
+import hashlib
+import os
+import pickle
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
 
 from foundry import data_dir
 from smb3parse.objects.object_set import (
@@ -63,76 +68,78 @@ class EndType(Enum):
 
 ENEMY_OBJECT_DEFINITION = 12
 
+# only the first enemy definitions come with handle offsets
+ENEMY_HANDLE_COUNT = 237
 
-class ObjectDefinition:
-    def __init__(self, string):
-        string = string.rstrip().replace("<", "").replace(">", "")
-
-        (
-            self.domain,
-            self.min_value,
-            self.max_value,
-            self.bmp_width,
-            self.bmp_height,
-            *self.object_design,
-            self.orientation,
-            self.ending,
-            self.is_4byte,
-            self.description,
-        ) = string.split(",")
-
-        self.bmp_width = int(self.bmp_width)
-        self.bmp_height = int(self.bmp_height)
-        self.orientation = int(self.orientation)
-        self.ending = int(self.ending)
-        self.is_4byte = self.is_4byte == "1"
-        self.description = self.description.replace(";;", ",")
-
-        self.object_design2 = []
-        self.rom_object_design = []
+# change, whenever the layout of the compiled tables changes, so that old caches are not used anymore
+CACHE_VERSION = 1
 
-        for index, item in enumerate(self.object_design):
-            self.object_design[index] = int(item)  # original data
-            self.object_design2.append(0)  # data after trimming through romobjset*.dat file?
-            self.rom_object_design.append(self.object_design[index])
-            self.object_design_length = index + 1  # todo necessary when we have len()?
+cache_dir = Path.home() / ".smb3foundry" / "cache"
 
-        self.description = self.description.split("|")[0]
-
-
-object_metadata: List[List[ObjectDefinition]] = [[]]
-enemy_handle_x = []
-enemy_handle_x2 = []
-enemy_handle_y = []
-
-with open(data_dir.joinpath("data.dat"), "r") as f:
-    first_index = 0  # todo what are they symbolizing? object tables?
-    second_index = 0
-
-    for line in f.readlines():
-        if line.startswith(";"):  # is a comment
-            continue
+CACHE_FILE_PREFIX = "object_definitions-"
 
-        if line.rstrip() == "":
-            object_metadata.append([])
 
-            first_index += 1
-            second_index = 0
-            continue
+class ObjectDefinition(NamedTuple):
+    domain: str
+    min_value: str
+    max_value: str
+    bmp_width: int
+    bmp_height: int
+    object_design: Tuple[int, ...]  # original data
+    orientation: int
+    ending: int
+    is_4byte: bool
+    description: str
+    rom_object_design: Tuple[int, ...]  # data after trimming through romobjset*.dat file
+    object_design_length: int
+    object_design2: Tuple[int, ...]  # overlay data from the romobjset*.dat file
 
-        object_metadata[first_index].append(ObjectDefinition(line))
+    @staticmethod
+    def from_string(string: str) -> "ObjectDefinition":
+        string = string.rstrip().replace("<", "").replace(">", "")
 
-        if first_index == ENEMY_OBJECT_DEFINITION and second_index <= 236:
-            if line.find("|") >= 0:
-                x, y, x2 = line.split("|")[1].split(" ")
-            else:
-                x, y, x2 = "0 0 0".split(" ")
+        (
+            domain,
+            min_value,
+            max_value,
+            bmp_width,
+            bmp_height,
+            *object_design,
+            orientation,
+            ending,
+            is_4byte,
+            description,
+        ) = string.split(",")
 
-            enemy_handle_x.append(int(x))
-            enemy_handle_x2.append(int(x2))
-            enemy_handle_y.append(int(y))
+        object_design = tuple(int(item) for item in object_design)
+
+        return ObjectDefinition(
+            domain=domain,
+            min_value=min_value,
+            max_value=max_value,
+            bmp_width=int(bmp_width),
+            bmp_height=int(bmp_height),
+            object_design=object_design,
+            orientation=int(orientation),
+            ending=int(ending),
+            is_4byte=is_4byte == "1",
+            description=description.replace(";;", ",").split("|")[0],
+            rom_object_design=object_design,
+            object_design_length=len(object_design),
+            object_design2=(0,) * len(object_design),
+        )
+
+
+class ObjectDefinitionTables(NamedTuple):
+    """
+    All object definitions, indexed by their definition number (see object_set_to_definition), and the handle offsets
+    of the enemies, indexed by their object id.
+    """
 
-        second_index += 1
+    definitions: Tuple[Tuple[ObjectDefinition, ...], ...]
+    enemy_handle_x: Tuple[int, ...]
+    enemy_handle_x2: Tuple[int, ...]
+    enemy_handle_y: Tuple[int, ...]
 
 
 object_set_to_definition = {
@@ -156,22 +163,59 @@ object_set_to_definition = {
 }
 
 
-def load_object_definitions(object_set):
-    global object_metadata
+def _rom_object_files() -> Dict[int, Path]:
+    definition_numbers = sorted(set(object_set_to_definition.values()) - {ENEMY_OBJECT_DEFINITION})
+
+    return {number: data_dir.joinpath(f"romobjs{number}.dat") for number in definition_numbers}
+
 
-    object_definition = object_set_to_definition[object_set]
+def _parse_data_file(lines: List[str]) -> ObjectDefinitionTables:
+    definitions: List[List[ObjectDefinition]] = [[]]
+    enemy_handle_x = []
+    enemy_handle_x2 = []
+    enemy_handle_y = []
+
+    for line in lines:
+        if line.startswith(";"):  # is a comment
+            continue
+
+        if line.rstrip() == "":
+            definitions.append([])
+            continue
+
+        if len(definitions) - 1 == ENEMY_OBJECT_DEFINITION and len(definitions[-1]) < ENEMY_HANDLE_COUNT:
+            if line.find("|") >= 0:
+                x, y, x2 = line.split("|")[1].split(" ")
+            else:
+                x, y, x2 = "0 0 0".split(" ")
+
+            enemy_handle_x.append(int(x))
+            enemy_handle_x2.append(int(x2))
+            enemy_handle_y.append(int(y))
 
-    if object_definition == ENEMY_OBJECT_DEFINITION:
-        return object_metadata[object_definition]
+        definitions[-1].append(ObjectDefinition.from_string(line))
 
-    with open(data_dir.joinpath(f"romobjs{object_definition}.dat"), "rb") as obj_def:
-        data = obj_def.read()
+    return ObjectDefinitionTables(
+        tuple(tuple(definition) for definition in definitions),
+        tuple(enemy_handle_x),
+        tuple(enemy_handle_x2),
+        tuple(enemy_handle_y),
+    )
 
+
+def _apply_rom_objects(
+    definition_number: int, definitions: Tuple[ObjectDefinition, ...], data: bytes
+) -> Tuple[ObjectDefinition, ...]:
+    """
+    Overwrites the block designs of the given definitions, with the ones found in a romobjs*.dat file.
+    """
     assert len(data) > 0
 
+    definitions = list(definitions)
+
     object_count = data[0]
 
-    if object_definition != 0 and object_count < 0xF7:
+    if definition_number != 0 and object_count < 0xF7:
         # first byte did not represent the object_count
         object_count = 0xFF
         position = 0
@@ -181,11 +225,11 @@ def load_object_definitions(object_set):
     for object_index in range(object_count):
         object_design_length = data[position]
 
-        object_metadata[object_definition][object_index].object_design_length = object_design_length
-
         position += 1
 
-        for i in range(object_design_length):
+        block_indexes = []
+
+        for _ in range(object_design_length):
             block_index = data[position]
 
             if block_index == 0xFF:
@@ -193,22 +237,109 @@ def load_object_definitions(object_set):
 
                 position += 3
 
-            object_metadata[object_definition][object_index].rom_object_design[i] = block_index
+            block_indexes.append(block_index)
 
             position += 1
 
+        if object_index >= len(definitions):
+            # the world map file lists more objects, than there are definitions for
+            continue
+
+        rom_object_design = list(definitions[object_index].rom_object_design)
+        rom_object_design[:object_design_length] = block_indexes
+
+        definitions[object_index] = definitions[object_index]._replace(
+            rom_object_design=tuple(rom_object_design), object_design_length=object_design_length
+        )
+
     # read overlay data
-    if position >= len(data):
-        return
+    if position < len(data):
+        for object_index in range(min(object_count, len(definitions))):
+            object_design_length = definitions[object_index].object_design_length
 
-    for object_index in range(object_count):
-        object_design_length = object_metadata[object_definition][object_index].object_design_length
+            object_design2 = tuple(data[position : position + object_design_length])
+
+            definitions[object_index] = definitions[object_index]._replace(object_design2=object_design2)
+
+            position += object_design_length
+
+    return tuple(definitions)
+
+
+def compile_object_definitions() -> ObjectDefinitionTables:
+    with open(data_dir.joinpath("data.dat"), "r") as data_file:
+        tables = _parse_data_file(data_file.readlines())
+
+    definitions = list(tables.definitions)
+
+    for definition_number, rom_object_file in _rom_object_files().items():
+        definitions[definition_number] = _apply_rom_objects(
+            definition_number, definitions[definition_number], rom_object_file.read_bytes()
+        )
+
+    return tables._replace(definitions=tuple(definitions))
+
+
+def _cache_key() -> str:
+    hash_ = hashlib.sha256(str(CACHE_VERSION).encode("ascii"))
 
-        object_metadata[object_definition][object_index].object_design2 = []
+    for file in [data_dir.joinpath("data.dat"), *_rom_object_files().values()]:
+        hash_.update(file.name.encode("utf-8"))
+        hash_.update(file.read_bytes())
+
+    return hash_.hexdigest()
+
+
+def load_object_definition_tables() -> ObjectDefinitionTables:
+    """
+    Returns the compiled object definitions from the cache on disk, if the data files did not change since they were
+    compiled. Otherwise compiles them and tries to update the cache.
+    """
+    cache_file = cache_dir / f"{CACHE_FILE_PREFIX}{_cache_key()}.pickle"
+
+    try:
+        with open(cache_file, "rb") as cache:
+            return pickle.load(cache)
+    except Exception:
+        # missing, unreadable or from an incompatible version; either way, it has to be recompiled
+        pass
+
+    tables = compile_object_definitions()
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        for old_cache_file in cache_dir.glob(f"{CACHE_FILE_PREFIX}*.pickle"):
+            old_cache_file.unlink()
+
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(temp_file, "wb") as cache:
+            pickle.dump(tables, cache, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # not being able to cache only makes the next start slower
+        pass
+
+    return tables
+
+
+@lru_cache(maxsize=None)
+def object_definitions_version() -> str:
+    """
+    Returns a hash of the data files, that the object definitions are compiled from, for caches depending on them.
+    """
+    return _cache_key()
+
+
+@lru_cache(maxsize=None)
+def object_definition_tables() -> ObjectDefinitionTables:
+    """
+    Returns the object definitions, loading them the first time they are needed.
+    """
+    return load_object_definition_tables()
 
-        for i in range(object_design_length):
-            if i <= object_design_length:
-                object_metadata[object_definition][object_index].object_design2.append(data[position])
-                position += 1
 
-    return object_metadata[object_definition]
+def load_object_definitions(object_set: int) -> Tuple[ObjectDefinition, ...]:
+    return object_definition_tables().definitions[object_set_to_definition[object_set]]
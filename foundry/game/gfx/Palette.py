@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 from PySide2.QtGui import QColor
@@ -33,19 +34,27 @@ PaletteGroup = List[bytearray]
 
 palette_file = root_dir.joinpath("data", "Default.pal")
 
-with open(palette_file, "rb") as f:
-    color_data = f.read()
-
-offset = 0x18  # first color position
-
-NESPalette = []
 COLOR_COUNT = 64
 BYTES_IN_COLOR = 3 + 1  # bytes + separator
 
-for i in range(COLOR_COUNT):
-    NESPalette.append([color_data[offset], color_data[offset + 1], color_data[offset + 2]])
 
-    offset += BYTES_IN_COLOR
+@lru_cache(maxsize=None)
+def nes_palette() -> List[List[int]]:
+    """
+    Returns the 64 RGB colors of the NES, read from the palette file the first time it is needed.
+    """
+    color_data = palette_file.read_bytes()
+
+    offset = 0x18  # first color position
+
+    colors = []
+
+    for _ in range(COLOR_COUNT):
+        colors.append([color_data[offset], color_data[offset + 1], color_data[offset + 2]])
+
+        offset += BYTES_IN_COLOR
+
+    return colors
 
 
 def load_palette_group(object_set: int, palette_group_index: int) -> PaletteGroup:
@@ -82,4 +91,4 @@ def bg_color_for_object_set(object_set_number: int, palette_group_index: int) ->
 
 
 def bg_color_for_palette(palette: PaletteGroup):
-    return NESPalette[palette[0][0]]
+    return nes_palette()[palette[0][0]]
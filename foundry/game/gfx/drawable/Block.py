@@ -3,7 +3,7 @@ from PySide2.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.game.File import ROM
 from foundry.game.gfx.GraphicsSet import GraphicsSet
-from foundry.game.gfx.Palette import NESPalette, PaletteGroup
+from foundry.game.gfx.Palette import PaletteGroup, nes_palette
 from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
 from foundry.game.gfx.drawable.Tile import Tile
 from smb3parse.objects.object_set import CLOUDY_GRAPHICS_SET
@@ -35,6 +35,10 @@ class Block:
 
     _block_cache = {}
 
+    # counted for the paint statistics
+    cache_hits = 0
+    cache_misses = 0
+
     def __init__(
         self, block_index: int, palette_group: PaletteGroup, graphics_set: GraphicsSet, tsa_data: bytes, mirrored=False,
     ):
@@ -43,9 +47,9 @@ class Block:
         palette_index = (block_index & 0b1100_0000) >> 6
 
         if graphics_set.number == CLOUDY_GRAPHICS_SET:
-            self.bg_color = QColor(*NESPalette[palette_group[palette_index][2]])
+            self.bg_color = QColor(*nes_palette()[palette_group[palette_index][2]])
         else:
-            self.bg_color = QColor(*NESPalette[palette_group[palette_index][0]])
+            self.bg_color = QColor(*nes_palette()[palette_group[palette_index][0]])
 
         # can't hash list, so turn it into a string instead
         self._block_id = (block_index, str(palette_group), graphics_set.number)
@@ -83,7 +87,11 @@ class Block:
     def draw(self, painter: QPainter, x, y, block_length, selected=False, transparent=False):
         block_attributes = (self._block_id, block_length, selected, transparent)
 
-        if block_attributes not in Block._block_cache:
+        if block_attributes in Block._block_cache:
+            Block.cache_hits += 1
+        else:
+            Block.cache_misses += 1
+
             image = self.image.copy()
 
             if block_length != Block.WIDTH:
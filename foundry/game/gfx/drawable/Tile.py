@@ -1,7 +1,7 @@
 from PySide2.QtGui import QImage
 
 from foundry.game.gfx.GraphicsSet import GraphicsSet
-from foundry.game.gfx.Palette import NESPalette, PaletteGroup
+from foundry.game.gfx.Palette import PaletteGroup, nes_palette
 from foundry.game.gfx.drawable import MASK_COLOR, bit_reverse
 from smb3parse.objects.object_set import CLOUDY_GRAPHICS_SET
 
@@ -47,6 +47,8 @@ class Tile:
         if mirrored:
             self._mirror()
 
+        colors = nes_palette()
+
         for i in range(Tile.PIXEL_COUNT):
             byte_index = i // Tile.HEIGHT
             bit_index = 2 ** (7 - (i % Tile.WIDTH))
@@ -67,7 +69,7 @@ class Tile:
             if color_index == self.background_color_index:
                 self.pixels.extend(MASK_COLOR)
             else:
-                self.pixels.extend(NESPalette[color])
+                self.pixels.extend(colors[color])
 
         assert len(self.pixels) == 3 * Tile.PIXEL_COUNT
 
@@ -1,20 +1,18 @@
 from PySide2.QtCore import QRect, QSize
-from PySide2.QtGui import QColor, QImage, QPainter, Qt
+from PySide2.QtGui import QColor, QImage, QPainter
 
-from foundry.game.ObjectDefinitions import enemy_handle_x, enemy_handle_x2, enemy_handle_y
+from foundry.game.ObjectDefinitions import object_definition_tables
 from foundry.game.ObjectSet import ObjectSet
-from foundry.game.gfx.Palette import NESPalette, PaletteGroup
+from foundry.game.gfx.Palette import PaletteGroup, nes_palette
 from foundry.game.gfx.GraphicsSet import GraphicsSet
-from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
+from foundry.game.gfx.sprites import load_enemy_sprite, masked_enemy_sprite
 from smb3parse.objects.object_set import ENEMY_ITEM_GRAPHICS_SET, ENEMY_ITEM_OBJECT_SET
 
-MASK_COLOR = [0xFF, 0x33, 0xFF]
-
 
 class EnemyObject(ObjectLike):
-    def __init__(self, data, png_data, palette_group: PaletteGroup):
+    def __init__(self, data, palette_group: PaletteGroup):
         super(EnemyObject, self).__init__()
 
         self.is_4byte = False
@@ -22,7 +20,7 @@ class EnemyObject(ObjectLike):
         self.length = 0
 
         self.obj_index = data[0]
-        self.x_position = data[1] - enemy_handle_x2[self.obj_index]
+        self.x_position = data[1] - object_definition_tables().enemy_handle_x2[self.obj_index]
         self.y_position = data[2]
 
         self.domain = 0
@@ -32,9 +30,7 @@ class EnemyObject(ObjectLike):
 
         self.object_set = ObjectSet(ENEMY_ITEM_OBJECT_SET)
 
-        self.bg_color = NESPalette[palette_group[0][0]]
-
-        self.png_data = png_data
+        self.bg_color = nes_palette()[palette_group[0][0]]
 
         self.selected = False
 
@@ -43,8 +39,8 @@ class EnemyObject(ObjectLike):
     @property
     def rect(self):
         return QRect(
-            self.x_position + enemy_handle_x[self.obj_index],
-            self.y_position + enemy_handle_y[self.obj_index],
+            self.x_position + object_definition_tables().enemy_handle_x[self.obj_index],
+            self.y_position + object_definition_tables().enemy_handle_y[self.obj_index],
             self.width,
             self.height,
         )
@@ -60,42 +56,23 @@ class EnemyObject(ObjectLike):
         self._render(obj_def)
 
     def _render(self, obj_def):
-        self.blocks = []
-
-        block_ids = obj_def.object_design
+        self.sprite_indexes = obj_def.object_design
 
-        for block_id in block_ids:
-            x = (block_id % 64) * Block.WIDTH
-            y = (block_id // 64) * Block.WIDTH
-
-            self.blocks.append(self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT)))
+        self.blocks = [load_enemy_sprite(sprite_index) for sprite_index in self.sprite_indexes]
 
     def render(self):
         # nothing to re-render since enemies are just copied over
         pass
 
     def draw(self, painter: QPainter, block_length, _):
-        for i, image in enumerate(self.blocks):
-            x = self.x_position + (i % self.width)
-            y = self.y_position + (i // self.width)
-
-            x_offset = enemy_handle_x[self.obj_index]
-            y_offset = enemy_handle_y[self.obj_index]
+        x_offset = object_definition_tables().enemy_handle_x[self.obj_index]
+        y_offset = object_definition_tables().enemy_handle_y[self.obj_index]
 
-            x += x_offset
-            y += y_offset
+        for i, sprite_index in enumerate(self.sprite_indexes):
+            x = self.x_position + (i % self.width) + x_offset
+            y = self.y_position + (i // self.width) + y_offset
 
-            block = image.copy()
-
-            mask = block.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
-            block.setAlphaChannel(mask)
-
-            # todo better effect
-            if self.selected:
-                apply_selection_overlay(block, mask)
-
-            if block_length != Block.SIDE_LENGTH:
-                block = block.scaled(block_length, block_length)
+            block = masked_enemy_sprite(sprite_index, block_length, self.selected)
 
             painter.drawImage(x * block_length, y * block_length, block)
 
@@ -150,7 +127,9 @@ class EnemyObject(ObjectLike):
         self._setup()
 
     def to_bytes(self):
-        return bytearray([self.obj_index, self.x_position + int(enemy_handle_x2[self.obj_index]), self.y_position])
+        x_position = self.x_position + object_definition_tables().enemy_handle_x2[self.obj_index]
+
+        return bytearray([self.obj_index, x_position, self.y_position])
 
     def as_image(self) -> QImage:
         image = QImage(QSize(self.width * Block.SIDE_LENGTH, self.height * Block.SIDE_LENGTH), QImage.Format_RGBA8888,)
@@ -1,9 +1,4 @@
-from PySide2.QtCore import QRect
-from PySide2.QtGui import QImage
-
-from foundry import data_dir
 from foundry.game.gfx.Palette import load_palette_group
-from foundry.game.gfx.drawable.Block import Block
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 
 
@@ -14,20 +9,11 @@ class EnemyItemFactory:
     definitions: list = []
 
     def __init__(self, object_set: int, palette_index: int):
-        png = QImage(str(data_dir.joinpath("gfx.png")))
-
-        png.convertTo(QImage.Format_RGB888)
-
-        rows_per_object_set = 256 // 64
-
-        y_offset = 12 * rows_per_object_set * Block.HEIGHT
-
-        self.png_data = png.copy(QRect(0, y_offset, png.width(), png.height() - y_offset))
-
+        # the sprites of the enemies come from the shared sprite sheet, so only the palette is needed
         self.palette_group = load_palette_group(object_set, palette_index)
 
     def from_data(self, data, _):
-        return EnemyObject(data, self.png_data, self.palette_group)
+        return EnemyObject(data, self.palette_group)
 
     def from_properties(self, enemy_item_id: int, x: int, y: int):
         data = bytearray(3)
@@ -0,0 +1,246 @@
+"""
+Answers, how far objects extending to the ground can go down, before they hit the top of an object before them.
+
+Since this is the only way, in which objects depend on each other, it also keeps track of which objects every object
+extending to the ground found on its way down, so that after an edit only the objects, that would find something else
+now, need to be rendered again.
+"""
+
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from PySide2.QtCore import QRect
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.LevelObject import LevelObject
+    from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+
+# x, y, width and height of a rect
+_Bounds = Tuple[int, int, int, int]
+
+
+class _GroundSearch(NamedTuple):
+    obj: "LevelObject"
+    columns: range
+    top: int
+    ground: int
+    # the ids and bounds of the objects before it, that start in the searched area
+    found: FrozenSet[Tuple[int, _Bounds]]
+
+
+class GroundMap:
+    """
+    Keeps the rects of level objects, as they were last rendered, by the columns they cover.
+
+    Objects add themselves, whenever they are rendered, in any order. Whether an object comes before another one is
+    only decided, when asking for the ground, so that moving objects around in the list doesn't need an update.
+    """
+
+    def __init__(self, objects: "LevelObjectList"):
+        self.objects = objects
+
+        self._bounds: Dict[int, Tuple["LevelObject", _Bounds]] = {}
+        self._columns: Dict[int, Dict[int, "LevelObject"]] = {}
+
+        # the last ground search of every object, that extends to the ground, and the one of the current render
+        self._ground_searches: Dict[int, _GroundSearch] = {}
+        self._pending_ground_searches: Dict[int, _GroundSearch] = {}
+
+        # objects, that were rendered before the map existed, didn't leave their ground searches in it
+        self._unsearched_objects = bool(objects)
+
+        for obj in objects:
+            self.update(obj)
+
+    def update(self, obj: "LevelObject"):
+        """
+        Takes over the current rect of the object and what it found, when searching for the ground, if it did.
+        """
+        ground_search = self._pending_ground_searches.pop(id(obj), None)
+
+        if ground_search is None:
+            self._ground_searches.pop(id(obj), None)
+        else:
+            self._ground_searches[id(obj)] = ground_search
+
+        self._remove(obj)
+
+        rect = obj.rect
+
+        if rect.isNull():
+            # null rects don't intersect anything, so they can't be hit either
+            return
+
+        bounds = rect.getRect()
+
+        self._bounds[id(obj)] = (obj, bounds)
+
+        for column in _columns_of(bounds[0], bounds[2]):
+            self._columns.setdefault(column, {})[id(obj)] = obj
+
+        if len(self._bounds) > 2 * len(self.objects) + 64:
+            self._forget_removed_objects()
+
+    def first_top_below_row(self, obj: "LevelObject", x: int, y: int, width: int, ground: int) -> Optional[int]:
+        """
+        Returns the first row between y and the ground, in which an object before the given one starts and overlaps
+        the columns from x to x + width. None, if there is none.
+        """
+        found = self._search(obj, _columns_of(x, width), y, ground)
+
+        tops = [bounds[1] for _, bounds in found if QRect(x, bounds[1], width, 1).intersects(QRect(*bounds))]
+
+        return min(tops, default=None)
+
+    def first_top_below_pyramid(self, obj: "LevelObject", x: int, y: int, ground: int) -> Optional[int]:
+        """
+        Like first_top_below_row, but for a pyramid starting in row y, whose bottom row goes from x to x + 2 * its
+        height, in every row it reaches.
+        """
+        # the bottom row is empty at first, which QRect treats as the column before x
+        found = self._search(obj, range(x - 1, x + max(2 * (ground - y), 1)), y, ground)
+
+        tops = []
+
+        for _, bounds in found:
+            top = bounds[1]
+
+            if QRect(x, top, 2 * (top - y), 1).intersects(QRect(*bounds)):
+                tops.append(top)
+
+        return min(tops, default=None)
+
+    def dependencies_of(self, obj: "LevelObject") -> List["LevelObject"]:
+        """
+        Returns the objects before the given one, that it found, when it last searched for the ground.
+        """
+        ground_search = self._ground_searches.get(id(obj))
+
+        if ground_search is None or ground_search.obj is not obj:
+            return []
+
+        return [self._bounds[object_id][0] for object_id, _ in ground_search.found if object_id in self._bounds]
+
+    def objects_extending_to_ground(self) -> List["LevelObject"]:
+        """
+        Returns the objects, that searched for the ground, when they were last rendered, e. g. to remember their rects,
+        before rendering the outdated ones again.
+        """
+        return [ground_search.obj for ground_search in self._ground_searches.values()]
+
+    def render_outdated_objects(self) -> List["LevelObject"]:
+        """
+        Renders the objects, that would find other objects on their way to the ground, than when they were last
+        rendered, e. g. because an object before them was moved, resized, removed or put behind them.
+
+        The objects are checked in order, so that objects depending on objects, that were just rendered again, see
+        their new rects. If the map was made for objects, that were already rendered, all of them are rendered once,
+        since it doesn't know, what they found.
+
+        :return: The objects, that were rendered.
+        """
+        if self._unsearched_objects:
+            self._unsearched_objects = False
+
+            for obj in self.objects:
+                obj.render()
+
+            return list(self.objects)
+
+        rendered_objects = []
+
+        for position, obj in enumerate(self.objects):
+            ground_search = self._ground_searches.get(id(obj))
+
+            if ground_search is not None and ground_search.obj is obj:
+                found = self._found(obj, ground_search.columns, ground_search.top, ground_search.ground, position)
+
+                if found != ground_search.found:
+                    obj.render()
+
+                    rendered_objects.append(obj)
+
+        return rendered_objects
+
+    def _search(self, obj: "LevelObject", columns: range, top: int, ground: int) -> FrozenSet[Tuple[int, _Bounds]]:
+        found = self._found(obj, columns, top, ground)
+
+        self._pending_ground_searches[id(obj)] = _GroundSearch(obj, columns, top, ground, found)
+
+        return found
+
+    def _found(
+        self, obj: "LevelObject", columns: Iterable[int], top: int, ground: int, position: Optional[int] = None
+    ) -> FrozenSet[Tuple[int, _Bounds]]:
+        """
+        Returns the ids and bounds of the objects before the given one, that start between top and ground, and might
+        intersect the given columns.
+        """
+        candidates: Dict[int, "LevelObject"] = {}
+
+        for column in columns:
+            candidates.update(self._columns.get(column, {}))
+
+        candidates.pop(id(obj), None)
+
+        found = [
+            (object_id, self._bounds[object_id][1])
+            for object_id in candidates
+            if top <= self._bounds[object_id][1][1] < ground
+        ]
+
+        if not found:
+            return frozenset()
+
+        if position is None:
+            position = self._position_of(obj)
+
+        return frozenset(
+            (object_id, bounds) for object_id, bounds in found if self._is_before(self._bounds[object_id][0], position)
+        )
+
+    def _position_of(self, obj: "LevelObject") -> int:
+        position = self.objects.position_of(obj)
+
+        if position is None:
+            # the object has not been added yet, so go by the index it is going to be added at
+            return obj.index_in_level
+
+        return position
+
+    def _is_before(self, obj: "LevelObject", position: int) -> bool:
+        other_position = self.objects.position_of(obj)
+
+        return other_position is not None and other_position < position
+
+    def _remove(self, obj: "LevelObject"):
+        _, bounds = self._bounds.pop(id(obj), (None, None))
+
+        if bounds is None:
+            return
+
+        for column in _columns_of(bounds[0], bounds[2]):
+            column_objects = self._columns[column]
+
+            del column_objects[id(obj)]
+
+            if not column_objects:
+                del self._columns[column]
+
+    def _forget_removed_objects(self):
+        for obj, _ in list(self._bounds.values()):
+            if self.objects.position_of(obj) is None:
+                self._remove(obj)
+
+        for object_id, ground_search in list(self._ground_searches.items()):
+            if self.objects.position_of(ground_search.obj) is None:
+                del self._ground_searches[object_id]
+
+
+def _columns_of(x: int, width: int) -> range:
+    """
+    Returns the columns, in which a rect might intersect others. QRect.intersects() also works with rects, that are not
+    normalized, i. e. with a width of 0 or less, which then span the columns from their right to their left edge.
+    """
+    right = x + width - 1
+
+    return range(min(x, right), max(x, right) + 1)
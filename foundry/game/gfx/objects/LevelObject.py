@@ -1,6 +1,7 @@
 from typing import List, Optional, Tuple, Union
 from warnings import warn
 
+import numpy
 from PySide2.QtCore import QRect, QSize
 from PySide2.QtGui import QImage, QPainter
 
@@ -11,11 +12,16 @@ from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import PaletteGroup, bg_color_for_object_set
 from foundry.game.gfx.drawable.Block import Block, get_block
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+from foundry.game.gfx.objects.generators import (
+    BLANK,
+    GROUND,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    block_grid,
+    generate_blocks,
+)
 from foundry.game.gfx.objects.ObjectLike import EXPANDS_BOTH, EXPANDS_HORIZ, EXPANDS_NOT, EXPANDS_VERT, ObjectLike
-from smb3parse.objects.object_set import PLAINS_OBJECT_SET
-
-SKY = 0
-GROUND = 27
 
 ENDING_STR = {
     EndType.UNIFORM: "Uniform",
@@ -42,14 +48,13 @@ ORIENTATION_TO_STR = {
     GeneratorType.ENDING: "Ending",
 }
 
-# todo what is this, exactly?
-ENDING_OBJECT_OFFSET = 0x1C8F9
-
-# not all objects provide a block index for blank block
-BLANK = -1
-
-SCREEN_HEIGHT = 15
-SCREEN_WIDTH = 16
+# objects, that fill the level with their first block, from their position to the ground
+SPECIAL_BACKGROUND_OBJECTS = [
+    "blue background",
+    "starry background",
+    "underground background under this",
+    "sets background to actual background color",
+]
 
 
 def get_minimal_icon_object(
@@ -67,9 +72,7 @@ def get_minimal_icon_object(
 
     level_object.ground_level = 3
 
-    while (
-        any(block not in level_object.rendered_blocks for block in level_object.blocks) and level_object.length < 0x10
-    ):
+    while not numpy.isin(level_object.blocks, level_object.rendered_blocks).all() and level_object.length < 0x10:
         level_object.length += 1
 
         if level_object.is_4byte:
@@ -87,7 +90,7 @@ class LevelObject(ObjectLike):
         object_set: int,
         palette_group: PaletteGroup,
         graphics_set: GraphicsSet,
-        objects_ref: List["LevelObject"],
+        objects_ref: LevelObjectList,
         is_vertical: bool,
         index: int,
         size_minimal: bool = False,
@@ -225,467 +228,30 @@ class LevelObject(ObjectLike):
         self._render()
 
     def _render(self):
-        self.rendered_base_x = base_x = self.x_position
-        self.rendered_base_y = base_y = self.y_position
-
-        self.rendered_width = new_width = self.width
-        self.rendered_height = new_height = self.height
-
-        try:
-            self.index_in_level = self.objects_ref.index(self)
-        except ValueError:
-            # the object has not been added yet, so stick with the one given in the constructor
-            pass
-
-        blocks_to_draw = []
-
-        if self.orientation == GeneratorType.TO_THE_SKY:
-            base_x = self.x_position
-            base_y = SKY
-
-            for _ in range(self.y_position):
-                blocks_to_draw.extend(self.blocks[0 : self.width])
-
-            blocks_to_draw.extend(self.blocks[-self.width :])
-
-            new_height = self.y_position + (self.height - 1)
-
-        elif self.orientation == GeneratorType.DESERT_PIPE_BOX:
-            # segments are the horizontal sections, which are 8 blocks long
-            # two of those are drawn per length bit
-            # rows are the 4 block high rows Mario can walk in
-
-            is_pipe_box_type_b = self.obj_index // 0x10 == 4
-
-            rows_per_box = self.height
-            lines_per_row = 4
-
-            segment_width = self.width
-            segments = (self.length + 1) * 2
-
-            box_height = lines_per_row * rows_per_box
-
-            new_width = segments * segment_width
-            new_height = box_height
-
-            for row_number in range(rows_per_box):
-                for line in range(lines_per_row):
-                    if is_pipe_box_type_b and row_number > 0 and line == 0:
-                        # in pipebox type b we do not repeat the horizontal beams
-                        line += 1
-
-                    start = line * segment_width
-                    stop = start + segment_width
-
-                    for segment_number in range(segments):
-                        blocks_to_draw.extend(self.blocks[start:stop])
-
-            # draw another last row
-            new_height += 1
-
-            if is_pipe_box_type_b:
-                # draw another open row
-                start = segment_width
-            else:
-                # draw the first row again to close the box
-                start = 0
-
-            stop = start + segment_width
-
-            for segment_number in range(segments):
-                blocks_to_draw.extend(self.blocks[start:stop])
-
-            # every line repeats the last block again for some reason
-            for end_of_line in range(len(blocks_to_draw), 0, -new_width):
-                blocks_to_draw.insert(end_of_line, blocks_to_draw[end_of_line - 1])
-
-            new_width += 1
-
-        elif self.orientation in [
-            GeneratorType.DIAG_DOWN_LEFT,
-            GeneratorType.DIAG_DOWN_RIGHT,
-            GeneratorType.DIAG_UP_RIGHT,
-            GeneratorType.DIAG_WEIRD,
-        ]:
-            if self.ending == EndType.UNIFORM:
-                new_height = (self.length + 1) * self.height
-                new_width = (self.length + 1) * self.width
-
-                left = [BLANK]
-                right = [BLANK]
-                slopes = self.blocks
-
-            elif self.ending == EndType.END_ON_TOP_OR_LEFT:
-                new_height = (self.length + 1) * self.height
-                new_width = (self.length + 1) * (self.width - 1)  # without fill block
-
-                if self.orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
-                    fill_block = self.blocks[0:1]
-                    slopes = self.blocks[1:]
-
-                    left = fill_block
-                    right = [BLANK]
-                elif self.orientation == GeneratorType.DIAG_DOWN_LEFT:
-                    fill_block = self.blocks[-1:]
-                    slopes = self.blocks[0:-1]
-
-                    right = fill_block
-                    left = [BLANK]
-
-                else:
-                    fill_block = self.blocks[0:1]
-                    slopes = self.blocks[1:]
-
-                    right = [BLANK]
-                    left = fill_block
-
-            elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                new_height = (self.length + 1) * self.height
-                new_width = (self.length + 1) * (self.width - 1)  # without fill block
-
-                fill_block = self.blocks[-1:]
-                slopes = self.blocks[0:-1]
-
-                left = [BLANK]
-                right = fill_block
-            else:
-                # todo other two ends not used with diagonals?
-                warn(f"{self.description} was not rendered.", RuntimeWarning)
-                self.rendered_blocks = []
-                return
-
-            rows = []
-
-            if self.height > self.width:
-                slope_width = self.width
-            else:
-                slope_width = len(slopes)
-
-            for y in range(new_height):
-                amount_right = (y // self.height) * slope_width
-                amount_left = new_width - slope_width - amount_right
-
-                offset = y % self.height
-
-                rows.append(amount_left * left + slopes[offset : offset + slope_width] + amount_right * right)
-
-            if self.orientation in [GeneratorType.DIAG_UP_RIGHT]:
-                for row in rows:
-                    row.reverse()
-
-            if self.orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
-                if not self.height > self.width:
-                    rows.reverse()
-
-            if self.orientation == GeneratorType.DIAG_DOWN_RIGHT and self.height > self.width:
-                # special case for 60 degree platform wire down right
-                for row in rows:
-                    row.reverse()
-
-            if self.orientation in [GeneratorType.DIAG_UP_RIGHT]:
-                base_y -= new_height - 1
-
-            if self.orientation in [GeneratorType.DIAG_DOWN_LEFT]:
-                base_x -= new_width - slope_width
-
-            for row in rows:
-                blocks_to_draw.extend(row)
-
-        elif self.orientation in [GeneratorType.PYRAMID_TO_GROUND, GeneratorType.PYRAMID_2]:
-            # since pyramids grow horizontally in both directions when extending
-            # we need to check for new ground every time it grows
-
-            base_x += 1  # set the new base_x to the tip of the pyramid
-
-            for y in range(base_y, self.ground_level):
-                new_height = y - base_y
-                new_width = 2 * new_height
-
-                bottom_row = QRect(base_x, y, new_width, 1)
-
-                if any(
-                    [
-                        bottom_row.intersects(obj.get_rect()) and y == obj.get_rect().top()
-                        for obj in self.objects_ref[0 : self.index_in_level]
-                    ]
-                ):
-                    break
-
-            base_x = base_x - (new_width // 2)
-
-            blank = self.blocks[0]
-            left_slope = self.blocks[1]
-            left_fill = self.blocks[2]
-            right_fill = self.blocks[3]
-            right_slope = self.blocks[4]
-
-            for y in range(new_height):
-                blank_blocks = (new_width // 2) - (y + 1)
-                middle_blocks = y  # times two
-
-                blocks_to_draw.extend(blank_blocks * [blank])
-
-                blocks_to_draw.append(left_slope)
-                blocks_to_draw.extend(middle_blocks * [left_fill] + middle_blocks * [right_fill])
-                blocks_to_draw.append(right_slope)
-
-                blocks_to_draw.extend(blank_blocks * [blank])
+        self.rendered_base_x = self.x_position
+        self.rendered_base_y = self.y_position
 
-        elif self.orientation == GeneratorType.ENDING:
-            page_width = 16
-            page_limit = page_width - self.x_position % page_width
+        self.rendered_width = self.width
+        self.rendered_height = self.height
 
-            new_width = page_width + page_limit + 1
-            new_height = (GROUND - 1) - SKY
+        position = self.objects_ref.position_of(self)
 
-            for y in range(SKY, GROUND - 1):
-                blocks_to_draw.append(self.blocks[0])
-                blocks_to_draw.extend([self.blocks[1]] * (new_width - 1))
+        # if the object has not been added yet, stick with the index given in the constructor
+        if position is not None:
+            self.index_in_level = position
 
-            # todo magic number
-            # ending graphics
-            rom_offset = ENDING_OBJECT_OFFSET + self.object_set.get_ending_offset() * 0x60
+        generated_blocks = generate_blocks(self)
 
-            rom = ROM()
-
-            ending_graphic_height = 6
-            floor_height = 1
-
-            y_offset = GROUND - floor_height - ending_graphic_height
-
-            for y in range(ending_graphic_height):
-                for x in range(page_width):
-                    block_index = rom.get_byte(rom_offset + y * page_width + x - 1)
-
-                    block_position = (y_offset + y) * new_width + x + page_limit + 1
-                    blocks_to_draw[block_position] = block_index
-
-            # the ending object is seemingly always 1 block too wide (going into the next screen)
-            for end_of_line in range(len(blocks_to_draw) - 1, 0, -new_width):
-                del blocks_to_draw[end_of_line]
-
-            new_width -= 1
-
-            # Mushroom/Fire flower/Star is categorized as an enemy
-
-        elif self.orientation == GeneratorType.VERTICAL:
-            new_height = self.length + 1
-            new_width = self.width
-
-            if self.ending == EndType.UNIFORM:
-                if self.is_4byte:
-                    # there is one VERTICAL 4-byte object: Vertically oriented X-blocks
-                    # the width is the primary expansion
-                    new_width = (self.obj_index & 0x0F) + 1
-
-                for _ in range(new_height):
-                    for y in range(self.height):
-                        for x in range(new_width):
-                            blocks_to_draw.append(self.blocks[y * self.height + x % self.width])
-
-                # adjust height for giant blocks, so that the rect is correct
-                new_height *= self.height
-
-            elif self.ending == EndType.END_ON_TOP_OR_LEFT:
-                # in case the drawn object is smaller than its actual size
-                for y in range(min(self.height, new_height)):
-                    offset = y * self.width
-                    blocks_to_draw.extend(self.blocks[offset : offset + self.width])
-
-                additional_rows = new_height - self.height
-
-                # assume only the last row needs to repeat
-                # todo true for giant blocks?
-                if additional_rows > 0:
-                    last_row = self.blocks[-self.width :]
-
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(last_row)
-
-            elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                additional_rows = new_height - self.height
-
-                # assume only the first row needs to repeat
-                # todo true for giant blocks?
-                if additional_rows > 0:
-                    last_row = self.blocks[0 : self.width]
-
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(last_row)
-
-                # in case the drawn object is smaller than its actual size
-                for y in range(min(self.height, new_height)):
-                    offset = y * self.width
-                    blocks_to_draw.extend(self.blocks[offset : offset + self.width])
-
-            elif self.ending == EndType.TWO_ENDS:
-                # object exists on ships
-                top_row = self.blocks[0 : self.width]
-                bottom_row = self.blocks[-self.width :]
-
-                blocks_to_draw.extend(top_row)
-
-                additional_rows = new_height - 2
-
-                # repeat second to last row
-                if additional_rows > 0:
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(self.blocks[-2 * self.width : -self.width])
-
-                if new_height > 1:
-                    blocks_to_draw.extend(bottom_row)
-
-        elif self.orientation in [GeneratorType.HORIZONTAL, GeneratorType.HORIZ_TO_GROUND, GeneratorType.HORIZONTAL_2]:
-            new_width = self.length + 1
-
-            if self.orientation == GeneratorType.HORIZ_TO_GROUND:
-                # to the ground only, until it hits something
-                for y in range(base_y, self.ground_level):
-                    bottom_row = QRect(base_x, y, new_width, 1)
-
-                    if any(
-                        [
-                            bottom_row.intersects(obj.get_rect()) and y == obj.get_rect().top()
-                            for obj in self.objects_ref[0 : self.index_in_level]
-                        ]
-                    ):
-                        new_height = y - base_y
-                        break
-                else:
-                    # nothing underneath this object, extend to the ground
-                    new_height = self.ground_level - base_y
-
-                if self.is_single_block:
-                    new_width = self.length
-
-                min_height = min(self.height, 2)
-
-                new_height = max(min_height, new_height)
-
-            elif self.orientation == GeneratorType.HORIZONTAL_2 and self.ending == EndType.TWO_ENDS:
-                # floating platforms seem to just be one shorter for some reason
-                new_width -= 1
-            else:
-                new_height = self.height + self.secondary_length
-
-            if self.ending == EndType.UNIFORM and not self.is_4byte:
-                for y in range(new_height):
-                    offset = (y % self.height) * self.width
-
-                    for _ in range(0, new_width):
-                        blocks_to_draw.extend(self.blocks[offset : offset + self.width])
-
-                # in case of giant blocks
-                new_width *= self.width
-
-            elif self.ending == EndType.UNIFORM and self.is_4byte:
-                # 4 byte objects
-                top = self.blocks[0:1]
-                bottom = self.blocks[-1:]
-
-                new_height = self.height + self.secondary_length
-
-                # ceilings are one shorter than normal
-                if self.height > self.width:
-                    new_height -= 1
-
-                if self.orientation == GeneratorType.HORIZONTAL_2:
-                    for _ in range(0, new_height - 1):
-                        blocks_to_draw.extend(new_width * top)
-
-                    blocks_to_draw.extend(new_width * bottom)
-                else:
-                    blocks_to_draw.extend(new_width * top)
-
-                    for _ in range(1, new_height):
-                        blocks_to_draw.extend(new_width * bottom)
-
-            elif self.ending == EndType.END_ON_TOP_OR_LEFT:
-                for y in range(new_height):
-                    offset = y * self.width
-
-                    blocks_to_draw.append(self.blocks[offset])
-
-                    for x in range(1, new_width):
-                        blocks_to_draw.append(self.blocks[offset + 1])
-
-            elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                for y in range(new_height):
-                    offset = y * self.width
-
-                    for x in range(new_width - 1):
-                        blocks_to_draw.append(self.blocks[offset])
-
-                    blocks_to_draw.append(self.blocks[offset + self.width - 1])
-
-            elif self.ending == EndType.TWO_ENDS:
-                if self.orientation == GeneratorType.HORIZONTAL and self.is_4byte:
-                    # flat ground objects have an artificial limit of 2 lines
-                    if (
-                        self.object_set.number == PLAINS_OBJECT_SET
-                        and self.domain == 0
-                        and self.obj_index in range(0xC0, 0xE0)
-                    ):
-                        self.height = new_height = min(2, self.secondary_length + 1)
-                    else:
-                        new_height = self.secondary_length + 1
-
-                if self.width > len(self.blocks):
-                    raise ValueError(f"{self} does not provide enough blocks to fill a row.")
-                else:
-                    start = 0
-                    end = self.width
-
-                for y in range(self.height):
-                    new_start = y * self.width
-                    new_end = (y + 1) * self.width
-
-                    if new_end > len(self.blocks):
-                        # repeat the last line of blocks to fill the object
-                        pass
-                    else:
-                        start = new_start
-                        end = new_end
-
-                    left, *middle, right = self.blocks[start:end]
-
-                    blocks_to_draw.append(left)
-                    blocks_to_draw.extend(middle * (new_width - 2))
-                    blocks_to_draw.append(right)
-
-                if not len(blocks_to_draw) % self.height == 0:
-                    warn(f"Blocks to draw are not divisible by height. {self}", RuntimeWarning)
-
-                new_width = int(len(blocks_to_draw) / self.height)
-
-                top_row = blocks_to_draw[0:new_width]
-                middle_blocks = blocks_to_draw[new_width : new_width * 2]
-                bottom_row = blocks_to_draw[-new_width:]
-
-                blocks_to_draw = top_row
-
-                for y in range(1, new_height - 1):
-                    blocks_to_draw.extend(middle_blocks)
-
-                if new_height > 1:
-                    blocks_to_draw.extend(bottom_row)
-        else:
-            if not self.orientation == GeneratorType.SINGLE_BLOCK_OBJECT:
-                warn(f"Didn't render {self.description}", RuntimeWarning)
-                # breakpoint()
-
-            if self.description.lower() == "black boss room background":
-                new_width = SCREEN_WIDTH
-                new_height = SCREEN_HEIGHT
-
-                base_x = self.x_position // SCREEN_WIDTH * SCREEN_WIDTH
-                base_y = 0
+        if generated_blocks is None:
+            self.rendered_blocks = []
+            self.rendered_grid = block_grid([], self.rendered_width)
+            return
 
-                blocks_to_draw = SCREEN_WIDTH * SCREEN_HEIGHT * [self.blocks[0]]
+        base_x, base_y, new_width, new_height, blocks_to_draw = generated_blocks
 
         # for not yet implemented objects and single block objects
-        if blocks_to_draw:
-            self.rendered_blocks = blocks_to_draw
+        if blocks_to_draw.size:
+            self.rendered_blocks = blocks_to_draw.tolist()
         else:
             self.rendered_blocks = self.blocks
 
@@ -711,17 +277,19 @@ class LevelObject(ObjectLike):
 
             self.rendered_width = 1
 
+        self.rendered_grid = block_grid(self.rendered_blocks, self.rendered_width)
+
         self.rect = QRect(self.rendered_base_x, self.rendered_base_y, self.rendered_width, self.rendered_height)
 
-    def draw(self, painter: QPainter, block_length, transparent):
-        for index, block_index in enumerate(self.rendered_blocks):
-            if block_index == BLANK:
-                continue
+        self.objects_ref.ground_map.update(self)
 
-            x = self.rendered_base_x + index % self.rendered_width
-            y = self.rendered_base_y + index // self.rendered_width
+    def draw(self, painter: QPainter, block_length, transparent):
+        for y, x in numpy.argwhere(self.rendered_grid != BLANK).tolist():
+            block_index = int(self.rendered_grid[y, x])
 
-            self._draw_block(painter, block_index, x, y, block_length, transparent)
+            self._draw_block(
+                painter, block_index, self.rendered_base_x + x, self.rendered_base_y + y, block_length, transparent
+            )
 
     def _draw_block(self, painter: QPainter, block_index, x, y, block_length, transparent):
         if block_index not in self.block_cache:
@@ -991,11 +559,5 @@ class LevelObject(ObjectLike):
     def __repr__(self) -> str:
         return f"LevelObject {self.description} at {self.x_position}, {self.y_position}"
 
-    def __eq__(self, other):
-        if not isinstance(other, LevelObject):
-            return False
-        else:
-            return self.to_bytes() == other.to_bytes()
-
     def __lt__(self, other):
         return self.index_in_level < other.index_in_level
@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional
 
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject, SCREEN_HEIGHT, SCREEN_WIDTH
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
 from foundry.game.gfx.Palette import load_palette_group
 from foundry.game.gfx.GraphicsSet import GraphicsSet
 
@@ -19,7 +20,7 @@ class LevelObjectFactory:
         object_set: int,
         graphic_set: int,
         palette_group_index: int,
-        objects_ref: List[LevelObject],
+        objects_ref: LevelObjectList,
         vertical_level: bool,
         size_minimal: bool = False,
     ):
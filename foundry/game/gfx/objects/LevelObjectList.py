@@ -0,0 +1,108 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from foundry.game.gfx.objects.GroundMap import GroundMap
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.LevelObject import LevelObject
+
+
+class LevelObjectList(list):
+    """
+    The level objects, that objects are rendered against, e. g. those of a level, in the order they are drawn in.
+
+    Objects extending to the ground only stop at objects before them, so every time they are rendered, they need to know
+    which objects come before them. The list keeps the position of every object in it for that, so that it doesn't have
+    to be searched. Appending keeps the positions up to date, any other change makes them be found again, when they are
+    next asked for.
+
+    The objects find the ground using the ground map of the list, which lives as long as the list does.
+    """
+
+    def __init__(self, objects: Iterable["LevelObject"] = ()):
+        super(LevelObjectList, self).__init__(objects)
+
+        # by the id of the objects; None, when they have to be found again
+        self._positions: Optional[Dict[int, int]] = None
+
+        self._ground_map: Optional[GroundMap] = None
+
+    @property
+    def ground_map(self) -> GroundMap:
+        if self._ground_map is None:
+            self._ground_map = GroundMap(self)
+
+        return self._ground_map
+
+    def position_of(self, obj: "LevelObject") -> Optional[int]:
+        """
+        Returns the index of the given object in the list, or None, if it is not in it.
+        """
+        if self._positions is None:
+            self._positions = {id(other): index for index, other in enumerate(self)}
+
+        position = self._positions.get(id(obj))
+
+        if position is None or self[position] is not obj:
+            return None
+
+        return position
+
+    def append(self, obj: "LevelObject"):
+        super(LevelObjectList, self).append(obj)
+
+        if self._positions is not None:
+            self._positions[id(obj)] = len(self) - 1
+
+    def extend(self, objects: Iterable["LevelObject"]):
+        for obj in list(objects):
+            self.append(obj)
+
+    def __iadd__(self, objects: Iterable["LevelObject"]):
+        self.extend(objects)
+
+        return self
+
+    def insert(self, index: int, obj: "LevelObject"):
+        if index >= len(self):
+            self.append(obj)
+        else:
+            super(LevelObjectList, self).insert(index, obj)
+
+            self._positions = None
+
+    def remove(self, obj: "LevelObject"):
+        super(LevelObjectList, self).remove(obj)
+
+        self._positions = None
+
+    def pop(self, index: int = -1) -> "LevelObject":
+        self._positions = None
+
+        return super(LevelObjectList, self).pop(index)
+
+    def clear(self):
+        super(LevelObjectList, self).clear()
+
+        self._positions = {}
+
+        self._ground_map = None
+
+    def sort(self, *args, **kwargs):
+        super(LevelObjectList, self).sort(*args, **kwargs)
+
+        self._positions = None
+
+    def reverse(self):
+        super(LevelObjectList, self).reverse()
+
+        self._positions = None
+
+    def __setitem__(self, index, value):
+        super(LevelObjectList, self).__setitem__(index, value)
+
+        self._positions = None
+
+    def __delitem__(self, index):
+        super(LevelObjectList, self).__delitem__(index)
+
+        self._positions = None
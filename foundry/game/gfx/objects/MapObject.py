@@ -1,3 +1,5 @@
+from typing import Callable, Optional
+
 from PySide2.QtCore import QRect
 
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
@@ -131,7 +133,7 @@ map_object_names = {
 
 
 class MapObject(ObjectLike):
-    def __init__(self, block, x, y):
+    def __init__(self, block, x, y, on_change: Optional[Callable[[], None]] = None):
         self.x_position = x
         self.y_position = y
 
@@ -148,6 +150,9 @@ class MapObject(ObjectLike):
 
         self.selected = False
 
+        # called, whenever the object changes how the map looks, e. g. so the world map can draw itself again
+        self.on_change = on_change
+
     def set_position(self, x, y):
         x = int(x)
         y = int(y)
@@ -157,6 +162,9 @@ class MapObject(ObjectLike):
         self.x_position = x
         self.y_position = y
 
+        if self.on_change is not None:
+            self.on_change()
+
     def get_position(self):
         return self.x_position, self.y_position
 
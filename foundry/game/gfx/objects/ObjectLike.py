@@ -75,6 +75,15 @@ class ObjectLike(abc.ABC):
     def to_bytes(self):
         pass
 
+    def has_same_data(self, other) -> bool:
+        """
+        Whether the other object would be saved the same way as this one.
+
+        Objects themselves only compare equal to themselves, so that looking them up in the lists of a level, e. g.
+        to remove or select them, doesn't need to serialize them.
+        """
+        return type(other) is type(self) and self.to_bytes() == other.to_bytes()
+
     def expands(self):
         return EXPANDS_NOT
 
@@ -0,0 +1,595 @@
+"""
+Generates the blocks of level objects, depending on their generator type.
+
+Every generator type has a function in here, that is looked up in the GENERATORS table. It returns the blocks of the
+object as a NumPy array in row major order, together with the size and position the object claims to have. Repeated
+rows and columns are tiled, sliced and concatenated as arrays, so stretching an object to its maximum length doesn't
+append every single block on its own.
+
+Mostly the blocks form a proper grid, i. e. width times height blocks, but some objects, especially ones not
+understood yet, claim a size, that doesn't fit their blocks. So the blocks are kept as they are generated and turned
+into a grid, using block_grid(), where they are drawn.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Sequence
+from warnings import warn
+
+import numpy
+
+from foundry.game.File import ROM
+from foundry.game.ObjectDefinitions import EndType, GeneratorType
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.LevelObject import LevelObject
+
+SKY = 0
+GROUND = 27
+
+# todo what is this, exactly?
+ENDING_OBJECT_OFFSET = 0x1C8F9
+
+# not all objects provide a block index for blank block
+BLANK = -1
+
+SCREEN_HEIGHT = 15
+SCREEN_WIDTH = 16
+
+# block indexes above 0xFF are offsets into the ROM, so a byte is not enough
+BLOCK_DTYPE = numpy.int64
+
+
+class GeneratedBlocks(NamedTuple):
+    base_x: int
+    base_y: int
+    width: int
+    height: int
+    # the blocks in row major order; usually, but not necessarily, width times height many
+    blocks: numpy.ndarray
+
+
+Generator = Callable[["LevelObject"], Optional[GeneratedBlocks]]
+
+GENERATORS: Dict[GeneratorType, Generator] = {}
+
+
+def generator(*generator_types: GeneratorType):
+    """
+    Registers the decorated function as the generator for the given generator types.
+    """
+
+    def register(function: Generator) -> Generator:
+        for generator_type in generator_types:
+            GENERATORS[generator_type] = function
+
+        return function
+
+    return register
+
+
+def generate_blocks(level_object: "LevelObject") -> Optional[GeneratedBlocks]:
+    """
+    Generates the blocks of the given object, using the generator of its generator type.
+
+    :return: None, if the object could not be generated at all.
+    """
+    return GENERATORS.get(level_object.orientation, _generate_single_block)(level_object)
+
+
+def block_grid(blocks: Sequence[int], width: int) -> numpy.ndarray:
+    """
+    Returns the blocks as a (height, width) array, filling the last row up with blank blocks, if necessary.
+    """
+    blocks = numpy.asarray(blocks, dtype=BLOCK_DTYPE)
+
+    if width <= 0:
+        return numpy.empty((0, 0), dtype=BLOCK_DTYPE)
+
+    rows = -(-blocks.size // width)
+
+    grid = numpy.full(rows * width, BLANK, dtype=BLOCK_DTYPE)
+    grid[: blocks.size] = blocks
+
+    return grid.reshape(rows, width)
+
+
+def _blocks_of(level_object: "LevelObject") -> numpy.ndarray:
+    return numpy.array(level_object.blocks, dtype=BLOCK_DTYPE)
+
+
+def _repeat(blocks: numpy.ndarray, times: int) -> numpy.ndarray:
+    # like multiplying a list, repeating something a negative amount of times gives nothing
+    return numpy.tile(blocks, max(times, 0))
+
+
+def _concatenate(parts: List[numpy.ndarray]) -> numpy.ndarray:
+    return numpy.concatenate(parts) if parts else numpy.empty(0, dtype=BLOCK_DTYPE)
+
+
+@generator(GeneratorType.TO_THE_SKY)
+def _generate_to_the_sky(level_object: "LevelObject") -> GeneratedBlocks:
+    blocks = _blocks_of(level_object)
+    width = level_object.width
+
+    generated_blocks = _concatenate([_repeat(blocks[0:width], level_object.y_position), blocks[-width:]])
+
+    new_height = level_object.y_position + (level_object.height - 1)
+
+    return GeneratedBlocks(level_object.x_position, SKY, width, new_height, generated_blocks)
+
+
+@generator(GeneratorType.DESERT_PIPE_BOX)
+def _generate_desert_pipe_box(level_object: "LevelObject") -> GeneratedBlocks:
+    # segments are the horizontal sections, which are 8 blocks long
+    # two of those are drawn per length bit
+    # rows are the 4 block high rows Mario can walk in
+    blocks = _blocks_of(level_object)
+
+    is_pipe_box_type_b = level_object.obj_index // 0x10 == 4
+
+    rows_per_box = level_object.height
+    lines_per_row = 4
+
+    segment_width = level_object.width
+    segments = (level_object.length + 1) * 2
+
+    box_height = lines_per_row * rows_per_box
+
+    new_width = segments * segment_width
+    new_height = box_height
+
+    lines = []
+
+    for row_number in range(rows_per_box):
+        for line in range(lines_per_row):
+            if is_pipe_box_type_b and row_number > 0 and line == 0:
+                # in pipebox type b we do not repeat the horizontal beams
+                line += 1
+
+            lines.append(line)
+
+    # draw another last row
+    new_height += 1
+
+    if is_pipe_box_type_b:
+        # draw another open row
+        lines.append(1)
+    else:
+        # draw the first row again to close the box
+        lines.append(0)
+
+    generated_blocks = _concatenate(
+        [numpy.tile(blocks[line * segment_width : (line + 1) * segment_width], segments) for line in lines]
+    )
+
+    # every line repeats the last block again for some reason
+    ends_of_lines = numpy.array(range(generated_blocks.size, 0, -new_width), dtype=BLOCK_DTYPE)
+
+    generated_blocks = numpy.insert(generated_blocks, ends_of_lines, generated_blocks[ends_of_lines - 1])
+
+    new_width += 1
+
+    return GeneratedBlocks(level_object.x_position, level_object.y_position, new_width, new_height, generated_blocks)
+
+
+@generator(
+    GeneratorType.DIAG_DOWN_LEFT, GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT, GeneratorType.DIAG_WEIRD
+)
+def _generate_diagonal(level_object: "LevelObject") -> Optional[GeneratedBlocks]:
+    blocks = _blocks_of(level_object)
+    orientation = level_object.orientation
+
+    base_x = level_object.x_position
+    base_y = level_object.y_position
+
+    blank = numpy.array([BLANK], dtype=BLOCK_DTYPE)
+
+    new_height = (level_object.length + 1) * level_object.height
+
+    if level_object.ending == EndType.UNIFORM:
+        new_width = (level_object.length + 1) * level_object.width
+
+        left = blank
+        right = blank
+        slopes = blocks
+
+    elif level_object.ending == EndType.END_ON_TOP_OR_LEFT:
+        new_width = (level_object.length + 1) * (level_object.width - 1)  # without fill block
+
+        if orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
+            fill_block = blocks[0:1]
+            slopes = blocks[1:]
+
+            left = fill_block
+            right = blank
+        elif orientation == GeneratorType.DIAG_DOWN_LEFT:
+            fill_block = blocks[-1:]
+            slopes = blocks[0:-1]
+
+            right = fill_block
+            left = blank
+
+        else:
+            fill_block = blocks[0:1]
+            slopes = blocks[1:]
+
+            right = blank
+            left = fill_block
+
+    elif level_object.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
+        new_width = (level_object.length + 1) * (level_object.width - 1)  # without fill block
+
+        fill_block = blocks[-1:]
+        slopes = blocks[0:-1]
+
+        left = blank
+        right = fill_block
+    else:
+        # todo other two ends not used with diagonals?
+        warn(f"{level_object.description} was not rendered.", RuntimeWarning)
+        return None
+
+    if level_object.height > level_object.width:
+        slope_width = level_object.width
+    else:
+        slope_width = len(slopes)
+
+    rows = []
+
+    for y in range(new_height):
+        amount_right = (y // level_object.height) * slope_width
+        amount_left = new_width - slope_width - amount_right
+
+        offset = y % level_object.height
+
+        rows.append(
+            _concatenate(
+                [_repeat(left, amount_left), slopes[offset : offset + slope_width], _repeat(right, amount_right)]
+            )
+        )
+
+    if orientation in [GeneratorType.DIAG_UP_RIGHT]:
+        rows = [row[::-1] for row in rows]
+
+    if orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
+        if not level_object.height > level_object.width:
+            rows.reverse()
+
+    if orientation == GeneratorType.DIAG_DOWN_RIGHT and level_object.height > level_object.width:
+        # special case for 60 degree platform wire down right
+        rows = [row[::-1] for row in rows]
+
+    if orientation in [GeneratorType.DIAG_UP_RIGHT]:
+        base_y -= new_height - 1
+
+    if orientation in [GeneratorType.DIAG_DOWN_LEFT]:
+        base_x -= new_width - slope_width
+
+    return GeneratedBlocks(base_x, base_y, new_width, new_height, _concatenate(rows))
+
+
+@generator(GeneratorType.PYRAMID_TO_GROUND, GeneratorType.PYRAMID_2)
+def _generate_pyramid(level_object: "LevelObject") -> GeneratedBlocks:
+    # since pyramids grow horizontally in both directions when extending
+    # we need to check for new ground every time it grows
+    base_x = level_object.x_position + 1  # set the new base_x to the tip of the pyramid
+    base_y = level_object.y_position
+
+    new_width = level_object.width
+    new_height = level_object.height
+
+    if base_y < level_object.ground_level:
+        # the first row, in which the bottom of the pyramid touches the top of an object before it
+        hit_y = level_object.objects_ref.ground_map.first_top_below_pyramid(
+            level_object, base_x, base_y, level_object.ground_level
+        )
+
+        if hit_y is None:
+            hit_y = level_object.ground_level - 1
+
+        new_height = hit_y - base_y
+        new_width = 2 * new_height
+
+    base_x = base_x - (new_width // 2)
+
+    blank, left_slope, left_fill, right_fill, right_slope = level_object.blocks[0:5]
+
+    if new_width == 2 * new_height:
+        # every row is as wide as the pyramid; blanks on the outside, slopes on the edge and fill blocks inside
+        rows, columns = numpy.indices((new_height, new_width // 2))
+
+        # negative outside of the slope of the left half, 0 on it and positive inside of the pyramid
+        inside_left = columns - (new_height - 1 - rows)
+        inside_right = inside_left[:, ::-1]
+
+        left_half = numpy.where(inside_left < 0, blank, numpy.where(inside_left == 0, left_slope, left_fill))
+        right_half = numpy.where(inside_right < 0, blank, numpy.where(inside_right == 0, right_slope, right_fill))
+
+        generated_blocks = numpy.hstack([left_half, right_half]).astype(BLOCK_DTYPE).ravel()
+    else:
+        rows = []
+
+        for y in range(new_height):
+            blank_blocks = numpy.full(max((new_width // 2) - (y + 1), 0), blank, dtype=BLOCK_DTYPE)
+
+            rows.extend(
+                [
+                    blank_blocks,
+                    numpy.array([left_slope], dtype=BLOCK_DTYPE),
+                    numpy.full(y, left_fill, dtype=BLOCK_DTYPE),
+                    numpy.full(y, right_fill, dtype=BLOCK_DTYPE),
+                    numpy.array([right_slope], dtype=BLOCK_DTYPE),
+                    blank_blocks,
+                ]
+            )
+
+        generated_blocks = _concatenate(rows)
+
+    return GeneratedBlocks(base_x, base_y, new_width, new_height, generated_blocks)
+
+
+@generator(GeneratorType.ENDING)
+def _generate_ending(level_object: "LevelObject") -> GeneratedBlocks:
+    page_width = 16
+    page_limit = page_width - level_object.x_position % page_width
+
+    new_width = page_width + page_limit + 1
+    new_height = (GROUND - 1) - SKY
+
+    grid = numpy.full((new_height, new_width), level_object.blocks[1], dtype=BLOCK_DTYPE)
+    grid[:, 0] = level_object.blocks[0]
+
+    # todo magic number
+    # ending graphics
+    rom_offset = ENDING_OBJECT_OFFSET + level_object.object_set.get_ending_offset() * 0x60
+
+    rom = ROM()
+
+    ending_graphic_height = 6
+    floor_height = 1
+
+    y_offset = GROUND - floor_height - ending_graphic_height
+
+    ending_graphic = [rom.get_byte(rom_offset + index - 1) for index in range(ending_graphic_height * page_width)]
+
+    grid[y_offset : y_offset + ending_graphic_height, page_limit + 1 : page_limit + 1 + page_width] = numpy.reshape(
+        ending_graphic, (ending_graphic_height, page_width)
+    )
+
+    # the ending object is seemingly always 1 block too wide (going into the next screen)
+    new_width -= 1
+
+    # Mushroom/Fire flower/Star is categorized as an enemy
+
+    return GeneratedBlocks(
+        level_object.x_position,
+        level_object.y_position,
+        new_width,
+        new_height,
+        numpy.ascontiguousarray(grid[:, :new_width]).ravel(),
+    )
+
+
+@generator(GeneratorType.VERTICAL)
+def _generate_vertical(level_object: "LevelObject") -> GeneratedBlocks:
+    blocks = _blocks_of(level_object)
+
+    width = level_object.width
+    height = level_object.height
+
+    new_height = level_object.length + 1
+    new_width = width
+
+    if level_object.ending == EndType.UNIFORM:
+        if level_object.is_4byte:
+            # there is one VERTICAL 4-byte object: Vertically oriented X-blocks
+            # the width is the primary expansion
+            new_width = (level_object.obj_index & 0x0F) + 1
+
+        pattern = blocks[numpy.arange(height)[:, None] * height + numpy.arange(new_width) % width]
+
+        generated_blocks = numpy.tile(pattern, (new_height, 1)).ravel()
+
+        # adjust height for giant blocks, so that the rect is correct
+        new_height *= height
+
+    elif level_object.ending == EndType.END_ON_TOP_OR_LEFT:
+        # in case the drawn object is smaller than its actual size
+        drawn_rows = blocks[0 : min(height, new_height) * width]
+
+        # assume only the last row needs to repeat
+        # todo true for giant blocks?
+        additional_rows = new_height - height
+
+        generated_blocks = _concatenate([drawn_rows, _repeat(blocks[-width:], additional_rows)])
+
+    elif level_object.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
+        # assume only the first row needs to repeat
+        # todo true for giant blocks?
+        additional_rows = new_height - height
+
+        # in case the drawn object is smaller than its actual size
+        drawn_rows = blocks[0 : min(height, new_height) * width]
+
+        generated_blocks = _concatenate([_repeat(blocks[0:width], additional_rows), drawn_rows])
+
+    else:
+        # object exists on ships
+        top_row = blocks[0:width]
+        bottom_row = blocks[-width:]
+
+        # repeat second to last row
+        additional_rows = new_height - 2
+
+        generated_blocks = _concatenate([top_row, _repeat(blocks[-2 * width : -width], additional_rows)])
+
+        if new_height > 1:
+            generated_blocks = _concatenate([generated_blocks, bottom_row])
+
+    return GeneratedBlocks(level_object.x_position, level_object.y_position, new_width, new_height, generated_blocks)
+
+
+@generator(GeneratorType.HORIZONTAL, GeneratorType.HORIZ_TO_GROUND, GeneratorType.HORIZONTAL_2)
+def _generate_horizontal(level_object: "LevelObject") -> GeneratedBlocks:
+    blocks = _blocks_of(level_object)
+    orientation = level_object.orientation
+
+    base_x = level_object.x_position
+    base_y = level_object.y_position
+
+    width = level_object.width
+
+    new_width = level_object.length + 1
+    new_height = level_object.height
+
+    if orientation == GeneratorType.HORIZ_TO_GROUND:
+        # to the ground only, until it hits something
+        hit_y = level_object.objects_ref.ground_map.first_top_below_row(
+            level_object, base_x, base_y, new_width, level_object.ground_level
+        )
+
+        if hit_y is not None:
+            new_height = hit_y - base_y
+        else:
+            # nothing underneath this object, extend to the ground
+            new_height = level_object.ground_level - base_y
+
+        if level_object.is_single_block:
+            new_width = level_object.length
+
+        min_height = min(level_object.height, 2)
+
+        new_height = max(min_height, new_height)
+
+    elif orientation == GeneratorType.HORIZONTAL_2 and level_object.ending == EndType.TWO_ENDS:
+        # floating platforms seem to just be one shorter for some reason
+        new_width -= 1
+    else:
+        new_height = level_object.height + level_object.secondary_length
+
+    if level_object.ending == EndType.UNIFORM and not level_object.is_4byte:
+        rows = [
+            _repeat(blocks[offset : offset + width], new_width)
+            for offset in (numpy.arange(max(new_height, 0)) % level_object.height) * width
+        ]
+
+        generated_blocks = _concatenate(rows)
+
+        # in case of giant blocks
+        new_width *= width
+
+    elif level_object.ending == EndType.UNIFORM and level_object.is_4byte:
+        # 4 byte objects
+        top = blocks[0:1]
+        bottom = blocks[-1:]
+
+        new_height = level_object.height + level_object.secondary_length
+
+        # ceilings are one shorter than normal
+        if level_object.height > width:
+            new_height -= 1
+
+        if orientation == GeneratorType.HORIZONTAL_2:
+            generated_blocks = _concatenate(
+                [_repeat(_repeat(top, new_width), new_height - 1), _repeat(bottom, new_width)]
+            )
+        else:
+            generated_blocks = _concatenate(
+                [_repeat(top, new_width), _repeat(_repeat(bottom, new_width), new_height - 1)]
+            )
+
+    elif level_object.ending in [EndType.END_ON_TOP_OR_LEFT, EndType.END_ON_BOTTOM_OR_RIGHT]:
+        row_offsets = numpy.arange(max(new_height, 0)) * width
+
+        if level_object.ending == EndType.END_ON_TOP_OR_LEFT:
+            end_blocks = blocks[row_offsets]
+            fill_offsets = row_offsets + 1
+        else:
+            end_blocks = blocks[row_offsets + width - 1]
+            fill_offsets = row_offsets
+
+        if new_width > 1:
+            fill_blocks = numpy.repeat(blocks[fill_offsets][:, None], new_width - 1, axis=1)
+        else:
+            fill_blocks = numpy.empty((row_offsets.size, 0), dtype=BLOCK_DTYPE)
+
+        if level_object.ending == EndType.END_ON_TOP_OR_LEFT:
+            generated_blocks = numpy.hstack([end_blocks[:, None], fill_blocks]).ravel()
+        else:
+            generated_blocks = numpy.hstack([fill_blocks, end_blocks[:, None]]).ravel()
+
+    else:
+        if orientation == GeneratorType.HORIZONTAL and level_object.is_4byte:
+            # flat ground objects have an artificial limit of 2 lines
+            if (
+                level_object.object_set.number == PLAINS_OBJECT_SET
+                and level_object.domain == 0
+                and level_object.obj_index in range(0xC0, 0xE0)
+            ):
+                level_object.height = new_height = min(2, level_object.secondary_length + 1)
+            else:
+                new_height = level_object.secondary_length + 1
+
+        if width > len(blocks):
+            raise ValueError(f"{level_object} does not provide enough blocks to fill a row.")
+        else:
+            start = 0
+            end = width
+
+        rows = []
+
+        for y in range(level_object.height):
+            new_start = y * width
+            new_end = (y + 1) * width
+
+            if new_end > len(blocks):
+                # repeat the last line of blocks to fill the object
+                pass
+            else:
+                start = new_start
+                end = new_end
+
+            left, *middle, right = blocks[start:end]
+
+            rows.append(_concatenate([[left], _repeat(numpy.array(middle, dtype=BLOCK_DTYPE), new_width - 2), [right]]))
+
+        generated_blocks = _concatenate(rows)
+
+        if not generated_blocks.size % level_object.height == 0:
+            warn(f"Blocks to draw are not divisible by height. {level_object}", RuntimeWarning)
+
+        new_width = int(generated_blocks.size / level_object.height)
+
+        top_row = generated_blocks[0:new_width]
+        middle_blocks = generated_blocks[new_width : new_width * 2]
+        bottom_row = generated_blocks[-new_width:]
+
+        generated_blocks = _concatenate([top_row, _repeat(middle_blocks, new_height - 2)])
+
+        if new_height > 1:
+            generated_blocks = _concatenate([generated_blocks, bottom_row])
+
+    return GeneratedBlocks(base_x, base_y, new_width, new_height, generated_blocks)
+
+
+@generator(GeneratorType.SINGLE_BLOCK_OBJECT)
+def _generate_single_block(level_object: "LevelObject") -> GeneratedBlocks:
+    # also used for objects, whose generator type is not implemented
+    if not level_object.orientation == GeneratorType.SINGLE_BLOCK_OBJECT:
+        warn(f"Didn't render {level_object.description}", RuntimeWarning)
+
+    if level_object.description.lower() == "black boss room background":
+        blocks = numpy.full(SCREEN_WIDTH * SCREEN_HEIGHT, level_object.blocks[0], dtype=BLOCK_DTYPE)
+
+        base_x = level_object.x_position // SCREEN_WIDTH * SCREEN_WIDTH
+
+        return GeneratedBlocks(base_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT, blocks)
+
+    # no blocks means, that the blocks of the object are drawn as they are
+    return GeneratedBlocks(
+        level_object.x_position,
+        level_object.y_position,
+        level_object.width,
+        level_object.height,
+        numpy.empty(0, dtype=BLOCK_DTYPE),
+    )
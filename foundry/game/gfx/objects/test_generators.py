@@ -0,0 +1,37 @@
+import numpy
+import pytest
+
+from foundry.game.ObjectDefinitions import GeneratorType
+from foundry.game.gfx.objects.generators import BLANK, GENERATORS, block_grid
+
+
+@pytest.mark.parametrize("generator_type", [generator_type for generator_type in GeneratorType])
+def test_generator_registered(generator_type):
+    # GIVEN a generator type, that is not just a placeholder
+    if generator_type == GeneratorType.CENTERED:
+        pytest.skip("Centered objects are not implemented.")
+
+    # THEN there is a generator for it
+    assert generator_type in GENERATORS
+
+
+def test_block_grid():
+    # GIVEN blocks, that fill 2 rows of 3 blocks
+    blocks = [1, 2, 3, 4, 5, 6]
+
+    # WHEN turning them into a grid
+    grid = block_grid(blocks, 3)
+
+    # THEN the rows are in order
+    assert grid.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_block_grid_fills_last_row():
+    # GIVEN blocks, that do not fill the last row
+    blocks = numpy.array([1, 2, 3, 4])
+
+    # WHEN turning them into a grid
+    grid = block_grid(blocks, 3)
+
+    # THEN the missing blocks are blank, so they are not drawn
+    assert grid.tolist() == [[1, 2, 3], [4, BLANK, BLANK]]
@@ -0,0 +1,230 @@
+import random
+
+import pytest
+from PySide2.QtCore import QRect
+
+from foundry.game.gfx.objects.GroundMap import GroundMap
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+
+GROUND = 27
+
+
+class _FakeObject:
+    def __init__(self, objects, rect: QRect):
+        self.objects = objects
+        self.rect = rect
+
+    @property
+    def index_in_level(self):
+        # objects are rendered, before they are added to the level
+        return self.objects.index(self) if self in self.objects else len(self.objects)
+
+    def get_rect(self):
+        return self.rect
+
+    def render(self):
+        self.objects.ground_map.update(self)
+
+
+def _first_top_below_row(obj, x, y, width):
+    # how the objects extending to the ground used to search for it, row by row
+    for row in range(y, GROUND):
+        bottom_row = QRect(x, row, width, 1)
+
+        if any(
+            bottom_row.intersects(other.get_rect()) and row == other.get_rect().top()
+            for other in obj.objects[0 : obj.index_in_level]
+        ):
+            return row
+
+    return None
+
+
+def _first_top_below_pyramid(obj, x, y):
+    for row in range(y, GROUND):
+        bottom_row = QRect(x, row, 2 * (row - y), 1)
+
+        if any(
+            bottom_row.intersects(other.get_rect()) and row == other.get_rect().top()
+            for other in obj.objects[0 : obj.index_in_level]
+        ):
+            return row
+
+    return None
+
+
+def _random_rect():
+    return QRect(random.randint(-2, 30), random.randint(0, GROUND), random.randint(0, 6), random.randint(0, 4))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_as_searching_row_by_row(seed):
+    # GIVEN a list of randomly placed objects and their ground map
+    random.seed(seed)
+
+    objects = LevelObjectList()
+
+    for _ in range(20):
+        objects.append(_FakeObject(objects, _random_rect()))
+
+    ground_map = GroundMap(objects)
+
+    # WHEN some of them are moved, removed or reordered
+    for obj in random.sample(objects, 5):
+        obj.rect = _random_rect()
+        ground_map.update(obj)
+
+    objects.remove(random.choice(objects))
+    objects.insert(0, objects.pop())
+
+    # THEN the ground found for every object is the same as when searching row by row
+    for obj in objects:
+        x, y, width = random.randint(0, 25), random.randint(0, GROUND), random.randint(1, 5)
+
+        assert ground_map.first_top_below_row(obj, x, y, width, GROUND) == _first_top_below_row(obj, x, y, width)
+        assert ground_map.first_top_below_pyramid(obj, x, y, GROUND) == _first_top_below_pyramid(obj, x, y)
+
+
+def test_later_objects_are_ignored():
+    # GIVEN two objects, the first one above the second one
+    objects = LevelObjectList()
+
+    upper_object = _FakeObject(objects, QRect(0, 5, 4, 1))
+    lower_object = _FakeObject(objects, QRect(0, 10, 4, 1))
+
+    objects.extend([upper_object, lower_object])
+
+    ground_map = objects.ground_map
+
+    # WHEN looking for the ground below the first object
+    # THEN the second object is not found, since it comes after it
+    assert ground_map.first_top_below_row(upper_object, 0, 6, 4, GROUND) is None
+
+    # WHEN looking for the ground below the second object
+    # THEN the first object is found
+    assert ground_map.first_top_below_row(lower_object, 0, 0, 4, GROUND) == 5
+
+
+def test_ground_map_belongs_to_list():
+    # GIVEN two lists of objects
+    objects = LevelObjectList()
+    other_objects = LevelObjectList()
+
+    # WHEN asking for their ground maps
+    # THEN every list has its own one, which is kept, until the list is cleared
+    ground_map = objects.ground_map
+
+    assert objects.ground_map is not other_objects.ground_map
+
+    objects.append(_FakeObject(objects, QRect(0, 5, 4, 1)))
+
+    assert objects.ground_map is ground_map
+
+    objects.clear()
+
+    assert objects.ground_map is not ground_map
+    assert objects.ground_map.objects is objects
+
+
+class _FakeToGroundObject(_FakeObject):
+    def __init__(self, objects, x: int, y: int, width: int):
+        super(_FakeToGroundObject, self).__init__(objects, QRect())
+
+        self.x = x
+        self.y = y
+        self.width = width
+
+        self.render_count = 0
+
+    def render(self):
+        ground_map = self.objects.ground_map
+
+        hit_y = ground_map.first_top_below_row(self, self.x, self.y, self.width, GROUND)
+
+        if hit_y is None:
+            hit_y = GROUND
+
+        self.rect = QRect(self.x, self.y, self.width, hit_y - self.y)
+        self.render_count += 1
+
+        ground_map.update(self)
+
+
+def _place(objects, obj):
+    # objects are rendered, before they are added to the level
+    objects.ground_map.update(obj)
+    objects.append(obj)
+
+    return obj
+
+
+def test_only_dependent_objects_are_rendered():
+    # GIVEN a platform with an object extending to the ground on it, and one next to it
+    objects = LevelObjectList()
+
+    platform = _place(objects, _FakeObject(objects, QRect(0, 20, 4, 1)))
+    other_platform = _place(objects, _FakeObject(objects, QRect(10, 20, 4, 1)))
+
+    to_ground = _FakeToGroundObject(objects, 0, 10, 2)
+    to_ground.render()
+    objects.append(to_ground)
+
+    ground_map = objects.ground_map
+
+    assert ground_map.dependencies_of(to_ground) == [platform]
+    assert ground_map.objects_extending_to_ground() == [to_ground]
+
+    # WHEN the other platform is moved
+    other_platform.rect = QRect(20, 20, 4, 1)
+    ground_map.update(other_platform)
+
+    # THEN the object extending to the ground does not need to be rendered again
+    assert ground_map.render_outdated_objects() == []
+
+    # WHEN the platform is moved underneath it
+    platform.rect = QRect(0, 15, 4, 1)
+    ground_map.update(platform)
+
+    # THEN only it is rendered again and now stops at the new position of the platform
+    assert ground_map.render_outdated_objects() == [to_ground]
+    assert to_ground.rect.height() == 5
+
+
+def test_removed_dependency_is_noticed():
+    # GIVEN an object extending to the ground onto a platform
+    objects = LevelObjectList()
+
+    platform = _place(objects, _FakeObject(objects, QRect(0, 20, 4, 1)))
+
+    to_ground = _FakeToGroundObject(objects, 0, 10, 2)
+    to_ground.render()
+    objects.append(to_ground)
+
+    # WHEN the platform is removed from the level
+    objects.remove(platform)
+
+    # THEN the object is rendered again and extends to the ground
+    assert objects.ground_map.render_outdated_objects() == [to_ground]
+    assert to_ground.rect.height() == GROUND - 10
+
+
+def test_new_ground_map_renders_every_object():
+    # GIVEN objects extending to the ground, that were rendered without the ground map, that is made for them
+    objects = LevelObjectList()
+
+    platform = _place(objects, _FakeObject(objects, QRect(0, 20, 4, 1)))
+
+    to_ground = _FakeToGroundObject(objects, 0, 10, 2)
+    to_ground.render()
+    objects.append(to_ground)
+
+    objects = LevelObjectList([platform, to_ground])
+    platform.objects = to_ground.objects = objects
+
+    # WHEN asking the new ground map for the outdated objects
+    # THEN every object is rendered once, so that it knows, what they depend on
+    assert objects.ground_map.render_outdated_objects() == [platform, to_ground]
+    assert to_ground.render_count == 2
+    assert objects.ground_map.dependencies_of(to_ground) == [platform]
+
+    assert objects.ground_map.render_outdated_objects() == []
@@ -9,6 +9,7 @@ from foundry.conftest import compare_images
 from foundry.game.File import ROM
 from foundry.game.gfx.objects.LevelObject import get_minimal_icon_object
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
 from foundry.gui.ObjectViewer import ObjectDrawArea
 from smb3parse.objects import MAX_DOMAIN, MAX_ID_VALUE
 from smb3parse.objects.object_set import (
@@ -62,7 +63,7 @@ def _test_object_against_reference(level_object, qtbot, minimal=False):
     ],
 )
 def test_object_rendering_4_2(domain, object_index, qtbot):
-    object_factory = LevelObjectFactory(HILLY_OBJECT_SET, HILLY_GRAPHICS_SET, 0, [], False)
+    object_factory = LevelObjectFactory(HILLY_OBJECT_SET, HILLY_GRAPHICS_SET, 0, LevelObjectList(), False)
 
     level_object = object_factory.from_properties(domain, object_index, 0, 0, None, 0)
 
@@ -71,7 +72,7 @@ def test_object_rendering_4_2(domain, object_index, qtbot):
 
 @pytest.mark.parametrize("object_index", [0x80, 0x8F])  # 45 Degree Hill - Up/Right
 def test_object_rendering_8_1(object_index, qtbot):
-    object_factory = LevelObjectFactory(UNDERGROUND_OBJECT_SET, UNDERGROUND_GRAPHICS_SET, 0, [], False)
+    object_factory = LevelObjectFactory(UNDERGROUND_OBJECT_SET, UNDERGROUND_GRAPHICS_SET, 0, LevelObjectList(), False)
 
     object_domain = 0x00
     level_object = object_factory.from_properties(object_domain, object_index, 0, 0, None, 0)
@@ -91,7 +92,7 @@ def test_object_rendering_8_1(object_index, qtbot):
     ],
 )
 def test_object_rendering_2_1(object_index, domain, object_set, graphic_set, qtbot):
-    object_factory = LevelObjectFactory(object_set, graphic_set, 0, [], False)
+    object_factory = LevelObjectFactory(object_set, graphic_set, 0, LevelObjectList(), False)
 
     level_object = object_factory.from_properties(domain, object_index, 0, 0, None, 0)
 
@@ -106,7 +107,7 @@ def test_object_rendering_2_1(object_index, domain, object_set, graphic_set, qtb
     ],
 )
 def test_object_rendering_0_0(object_index, domain, object_set, graphic_set, qtbot):
-    object_factory = LevelObjectFactory(object_set, graphic_set, 0, [], False)
+    object_factory = LevelObjectFactory(object_set, graphic_set, 0, LevelObjectList(), False)
 
     level_object = object_factory.from_properties(domain, object_index, 0, 0, 8, 0)
 
@@ -121,7 +122,7 @@ def test_object_rendering_0_0(object_index, domain, object_set, graphic_set, qtb
     ],
 )
 def test_object_rendering_1_0_1(object_index, domain, object_set, graphic_set, qtbot):
-    object_factory = LevelObjectFactory(object_set, graphic_set, 0, [], False)
+    object_factory = LevelObjectFactory(object_set, graphic_set, 0, LevelObjectList(), False)
 
     level_object = object_factory.from_properties(domain, object_index, 0, 0, 8, 0)
 
@@ -129,7 +130,7 @@ def test_object_rendering_1_0_1(object_index, domain, object_set, graphic_set, q
 
 
 def test_no_change_to_bytes():
-    object_factory = LevelObjectFactory(1, 1, 0, [], False)
+    object_factory = LevelObjectFactory(1, 1, 0, LevelObjectList(), False)
 
     cloud_bytes = bytearray([0x00, 0x00, 0xE5])
 
@@ -138,11 +139,34 @@ def test_no_change_to_bytes():
     assert cloud_object.to_bytes() == cloud_bytes
 
 
+def test_objects_are_compared_by_identity():
+    # GIVEN two objects, made from the same bytes
+    object_factory = LevelObjectFactory(1, 1, 0, LevelObjectList(), False)
+
+    cloud_bytes = bytearray([0x00, 0x00, 0xE5])
+
+    cloud_object = object_factory.from_data(cloud_bytes, 0)
+    other_cloud_object = object_factory.from_data(cloud_bytes, 0)
+
+    # THEN they are still different objects, which can be put into sets
+    assert cloud_object != other_cloud_object
+    assert len({cloud_object, other_cloud_object}) == 2
+
+    # THEN comparing their data shows, that they are the same
+    assert cloud_object.has_same_data(other_cloud_object)
+
+    # WHEN one of them is moved
+    other_cloud_object.x_position += 1
+
+    # THEN their data is different
+    assert not cloud_object.has_same_data(other_cloud_object)
+
+
 @pytest.mark.parametrize(
     "attribute, increase", zip(["domain", "obj_index", "length", "x_position", "y_position"], [1, 0x10, 1, 1, 1])
 )
 def test_change_attribute_to_bytes(attribute, increase):
-    object_factory = LevelObjectFactory(1, 1, 0, [], False)
+    object_factory = LevelObjectFactory(1, 1, 0, LevelObjectList(), False)
 
     cloud_object = object_factory.from_properties(0x00, 0xE0, 0, 0, None, 0)
 
@@ -160,7 +184,7 @@ def gen_object_factories():
         if object_set in [WORLD_MAP_OBJECT_SET, MUSHROOM_OBJECT_SET, SPADE_BONUS_OBJECT_SET]:
             continue
 
-        yield LevelObjectFactory(object_set, object_set, 0, [], False)
+        yield LevelObjectFactory(object_set, object_set, 0, LevelObjectList(), False)
 
 
 def gen_object_ids():
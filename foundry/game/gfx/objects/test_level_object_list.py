@@ -0,0 +1,70 @@
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+
+
+class _FakeObject:
+    pass
+
+
+def _assert_positions(objects: LevelObjectList):
+    for index, obj in enumerate(objects):
+        assert objects.position_of(obj) == index
+
+
+def test_appended_objects():
+    # GIVEN an empty list
+    objects = LevelObjectList()
+
+    # WHEN objects are appended to it
+    for _ in range(5):
+        objects.append(_FakeObject())
+
+    objects.extend([_FakeObject(), _FakeObject()])
+
+    # THEN their positions are known
+    _assert_positions(objects)
+
+
+def test_unknown_object():
+    # GIVEN a list with an object and one, that is not in it
+    objects = LevelObjectList([_FakeObject()])
+
+    # WHEN asking for the position of the one, that is not in the list
+    # THEN it is not found
+    assert objects.position_of(_FakeObject()) is None
+
+
+def test_reordered_objects():
+    # GIVEN a list of objects, whose positions are known
+    objects = LevelObjectList(_FakeObject() for _ in range(10))
+
+    _assert_positions(objects)
+
+    removed_object = objects[3]
+
+    # WHEN it is changed in every other way, than appending to it
+    objects.remove(removed_object)
+    objects.insert(0, objects.pop())
+    objects.insert(2, _FakeObject())
+    objects[5] = _FakeObject()
+    del objects[7]
+    objects.reverse()
+
+    # THEN the positions are still correct and the removed object is not found anymore
+    _assert_positions(objects)
+
+    assert objects.position_of(removed_object) is None
+
+
+def test_cleared_list():
+    # GIVEN a list of objects
+    old_object = _FakeObject()
+    objects = LevelObjectList([old_object])
+
+    # WHEN it is cleared and filled again
+    objects.clear()
+    objects.append(_FakeObject())
+
+    # THEN only the new object is found
+    _assert_positions(objects)
+
+    assert objects.position_of(old_object) is None
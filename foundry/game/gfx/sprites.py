@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+from PySide2.QtCore import QRect
+from PySide2.QtGui import QColor, QImage, Qt
+
+from foundry import data_dir
+from foundry.game.gfx.drawable import apply_selection_overlay
+
+SPRITE_LENGTH = 16
+
+# color of the pixels in the sprite sheet, that are meant to be transparent
+MASK_COLOR = [0xFF, 0x33, 0xFF]
+
+# the enemy and item sprites come after the 4 rows of sprites for each of the 12 object sets
+ENEMY_SPRITE_Y_OFFSET = 12 * 4 * SPRITE_LENGTH
+ENEMY_SPRITES_PER_ROW = 64
+
+# the scaled enemy sprites are kept for every zoom level they were drawn at, so limit them somewhat
+SCALED_ENEMY_SPRITE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def sprite_sheet() -> QImage:
+    """
+    Returns gfx.png, which holds the images of all enemies, items and editor overlays, loading it the first time it is
+    needed.
+    """
+    png = QImage(str(data_dir / "gfx.png"))
+    png.convertTo(QImage.Format_RGB888)
+
+    return png
+
+
+@lru_cache(maxsize=None)
+def load_sprite(x: int, y: int) -> QImage:
+    """
+    Returns the sprite at the given position in the sprite sheet, with the mask color made transparent.
+
+    The image is shared between all callers, so it has to be copied, before it is changed.
+
+    :param x: Column of the sprite, counted in sprites.
+    :param y: Row of the sprite, counted in sprites.
+    """
+    image = sprite_sheet().copy(QRect(x * SPRITE_LENGTH, y * SPRITE_LENGTH, SPRITE_LENGTH, SPRITE_LENGTH))
+    mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+    image.setAlphaChannel(mask)
+
+    return image
+
+
+@lru_cache(maxsize=None)
+def load_enemy_sprite(sprite_index: int) -> QImage:
+    """
+    Returns one 16x16 part of an enemy or item, as it is in the sprite sheet, i. e. without transparency.
+
+    The image is shared between all callers, so it has to be copied, before it is changed.
+    """
+    x = (sprite_index % ENEMY_SPRITES_PER_ROW) * SPRITE_LENGTH
+    y = ENEMY_SPRITE_Y_OFFSET + (sprite_index // ENEMY_SPRITES_PER_ROW) * SPRITE_LENGTH
+
+    return sprite_sheet().copy(QRect(x, y, SPRITE_LENGTH, SPRITE_LENGTH))
+
+
+@lru_cache(maxsize=SCALED_ENEMY_SPRITE_CACHE_SIZE)
+def masked_enemy_sprite(sprite_index: int, block_length: int, selected: bool) -> QImage:
+    """
+    Returns one 16x16 part of an enemy or item, ready to be drawn at the given block length.
+
+    The image is shared between all callers, so it has to be copied, before it is changed.
+    """
+    image = load_enemy_sprite(sprite_index).copy()
+
+    mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+    image.setAlphaChannel(mask)
+
+    # todo better effect
+    if selected:
+        apply_selection_overlay(image, mask)
+
+    if block_length != SPRITE_LENGTH:
+        image = image.scaled(block_length, block_length)
+
+    return image
+
+
+@lru_cache(maxsize=None)
+def mario_actions() -> QImage:
+    """
+    Returns mario.png, which holds the images of Mario for every possible start action of a level.
+    """
+    image = QImage(str(data_dir / "mario.png"))
+    image.convertTo(QImage.Format_RGBA8888)
+
+    return image
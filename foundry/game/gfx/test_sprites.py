@@ -0,0 +1,35 @@
+from itertools import product
+
+import pytest
+from PySide2.QtGui import QColor
+
+from foundry.game.gfx.sprites import MASK_COLOR, SPRITE_LENGTH, load_enemy_sprite, masked_enemy_sprite
+
+GOOMBA_SPRITE = 0x0A
+
+
+@pytest.mark.parametrize("block_length", [SPRITE_LENGTH, 2 * SPRITE_LENGTH])
+def test_masked_enemy_sprite(block_length):
+    # GIVEN an enemy sprite from the sprite sheet
+    sprite = load_enemy_sprite(GOOMBA_SPRITE)
+
+    # WHEN it is made ready for drawing
+    image = masked_enemy_sprite(GOOMBA_SPRITE, block_length, False)
+
+    # THEN it has the requested size and only the pixels in the mask color are transparent
+    assert image.width() == image.height() == block_length
+
+    scale = block_length // SPRITE_LENGTH
+
+    for x, y in product(range(SPRITE_LENGTH), repeat=2):
+        is_masked = list(QColor(sprite.pixel(x, y)).getRgb()[:3]) == MASK_COLOR
+
+        assert (QColor.fromRgba(image.pixel(x * scale, y * scale)).alpha() == 0) == is_masked
+
+
+def test_masked_enemy_sprite_is_cached():
+    # WHEN the same sprite is requested twice at the same zoom level
+    # THEN it was only made once
+    assert masked_enemy_sprite(GOOMBA_SPRITE, SPRITE_LENGTH, True) is masked_enemy_sprite(
+        GOOMBA_SPRITE, SPRITE_LENGTH, True
+    )
@@ -0,0 +1,122 @@
+import struct
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import LevelObject
+
+# used for the system clipboard, so objects can also be pasted into other instances of the editor
+CLIPBOARD_MIME_TYPE = "application/x-smb3-foundry-objects"
+
+FORMAT_VERSION = 1
+
+MAX_ORIGIN = 0xFF, 0xFF
+
+_MAGIC = b"SMB3FO"
+
+# magic, version, origin x, origin y, object count
+_HEADER = struct.Struct(">6sBhhH")
+
+# kind, domain, object index, x, y, length
+_OBJECT = struct.Struct(">BBBhhB")
+
+_LEVEL_OBJECT = 0
+_LEVEL_OBJECT_4_BYTE = 1
+_ENEMY = 2
+
+
+class CopiedObject(NamedTuple):
+    """
+    What is needed to create a copied object again, in any level. The position is kept as is and not as part of the
+    object bytes, since those depend on whether the level is vertical or not.
+    """
+
+    is_enemy: bool
+    domain: int
+    obj_index: int
+    x: int
+    y: int
+    # only for 4 byte objects, the others have it in their object index
+    length: Optional[int]
+
+    @staticmethod
+    def from_object(obj: Union[LevelObject, EnemyObject]) -> "CopiedObject":
+        x, y = obj.get_position()
+
+        if isinstance(obj, EnemyObject):
+            return CopiedObject(True, 0, obj.obj_index, x, y, None)
+
+        if obj.is_4byte:
+            length: Optional[int] = obj.data[3]
+        else:
+            length = None
+
+        return CopiedObject(False, obj.domain, obj.obj_index, x, y, length)
+
+
+class ClipboardData(NamedTuple):
+    """
+    Copied objects and the point they are pasted relative to, i. e. the top left of all of them.
+    """
+
+    objects: List[CopiedObject]
+    origin: Tuple[int, int]
+
+    @staticmethod
+    def from_objects(objects: Sequence[Union[LevelObject, EnemyObject]]) -> "ClipboardData":
+        copied_objects = [CopiedObject.from_object(obj) for obj in objects]
+
+        min_x, min_y = MAX_ORIGIN
+
+        for copied_object in copied_objects:
+            min_x = min(min_x, copied_object.x)
+            min_y = min(min_y, copied_object.y)
+
+        min_x = max(min_x, 0)
+        min_y = max(min_y, 0)
+
+        return ClipboardData(copied_objects, (min_x, min_y))
+
+    def to_bytes(self) -> bytes:
+        data = bytearray(_HEADER.pack(_MAGIC, FORMAT_VERSION, *self.origin, len(self.objects)))
+
+        for obj in self.objects:
+            if obj.is_enemy:
+                kind = _ENEMY
+            elif obj.length is None:
+                kind = _LEVEL_OBJECT
+            else:
+                kind = _LEVEL_OBJECT_4_BYTE
+
+            data.extend(_OBJECT.pack(kind, obj.domain, obj.obj_index, obj.x, obj.y, obj.length or 0))
+
+        return bytes(data)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "ClipboardData":
+        """
+        :raises ValueError: If the data was not made by to_bytes, e. g. by a different version of the editor.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Clipboard data is too short.")
+
+        magic, version, origin_x, origin_y, object_count = _HEADER.unpack_from(data)
+
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Clipboard data is not in a known format.")
+
+        if len(data) != _HEADER.size + object_count * _OBJECT.size:
+            raise ValueError("Clipboard data has the wrong length.")
+
+        objects = []
+
+        for offset in range(_HEADER.size, len(data), _OBJECT.size):
+            kind, domain, obj_index, x, y, length = _OBJECT.unpack_from(data, offset)
+
+            if kind not in (_LEVEL_OBJECT, _LEVEL_OBJECT_4_BYTE, _ENEMY):
+                raise ValueError(f"Unknown kind of object {kind} in clipboard data.")
+
+            objects.append(
+                CopiedObject(kind == _ENEMY, domain, obj_index, x, y, length if kind == _LEVEL_OBJECT_4_BYTE else None)
+            )
+
+        return ClipboardData(objects, (origin_x, origin_y))
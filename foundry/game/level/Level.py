@@ -1,6 +1,9 @@
-from typing import List, Optional, Tuple, Union, overload
+from contextlib import contextmanager
+from enum import Flag, auto
+from typing import Iterator, List, Optional, Tuple, Union, overload
+from warnings import warn
 
-from PySide2.QtCore import QObject, QPoint, QRect, QSize, Signal, SignalInstance
+from PySide2.QtCore import QObject, QPoint, QRect, QSize, QThread, Signal, SignalInstance
 
 from foundry.game.File import ROM
 from foundry.game.ObjectSet import ObjectSet
@@ -9,7 +12,9 @@ from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
-from foundry.game.level import LevelByteData, _load_level_offsets
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+from foundry.game.level import LevelByteData, _LevelListAttribute
+from foundry.game.level.ClipboardData import ClipboardData
 from foundry.game.level.LevelLike import LevelLike
 from foundry.gui.UndoStack import UndoStack
 from smb3parse.constants import BASE_OFFSET, Level_TilesetIdx_ByTileset
@@ -33,18 +38,63 @@ def world_and_level_for_level_address(level_address: int):
         return -1, -1
 
 
+class LevelChange(Flag):
+    """
+    What changed in a level, so that listeners can skip the changes, that don't concern them.
+    """
+
+    NOTHING = 0
+    OBJECTS = auto()
+    ENEMIES = auto()
+    JUMPS = auto()
+    HEADER = auto()
+    SELECTION = auto()
+    # the undo stack, e. g. after an edit was saved or undone
+    HISTORY = auto()
+
+    LEVEL_DATA = OBJECTS | ENEMIES | JUMPS | HEADER
+    ALL = LEVEL_DATA | SELECTION | HISTORY
+
+
+def changes_between(old_data: Optional[LevelByteData], new_data: LevelByteData) -> LevelChange:
+    """
+    Compares two states of a level, e. g. from the undo stack. Jumps are stored after the objects, so changes to one of
+    them count as changes to both.
+    """
+    if old_data is None:
+        return LevelChange.LEVEL_DATA
+
+    (_, old_object_data), (_, old_enemy_data) = old_data
+    (_, new_object_data), (_, new_enemy_data) = new_data
+
+    changes = LevelChange.NOTHING
+
+    if old_object_data[: Level.HEADER_LENGTH] != new_object_data[: Level.HEADER_LENGTH]:
+        changes |= LevelChange.HEADER
+
+    if old_object_data[Level.HEADER_LENGTH :] != new_object_data[Level.HEADER_LENGTH :]:
+        changes |= LevelChange.OBJECTS | LevelChange.JUMPS
+
+    if old_enemy_data != new_enemy_data:
+        changes |= LevelChange.ENEMIES
+
+    return changes
+
+
 class LevelSignaller(QObject):
     data_changed: SignalInstance = Signal()
     jumps_changed: SignalInstance = Signal()
 
+    # LevelChange
+    level_changed: SignalInstance = Signal(object)
+
 
 class Level(LevelLike):
     MIN_LENGTH = 0x10
 
-    offsets, world_indexes = _load_level_offsets()
-    sorted_offsets = sorted(offsets, key=lambda level: level.rom_level_offset)
-
-    WORLDS = len(world_indexes)
+    offsets = _LevelListAttribute("offsets")
+    world_indexes = _LevelListAttribute("world_indexes")
+    sorted_offsets = _LevelListAttribute("sorted_offsets")
 
     HEADER_LENGTH = 9  # bytes
 
@@ -53,6 +103,10 @@ class Level(LevelLike):
 
         self._signal_emitter = LevelSignaller()
 
+        # how many batch_changes() are currently open and what changed in them
+        self._batch_depth = 0
+        self._batched_changes = LevelChange.NOTHING
+
         self.attached_to_rom = True
 
         self.object_set = ObjectSet(object_set_number)
@@ -64,7 +118,7 @@ class Level(LevelLike):
         self.header_offset = layout_address
         self.enemy_offset = enemy_data_offset
 
-        self.objects: List[LevelObject] = []
+        self.objects = LevelObjectList()
         self.jumps: List[Jump] = []
         self.enemies: List[EnemyObject] = []
 
@@ -90,7 +144,7 @@ class Level(LevelLike):
             self._update_level_size()
 
             self.undo_stack.clear(self.to_bytes())
-            self._signal_emitter.data_changed.emit()
+            self.notify_change(LevelChange.ALL)
 
     @property
     def width(self):
@@ -102,8 +156,56 @@ class Level(LevelLike):
 
     @property
     def data_changed(self):
+        """
+        Emitted once for every level_changed, for listeners, that don't care what changed.
+        """
         return self._signal_emitter.data_changed
 
+    @property
+    def level_changed(self):
+        return self._signal_emitter.level_changed
+
+    @contextmanager
+    def batch_changes(self) -> Iterator[None]:
+        """
+        Collects the changes made inside of it, so that listeners are only notified once at the end, about all of them.
+        Batches can be nested, in which case the outermost one notifies.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0 and self._batched_changes:
+                changes, self._batched_changes = self._batched_changes, LevelChange.NOTHING
+
+                self._emit_changes(changes)
+
+    def notify_change(self, changes: LevelChange):
+        """
+        Lets listeners know, that the given parts of the level changed, or remembers it, until the current batch ends.
+        """
+        if not changes:
+            return
+
+        if self._batch_depth:
+            self._batched_changes |= changes
+        else:
+            self._emit_changes(changes)
+
+    def _emit_changes(self, changes: LevelChange):
+        self.level_changed.emit(changes)
+        self.data_changed.emit()
+
+    def move_to_thread(self, thread: QThread):
+        """
+        Moves the signals of the level to the given thread, e. g. to the GUI thread, after loading it in the background.
+        """
+        self._signal_emitter.moveToThread(thread)
+        self.undo_stack.moveToThread(thread)
+
     @property
     def jumps_changed(self):
         return self._signal_emitter.jumps_changed
@@ -115,10 +217,11 @@ class Level(LevelLike):
 
         object_data = header_and_object_data[Level.HEADER_LENGTH :]
 
-        self._parse_header()
-        self._load_level_data(object_data, enemy_data, new_level=False)
+        with self.batch_changes():
+            self._parse_header()
+            self._load_level_data(object_data, enemy_data, new_level=False)
 
-        self.data_changed.emit()
+            self.notify_change(LevelChange.LEVEL_DATA)
 
     def current_object_size(self):
         size = 0
@@ -137,6 +240,11 @@ class Level(LevelLike):
         return len(self.enemies) * ENEMY_SIZE
 
     def _parse_header(self):
+        self._read_header()
+
+        self.notify_change(LevelChange.HEADER)
+
+    def _read_header(self):
         self.header = LevelHeader(self.header_bytes, self.object_set_number)
 
         self.object_factory = LevelObjectFactory(
@@ -150,8 +258,6 @@ class Level(LevelLike):
 
         self.size = self.header.width, self.header.height
 
-        self.data_changed.emit()
-
     def _load_enemies(self, data: bytearray):
         self.enemies.clear()
 
@@ -566,17 +672,59 @@ class Level(LevelLike):
     def draw(self, *_):
         pass
 
-    def paste_object_at(self, x: int, y: int, obj: Union[EnemyObject, LevelObject]) -> Union[EnemyObject, LevelObject]:
-        if isinstance(obj, EnemyObject):
-            return self.add_enemy(obj.obj_index, x, y)
+    def paste_objects_at(self, clipboard_data: ClipboardData, x: int, y: int) -> List[Union[EnemyObject, LevelObject]]:
+        """
+        Adds the copied objects in front of all others, so that their origin ends up at the given position. Objects,
+        that would end up outside of the level, are left out.
 
-        elif isinstance(obj, LevelObject):
-            if obj.is_4byte:
-                length: Optional[int] = obj.data[3]
-            else:
-                length = None
+        The objects are added all at once, so objects, that depend on other pasted objects, are only rendered again
+        once and the level only notifies about the change once.
+
+        :return: The pasted objects.
+        """
+        ori_x, ori_y = clipboard_data.origin
+
+        new_objects: List[LevelObject] = []
+        new_enemies: List[EnemyObject] = []
 
-            return self.add_object(obj.domain, obj.obj_index, x, y, length)
+        for copied_object in clipboard_data.objects:
+            obj_x = x + copied_object.x - ori_x
+            obj_y = y + copied_object.y - ori_y
+
+            try:
+                if copied_object.is_enemy:
+                    new_enemies.append(self.enemy_item_factory.from_properties(copied_object.obj_index, obj_x, obj_y))
+                else:
+                    new_objects.append(
+                        self.object_factory.from_properties(
+                            copied_object.domain,
+                            copied_object.obj_index,
+                            obj_x,
+                            obj_y,
+                            copied_object.length,
+                            len(self.objects) + len(new_objects),
+                        )
+                    )
+            except ValueError:
+                warn("Tried pasting outside of level.", RuntimeWarning)
+
+        self.objects.extend(new_objects)
+        self.enemies.extend(new_enemies)
+
+        # the objects were rendered before the ones pasted before them were part of the level
+        self.objects.ground_map.render_outdated_objects()
+
+        changes = LevelChange.NOTHING
+
+        if new_objects:
+            changes |= LevelChange.OBJECTS
+
+        if new_enemies:
+            changes |= LevelChange.ENEMIES
+
+        self.notify_change(changes)
+
+        return new_objects + new_enemies
 
     def create_object_at(self, x: int, y: int, domain: int = 0, object_index: int = 0):
         self.add_object(domain, object_index, x, y, None, len(self.objects))
@@ -611,12 +759,12 @@ class Level(LevelLike):
     def add_jump(self):
         self.jumps.append(Jump.from_properties(0, 0, 0, 0))
 
-        self.data_changed.emit()
+        self.notify_change(LevelChange.JUMPS)
 
     def remove_jump(self, jump: Jump):
         self.jumps.remove(jump)
 
-        self.data_changed.emit()
+        self.notify_change(LevelChange.JUMPS)
 
     def index_of(self, obj: Union[EnemyObject, LevelObject]) -> int:
         if isinstance(obj, LevelObject):
@@ -668,35 +816,36 @@ class Level(LevelLike):
         return m3l_bytes
 
     def from_m3l(self, m3l_bytes: bytearray):
-        world_number, level_number, self.object_set_number = m3l_bytes[:3]
-        self.object_set = ObjectSet(self.object_set_number)
+        with self.batch_changes():
+            world_number, level_number, self.object_set_number = m3l_bytes[:3]
+            self.object_set = ObjectSet(self.object_set_number)
 
-        self.header_offset = self.enemy_offset = 0
+            self.header_offset = self.enemy_offset = 0
 
-        # update the level_object_factory
-        self._load_level_data(bytearray(), bytearray())
+            # update the level_object_factory
+            self._load_level_data(bytearray(), bytearray())
 
-        m3l_bytes = m3l_bytes[3:]
+            m3l_bytes = m3l_bytes[3:]
 
-        self.header_bytes = m3l_bytes[: Level.HEADER_LENGTH]
-        self._parse_header()
+            self.header_bytes = m3l_bytes[: Level.HEADER_LENGTH]
+            self._parse_header()
 
-        m3l_bytes = m3l_bytes[Level.HEADER_LENGTH :]
+            m3l_bytes = m3l_bytes[Level.HEADER_LENGTH :]
 
-        # figure out how many bytes are the objects
-        self._load_objects(m3l_bytes)
-        object_size = self.current_object_size() + len(b"\xFF")  # delimiter
+            # figure out how many bytes are the objects
+            self._load_objects(m3l_bytes)
+            object_size = self.current_object_size() + len(b"\xFF")  # delimiter
 
-        object_bytes = m3l_bytes[:object_size]
-        enemy_bytes = m3l_bytes[object_size:]
+            object_bytes = m3l_bytes[:object_size]
+            enemy_bytes = m3l_bytes[object_size:]
 
-        if len(enemy_bytes) % 3 - len(b"\xFF") == 1:
-            # compatibility with workshop
-            enemy_bytes = enemy_bytes[1:]
+            if len(enemy_bytes) % 3 - len(b"\xFF") == 1:
+                # compatibility with workshop
+                enemy_bytes = enemy_bytes[1:]
 
-        self._load_level_data(object_bytes, enemy_bytes)
+            self._load_level_data(object_bytes, enemy_bytes)
 
-        self.attached_to_rom = False
+            self.attached_to_rom = False
 
     def to_bytes(self) -> LevelByteData:
         data = bytearray()
@@ -726,12 +875,16 @@ class Level(LevelLike):
         return (self.header_offset, data), (self.enemy_offset, enemies)
 
     def from_bytes(self, object_data: Tuple[int, bytearray], enemy_data: Tuple[int, bytearray], new_level=True):
-
+        """
+        Loads the level from the given data. A new level notifies about all of it, but when going back to an earlier
+        state of the same level, e. g. when undoing, only the caller knows what actually changed, so nothing is sent.
+        """
         self.header_offset, object_bytes = object_data
         self.enemy_offset, enemies = enemy_data
 
         self.header_bytes = object_bytes[0 : Level.HEADER_LENGTH]
         objects = object_bytes[Level.HEADER_LENGTH :]
 
-        self._parse_header()
-        self._load_level_data(objects, enemies, new_level)
+        with self.batch_changes():
+            self._read_header()
+            self._load_level_data(objects, enemies, new_level)
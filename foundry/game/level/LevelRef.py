@@ -1,26 +1,38 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
 
 from PySide2.QtCore import QObject, Signal, SignalInstance
 
-from foundry.game.level.Level import Level
+from foundry.game.level import LevelByteData
+from foundry.game.level.Level import Level, LevelChange, changes_between
 
 
 class LevelRef(QObject):
     data_changed: SignalInstance = Signal()
     jumps_changed: SignalInstance = Signal()
 
+    # LevelChange
+    level_changed: SignalInstance = Signal(object)
+
     def __init__(self):
         super(LevelRef, self).__init__()
         self._internal_level: Optional[Level] = None
 
     def load_level(self, level_name: str, object_data_offset: int, enemy_data_offset: int, object_set_number: int):
-        self._internal_level = Level(level_name, object_data_offset, enemy_data_offset, object_set_number)
+        self.set_level(Level(level_name, object_data_offset, enemy_data_offset, object_set_number))
+
+    def set_level(self, level: Level):
+        """
+        Replaces the current level with one, that was already loaded, e. g. in the background.
+        """
+        self._internal_level = level
 
         self._internal_level.data_changed.connect(self.data_changed.emit)
         self._internal_level.jumps_changed.connect(self.jumps_changed.emit)
+        self._internal_level.level_changed.connect(self.level_changed.emit)
 
-        # actively emit, because we weren't connected yet, when the level sent it out
-        self.data_changed.emit()
+        # actively notify, because we weren't connected yet, when the level sent it out
+        self._internal_level.notify_change(LevelChange.ALL)
 
     @property
     def level(self):
@@ -32,13 +44,45 @@ class LevelRef(QObject):
 
     @selected_objects.setter
     def selected_objects(self, selected_objects):
-        if selected_objects == self.selected_objects:
-            return
+        selected_ids = {id(obj) for obj in selected_objects}
+
+        all_objects = self._internal_level.get_all_objects()
+
+        self.change_selection(
+            [obj for obj in all_objects if id(obj) in selected_ids],
+            [obj for obj in all_objects if id(obj) not in selected_ids],
+        )
 
-        for obj in self._internal_level.get_all_objects():
-            obj.selected = obj in selected_objects
+    def change_selection(self, selected_objects: Iterable, deselected_objects: Iterable):
+        """
+        Selects and deselects the given objects, leaving all others as they are. Only notifies about it, if that
+        actually changed the selection.
+        """
+        changed = False
 
-        self.data_changed.emit()
+        for obj in deselected_objects:
+            changed |= obj.selected
+
+            obj.selected = False
+
+        for obj in selected_objects:
+            changed |= not obj.selected
+
+            obj.selected = True
+
+        if changed:
+            self._internal_level.notify_change(LevelChange.SELECTION)
+
+    @contextmanager
+    def batch_changes(self) -> Iterator[None]:
+        """
+        See Level.batch_changes(). Does nothing, while no level is loaded.
+        """
+        if self._internal_level is None:
+            yield
+        else:
+            with self._internal_level.batch_changes():
+                yield
 
     def __getattr__(self, item: str):
         if self._internal_level is None:
@@ -50,25 +94,32 @@ class LevelRef(QObject):
         if not self.undo_stack.undo_available:
             return
 
-        self._internal_level.from_bytes(*self.undo_stack.undo(), new_level=False)
-        self.level.changed = True
-
-        self.data_changed.emit()
+        self._restore_level_state(self.undo_stack.undo())
 
     def redo(self):
         if not self.undo_stack.redo_available:
             return
 
-        self.level.from_bytes(*self.undo_stack.redo(), new_level=False)
-        self.level.changed = True
+        self._restore_level_state(self.undo_stack.redo())
 
-        self.data_changed.emit()
+    def _restore_level_state(self, level_state: LevelByteData):
+        changes = changes_between(self._internal_level.to_bytes(), level_state)
+
+        with self._internal_level.batch_changes():
+            self._internal_level.from_bytes(*level_state, new_level=False)
+            self.level.changed = True
+
+            self._internal_level.notify_change(changes | LevelChange.HISTORY)
 
     def save_level_state(self):
-        self.undo_stack.save_level_state(self._internal_level.to_bytes())
+        level_state = self._internal_level.to_bytes()
+
+        changes = changes_between(self.undo_stack.current_state, level_state)
+
+        self.undo_stack.save_level_state(level_state)
         self.level.changed = True
 
-        self.data_changed.emit()
+        self._internal_level.notify_change(changes | LevelChange.HISTORY)
 
     def __bool__(self):
         return self._internal_level is not None
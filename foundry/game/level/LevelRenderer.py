@@ -0,0 +1,338 @@
+from itertools import product
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+import numpy
+from PySide2.QtGui import QImage
+
+from foundry.game.File import ROM
+from foundry.game.gfx.GraphicsSet import GraphicsSet
+from foundry.game.gfx.Palette import PaletteGroup, load_palette_group, nes_palette
+from foundry.game.gfx.drawable import MASK_COLOR
+from foundry.game.gfx.drawable.Block import Block, TSA_BANK_0, TSA_BANK_1, TSA_BANK_2, TSA_BANK_3
+from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import BLANK, GROUND, LevelObject, SPECIAL_BACKGROUND_OBJECTS
+from foundry.game.gfx.sprites import MASK_COLOR as ENEMY_MASK_COLOR
+from foundry.game.level.Level import Level
+from foundry.game.level.WorldMap import OVERWORLD_GRAPHIC_SET
+from smb3parse.levels import LEVEL_MAX_LENGTH, WORLD_MAP_HEIGHT, WORLD_MAP_SCREEN_SIZE, WORLD_MAP_SCREEN_WIDTH
+from smb3parse.levels.world_map import WorldMap as _WorldMap
+from smb3parse.objects.object_set import (
+    CLOUDY_GRAPHICS_SET,
+    CLOUDY_OBJECT_SET,
+    DESERT_OBJECT_SET,
+    DUNGEON_OBJECT_SET,
+    ICE_OBJECT_SET,
+    WORLD_MAP_OBJECT_SET,
+)
+
+BLOCKS_IN_TSA = 0x100
+
+Framebuffer = numpy.ndarray
+
+
+def image_to_array(image: QImage) -> Framebuffer:
+    """
+    Copies the pixels of the given image into a (height, width, 3) RGB array.
+    """
+    image = image.convertToFormat(QImage.Format_RGB888)
+
+    width, height = image.width(), image.height()
+
+    buffer = numpy.frombuffer(image.constBits(), dtype=numpy.uint8, count=image.sizeInBytes())
+
+    # scan lines are padded to 32 bit boundaries
+    return buffer.reshape(height, image.bytesPerLine())[:, : width * 3].reshape(height, width, 3).copy()
+
+
+def save_png(framebuffer: Framebuffer, path: Union[str, Path]) -> bool:
+    """
+    Saves a framebuffer, as returned by the LevelRenderer, as a PNG file.
+
+    :return: Whether the image could be written.
+    """
+    height, width, _ = framebuffer.shape
+
+    # QImage does not copy the data it is given, so it has to outlive the image
+    data = numpy.ascontiguousarray(framebuffer, dtype=numpy.uint8).tobytes()
+
+    image = QImage(data, width, height, width * 3, QImage.Format_RGB888)
+
+    return image.save(str(path), "PNG")
+
+
+class BlockAtlas:
+    """
+    Holds the pixels of all blocks of one TSA table, in one palette group and graphics set, as NumPy arrays.
+
+    Blocks are decoded on first use, straight from the pixel data of their tiles, so no QPainter is involved.
+    """
+
+    def __init__(self, palette_group: PaletteGroup, graphics_set: GraphicsSet, tsa_data: bytes):
+        self.palette_group = palette_group
+        self.graphics_set = graphics_set
+        self.tsa_data = tsa_data
+
+        # the block, with its transparent pixels filled with the background color of its palette
+        self.opaque_pixels = numpy.zeros((BLOCKS_IN_TSA, Block.HEIGHT, Block.WIDTH, 3), dtype=numpy.uint8)
+        # the block, as is. only meaningful where the mask is True
+        self.pixels = numpy.zeros((BLOCKS_IN_TSA, Block.HEIGHT, Block.WIDTH, 3), dtype=numpy.uint8)
+        # True for all pixels, that are not transparent
+        self.masks = numpy.zeros((BLOCKS_IN_TSA, Block.HEIGHT, Block.WIDTH), dtype=bool)
+
+        self._decoded = numpy.zeros(BLOCKS_IN_TSA, dtype=bool)
+
+    def block(self, block_index: int) -> Tuple[Framebuffer, Framebuffer, Framebuffer]:
+        """
+        Returns the opaque pixels, pixels and the mask of the given block.
+
+        :param block_index: The index into the TSA table. Indexes over 0xFF are offsets into the ROM, where the actual
+        block index can be found, like in get_block().
+        """
+        if block_index > 0xFF:
+            block_index = ROM().get_byte(block_index)
+
+        if not self._decoded[block_index]:
+            self._decode(block_index)
+
+        return self.opaque_pixels[block_index], self.pixels[block_index], self.masks[block_index]
+
+    def _decode(self, block_index: int):
+        palette_index = (block_index & 0b1100_0000) >> 6
+
+        if self.graphics_set.number == CLOUDY_GRAPHICS_SET:
+            bg_color = nes_palette()[self.palette_group[palette_index][2]]
+        else:
+            bg_color = nes_palette()[self.palette_group[palette_index][0]]
+
+        tile_indexes = [
+            (TSA_BANK_0, 0, 0),
+            (TSA_BANK_1, Tile.HEIGHT, 0),
+            (TSA_BANK_2, 0, Tile.WIDTH),
+            (TSA_BANK_3, Tile.HEIGHT, Tile.WIDTH),
+        ]
+
+        pixels = self.pixels[block_index]
+
+        for tsa_bank, y, x in tile_indexes:
+            tile = Tile(self.tsa_data[tsa_bank + block_index], self.palette_group, palette_index, self.graphics_set)
+
+            tile_pixels = numpy.frombuffer(bytes(tile.pixels), dtype=numpy.uint8).reshape(Tile.HEIGHT, Tile.WIDTH, 3)
+
+            pixels[y : y + Tile.HEIGHT, x : x + Tile.WIDTH] = tile_pixels
+
+        mask = numpy.any(pixels != MASK_COLOR, axis=2)
+
+        self.masks[block_index] = mask
+        self.opaque_pixels[block_index] = numpy.where(mask[:, :, None], pixels, numpy.array(bg_color, numpy.uint8))
+
+        self._decoded[block_index] = True
+
+
+class LevelRenderer:
+    """
+    Composites a level into an RGB framebuffer, without the need for a QApplication, widgets or a QPainter.
+
+    It draws the same background, default graphics, level objects and enemies, as the LevelDrawer does, but none of
+    the editor specific overlays, like item icons, jump arrows, the grid or the auto scroll path.
+    """
+
+    def __init__(self, block_length: int = Block.SIDE_LENGTH, transparency: bool = False):
+        if block_length % Block.SIDE_LENGTH:
+            raise ValueError(f"Block length must be a multiple of {Block.SIDE_LENGTH}, was {block_length}.")
+
+        self.block_length = block_length
+        self.transparency = transparency
+
+        self._atlases: Dict[Tuple[int, str, int], BlockAtlas] = {}
+        self._enemy_blocks: Dict[Tuple[int, int], Tuple[Framebuffer, Framebuffer]] = {}
+
+    def atlas_for(self, level: Level) -> BlockAtlas:
+        return self._atlas(level.object_set_number, level.header.object_palette_index, level.header.graphic_set_index)
+
+    def _atlas(self, object_set_number: int, palette_group_index: int, graphic_set_index: int) -> BlockAtlas:
+        palette_group = load_palette_group(object_set_number, palette_group_index)
+
+        # can't hash list, so turn it into a string instead
+        atlas_key = (object_set_number, str(palette_group), graphic_set_index)
+
+        if atlas_key not in self._atlases:
+            self._atlases[atlas_key] = BlockAtlas(
+                palette_group, GraphicsSet(graphic_set_index), ROM.get_tsa_data(object_set_number)
+            )
+
+        return self._atlases[atlas_key]
+
+    def render(self, level: Level) -> Framebuffer:
+        """
+        :return: A (height, width, 3) array of uint8 RGB values, sized to the level and the block length.
+        """
+        framebuffer = numpy.zeros((level.height * Block.HEIGHT, level.width * Block.WIDTH, 3), dtype=numpy.uint8)
+
+        atlas = self.atlas_for(level)
+
+        self._draw_background(framebuffer, level)
+
+        if level.object_set_number == DESERT_OBJECT_SET:
+            self._draw_desert_default_graphics(framebuffer, level, atlas)
+        elif level.object_set_number == DUNGEON_OBJECT_SET:
+            self._draw_dungeon_default_graphics(framebuffer, level, atlas)
+        elif level.object_set_number == ICE_OBJECT_SET:
+            self._draw_ice_default_graphics(framebuffer, level, atlas)
+
+        self._draw_objects(framebuffer, level, atlas)
+
+        return self._scale(framebuffer)
+
+    def render_world_map(self, world_map: _WorldMap) -> Framebuffer:
+        """
+        :return: A (height, width, 3) array of uint8 RGB values, sized to the world map and the block length.
+        """
+        framebuffer = numpy.zeros(
+            (WORLD_MAP_HEIGHT * Block.HEIGHT, world_map.screen_count * WORLD_MAP_SCREEN_WIDTH * Block.WIDTH, 3),
+            dtype=numpy.uint8,
+        )
+
+        atlas = self._atlas(WORLD_MAP_OBJECT_SET, 0, OVERWORLD_GRAPHIC_SET)
+
+        for index, world_position in enumerate(world_map.gen_positions()):
+            screen_offset = (index // WORLD_MAP_SCREEN_SIZE) * WORLD_MAP_SCREEN_WIDTH
+
+            x = screen_offset + (index % WORLD_MAP_SCREEN_WIDTH)
+            y = (index // WORLD_MAP_SCREEN_WIDTH) % WORLD_MAP_HEIGHT
+
+            self._draw_block(framebuffer, atlas, world_position.tile(), x, y)
+
+        return self._scale(framebuffer)
+
+    def render_to_png(self, level: Level, path: Union[str, Path]) -> bool:
+        return save_png(self.render(level), path)
+
+    def _scale(self, framebuffer: Framebuffer) -> Framebuffer:
+        scale = self.block_length // Block.SIDE_LENGTH
+
+        if scale != 1:
+            framebuffer = framebuffer.repeat(scale, axis=0).repeat(scale, axis=1)
+
+        return framebuffer
+
+    @staticmethod
+    def _draw_background(framebuffer: Framebuffer, level: Level):
+        palette_group = load_palette_group(level.object_set_number, level.header.object_palette_index)
+
+        if level.object_set_number == CLOUDY_OBJECT_SET:
+            bg_color = nes_palette()[palette_group[3][2]]
+        else:
+            bg_color = nes_palette()[palette_group[0][0]]
+
+        framebuffer[:, :] = bg_color
+
+    def _draw_dungeon_default_graphics(self, framebuffer: Framebuffer, level: Level, atlas: BlockAtlas):
+        for x, y in product(range(level.width), range(level.height)):
+            self._draw_block(framebuffer, atlas, 140, x, y)
+
+        for x in range(level.width):
+            self._draw_block(framebuffer, atlas, 139, x, 0)
+
+        upper_floor_blocks = [20, 21]
+        lower_floor_blocks = [22, 23]
+
+        for x in range(level.width):
+            self._draw_block(framebuffer, atlas, upper_floor_blocks[x % 2], x, GROUND - 2)
+            self._draw_block(framebuffer, atlas, lower_floor_blocks[x % 2], x, GROUND - 1)
+
+    def _draw_desert_default_graphics(self, framebuffer: Framebuffer, level: Level, atlas: BlockAtlas):
+        for x in range(level.width):
+            self._draw_block(framebuffer, atlas, 86, x, GROUND - 1)
+
+    def _draw_ice_default_graphics(self, framebuffer: Framebuffer, level: Level, atlas: BlockAtlas):
+        for x, y in product(range(level.width), range(level.height)):
+            self._draw_block(framebuffer, atlas, 0x80, x, y)
+
+    def _draw_objects(self, framebuffer: Framebuffer, level: Level, atlas: BlockAtlas):
+        for level_object in level.get_all_objects():
+            if isinstance(level_object, EnemyObject):
+                self._draw_enemy(framebuffer, level_object)
+                continue
+
+            level_object.render()
+
+            if level_object.description.lower() in SPECIAL_BACKGROUND_OBJECTS:
+                self._draw_special_background(framebuffer, level_object, atlas)
+                continue
+
+            grid = level_object.rendered_grid
+
+            for y, x in numpy.argwhere(grid != BLANK).tolist():
+                self._draw_block(
+                    framebuffer,
+                    atlas,
+                    int(grid[y, x]),
+                    level_object.rendered_base_x + x,
+                    level_object.rendered_base_y + y,
+                    self.transparency,
+                )
+
+    def _draw_special_background(self, framebuffer: Framebuffer, level_object: LevelObject, atlas: BlockAtlas):
+        width = LEVEL_MAX_LENGTH
+        height = GROUND - level_object.y_position
+
+        block_index = level_object.blocks[0]
+
+        for x, y in product(range(width), range(height)):
+            self._draw_block(framebuffer, atlas, block_index, level_object.x_position + x, level_object.y_position + y)
+
+    def _draw_enemy(self, framebuffer: Framebuffer, enemy: EnemyObject):
+        rect = enemy.rect
+
+        for index, image in enumerate(enemy.blocks):
+            block_key = (enemy.obj_index, index)
+
+            if block_key not in self._enemy_blocks:
+                pixels = image_to_array(image)
+                mask = numpy.any(pixels != ENEMY_MASK_COLOR, axis=2)
+
+                self._enemy_blocks[block_key] = pixels, mask
+
+            pixels, mask = self._enemy_blocks[block_key]
+
+            x = rect.x() + index % enemy.width
+            y = rect.y() + index // enemy.width
+
+            _blit(framebuffer, pixels, mask, x, y)
+
+    @staticmethod
+    def _draw_block(
+        framebuffer: Framebuffer, atlas: BlockAtlas, block_index: int, x: int, y: int, transparent: bool = False
+    ):
+        opaque_pixels, pixels, mask = atlas.block(block_index)
+
+        if transparent:
+            _blit(framebuffer, pixels, mask, x, y)
+        else:
+            _blit(framebuffer, opaque_pixels, None, x, y)
+
+
+def _blit(framebuffer: Framebuffer, pixels: Framebuffer, mask, block_x: int, block_y: int):
+    """
+    Copies a block into the framebuffer at the given block position, clipping it at the framebuffer's edges.
+
+    :param mask: If given, only the pixels, where the mask is True are copied.
+    """
+    fb_height, fb_width, _ = framebuffer.shape
+
+    left, top = block_x * Block.WIDTH, block_y * Block.HEIGHT
+    right, bottom = min(left + Block.WIDTH, fb_width), min(top + Block.HEIGHT, fb_height)
+
+    if left >= fb_width or top >= fb_height or left < 0 or top < 0:
+        return
+
+    pixels = pixels[: bottom - top, : right - left]
+    target = framebuffer[top:bottom, left:right]
+
+    if mask is None:
+        target[:] = pixels
+    else:
+        mask = mask[: bottom - top, : right - left]
+        target[mask] = pixels[mask]
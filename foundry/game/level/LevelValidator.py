@@ -0,0 +1,244 @@
+"""
+Checks levels for problems, that might crash the game or make it behave unexpectedly.
+
+Every check is a rule, that is applied to a number of subjects, e. g. every jump or every enemy, or the level as a
+whole. Every rule says, which parts of the level it depends on as a whole and in which parts its subjects are, so that
+validating the level again after a change only checks the subjects, that were added or changed, e. g. the one object,
+that was moved, and keeps the warnings of all others.
+
+Nothing in here creates a widget, so the same rules can check a whole ROM from the command line.
+"""
+
+import abc
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional
+
+from foundry.game.Data import SCROLL_DIRECTIONS
+from foundry.game.ObjectDefinitions import GeneratorType
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import GROUND
+from foundry.game.level.Level import Level, LevelChange
+from smb3parse.constants import OBJ_AUTOSCROLL
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+
+class ValidationRule(abc.ABC):
+    # the parts of the level, that the results of all subjects depend on, e. g. the header, which holds the level size
+    depends_on: LevelChange = LevelChange.LEVEL_DATA
+    # the parts of the level, that the subjects are in; when they change, only new or changed subjects are checked
+    subjects_in: LevelChange = LevelChange.NOTHING
+
+    @abc.abstractmethod
+    def subjects(self, level: Level) -> Iterable:
+        """
+        Returns the things in the level, that this rule checks separately, like jumps, objects or the level itself.
+        """
+
+    @abc.abstractmethod
+    def check(self, level: Level, subject) -> List[str]:
+        """
+        :return: The warnings for the subject, if any.
+        """
+
+    def state_of(self, subject) -> Hashable:
+        """
+        Returns what the check of the subject looks at, so that it only has to be checked again, when this changed.
+        """
+        return bytes(subject.to_bytes())
+
+
+class _LevelRule(ValidationRule, abc.ABC):
+    def subjects(self, level: Level) -> Iterable:
+        return [level]
+
+    def state_of(self, subject) -> Hashable:
+        # level wide rules are only checked again, when a part of the level, that they depend on, changed
+        return None
+
+
+class _ObjectRule(ValidationRule, abc.ABC):
+    def state_of(self, subject) -> Hashable:
+        # the rect also changes, when an object is rendered again, e. g. because the ground below it moved
+        return bytes(subject.to_bytes()), subject.get_rect().getRect()
+
+
+class JumpInsideLevel(ValidationRule):
+    depends_on = LevelChange.HEADER
+    subjects_in = LevelChange.JUMPS
+
+    def subjects(self, level: Level) -> Iterable:
+        return level.jumps
+
+    def check(self, level: Level, jump) -> List[str]:
+        if not level.get_rect(1).contains(jump.get_rect(1, level.is_vertical)):
+            return [f"{jump} is outside of the level bounds."]
+
+        return []
+
+
+class JumpsNeedNextArea(_LevelRule):
+    depends_on = LevelChange.JUMPS | LevelChange.HEADER
+
+    def check(self, level: Level, _) -> List[str]:
+        if level.jumps and not level.has_next_area:
+            return ["Level has jumps set, but no Jump Destination in Level Header."]
+
+        return []
+
+
+class ObjectInsideLevel(_ObjectRule):
+    depends_on = LevelChange.HEADER
+    subjects_in = LevelChange.OBJECTS | LevelChange.ENEMIES
+
+    def subjects(self, level: Level) -> Iterable:
+        return [
+            obj
+            for obj in level.get_all_objects()
+            if not (isinstance(obj, EnemyObject) and obj.obj_index == OBJ_AUTOSCROLL)
+        ]
+
+    def check(self, level: Level, obj) -> List[str]:
+        if not level.get_rect().contains(obj.get_rect()):
+            return [f"{obj} is outside of level bounds."]
+
+        return []
+
+
+class ObjectToGroundHitsLevelBottom(_ObjectRule):
+    depends_on = LevelChange.NOTHING
+    subjects_in = LevelChange.OBJECTS
+
+    def subjects(self, level: Level) -> Iterable:
+        return level.objects
+
+    def check(self, level: Level, obj) -> List[str]:
+        if obj.object_info == (PLAINS_OBJECT_SET, 0, 0x06):
+            return []
+
+        if obj.orientation in [GeneratorType.HORIZ_TO_GROUND, GeneratorType.PYRAMID_TO_GROUND]:
+            if obj.y_position + obj.rendered_height == GROUND:
+                return [f"{obj} extends until the level bottom. This can crash the game."]
+
+        return []
+
+
+class AutoScrollItemSettings(ValidationRule):
+    depends_on = LevelChange.HEADER
+    subjects_in = LevelChange.ENEMIES
+
+    def subjects(self, level: Level) -> Iterable:
+        return [item for item in level.enemies if item.obj_index == OBJ_AUTOSCROLL]
+
+    def check(self, level: Level, item) -> List[str]:
+        warnings = []
+
+        if item.y_position >= 0x60:
+            warnings.append(f"{item}'s y-position is too low. Maximum is 95 or 0x5F.")
+
+        if level.header.scroll_type_index != 0:
+            warnings.append(
+                f"Level has auto scrolling enabled, but the scrolling type in the level header is not "
+                f"'{SCROLL_DIRECTIONS[0]}. This might not work as expected."
+            )
+
+        return warnings
+
+
+class SingleAutoScrollItem(_LevelRule):
+    depends_on = LevelChange.ENEMIES
+
+    def check(self, level: Level, _) -> List[str]:
+        if len([item for item in level.enemies if item.obj_index == OBJ_AUTOSCROLL]) > 1:
+            return ["Level has more than one AutoScrolling items. Does that work?"]
+
+        return []
+
+
+class NoCrashingObjects(_ObjectRule):
+    depends_on = LevelChange.NOTHING
+    subjects_in = LevelChange.OBJECTS
+
+    def subjects(self, level: Level) -> Iterable:
+        return level.objects
+
+    def check(self, level: Level, obj) -> List[str]:
+        if obj.description == "MSG_CRASH":
+            return [f"Object at {obj.get_position()} will likely cause the game to crash, when loading or on screen."]
+
+        return []
+
+
+def default_rules() -> List[ValidationRule]:
+    return [
+        JumpInsideLevel(),
+        JumpsNeedNextArea(),
+        ObjectInsideLevel(),
+        ObjectToGroundHitsLevelBottom(),
+        AutoScrollItemSettings(),
+        SingleAutoScrollItem(),
+        NoCrashingObjects(),
+    ]
+
+
+class _CheckedSubject(NamedTuple):
+    subject: object
+    state: Hashable
+    warnings: List[str]
+
+
+class LevelValidator:
+    def __init__(self, rules: Optional[List[ValidationRule]] = None):
+        self.rules = default_rules() if rules is None else rules
+
+        # the level, that was validated last, and for every rule the results of its subjects, by their id
+        self._level: Optional[Level] = None
+        self._results: Dict[int, Dict[int, _CheckedSubject]] = {}
+
+        # how often a subject actually had to be checked, for the statistics
+        self.checks_run = 0
+
+    def validate(self, level: Level, changes: LevelChange = LevelChange.LEVEL_DATA) -> List[str]:
+        """
+        :param changes: What changed in the level since it was last validated. Rules, that depend on it as a whole,
+            check all their subjects again, rules, whose subjects are in it, only check those, that were added or
+            changed. A level, that wasn't validated last, is always checked completely.
+
+        :return: The warnings for the level, in the order of the rules and their subjects.
+        """
+        if level is not self._level:
+            self._level = level
+            self._results.clear()
+
+        warnings = []
+
+        for rule_index, rule in enumerate(self.rules):
+            if rule_index not in self._results or rule.depends_on & changes:
+                self._results[rule_index] = self._check(level, rule, {})
+            elif rule.subjects_in & changes:
+                self._results[rule_index] = self._check(level, rule, self._results[rule_index])
+
+            for checked_subject in self._results[rule_index].values():
+                warnings.extend(checked_subject.warnings)
+
+        return warnings
+
+    def _check(
+        self, level: Level, rule: ValidationRule, last_results: Dict[int, _CheckedSubject]
+    ) -> Dict[int, _CheckedSubject]:
+        """
+        Checks the subjects of the rule, that have no result in the given ones, or changed since, and reuses the others.
+        """
+        results = {}
+
+        for subject in rule.subjects(level):
+            state = rule.state_of(subject)
+
+            checked_subject = last_results.get(id(subject))
+
+            if checked_subject is None or checked_subject.subject is not subject or checked_subject.state != state:
+                checked_subject = _CheckedSubject(subject, state, rule.check(level, subject))
+
+                self.checks_run += 1
+
+            results[id(subject)] = checked_subject
+
+        return results
@@ -0,0 +1,58 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+from PySide2.QtCore import QRect
+
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import LevelObject
+
+IndexedObject = Union[LevelObject, EnemyObject]
+
+# in blocks; a screen is 16 blocks wide, so most objects only end up in one or two cells
+CELL_SIZE = 16
+
+
+class SpatialIndex:
+    """
+    Sorts the objects of a level into a grid of cells by their rects, so that finding the objects in a rectangle, e. g.
+    the selection square, only needs to look at the objects in the cells it covers.
+
+    The index is a snapshot. It has to be created again, when objects were moved, added or removed.
+    """
+
+    def __init__(self, objects: Sequence[IndexedObject]):
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+        self._objects = list(objects)
+        self._rects = [obj.get_rect() for obj in self._objects]
+
+        for index, rect in enumerate(self._rects):
+            if rect.isNull():
+                # doesn't intersect anything
+                continue
+
+            for cell in self._cells_of(rect):
+                self._cells.setdefault(cell, []).append(index)
+
+    def intersecting(self, rect: QRect) -> List[IndexedObject]:
+        """
+        Returns the objects intersecting the given rect, in the order they were given in.
+        """
+        candidates = set()
+
+        for cell in self._cells_of(rect):
+            candidates.update(self._cells.get(cell, []))
+
+        return [self._objects[index] for index in sorted(candidates) if rect.intersects(self._rects[index])]
+
+    @staticmethod
+    def _cells_of(rect: QRect) -> List[Tuple[int, int]]:
+        # QRect.intersects() also works with rects, that are not normalized, e. g. a selection square drawn from right
+        # to left, so the cells are taken from their corners, whatever order they are in
+        left, right = sorted((rect.left(), rect.right()))
+        top, bottom = sorted((rect.top(), rect.bottom()))
+
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(left // CELL_SIZE, right // CELL_SIZE + 1)
+            for cell_y in range(top // CELL_SIZE, bottom // CELL_SIZE + 1)
+        ]
@@ -1,4 +1,7 @@
+from typing import Dict
+
 from PySide2.QtCore import QPoint, QSize
+from PySide2.QtGui import QPainter, QPixmap
 
 from foundry.game.File import ROM
 from foundry.game.gfx.Palette import load_palette_group
@@ -36,50 +39,102 @@ class WorldMap(LevelLike):
 
         self.objects = []
 
-        self._load_objects()
+        # tiles with the same index look the same, so every block only has to be decoded once
+        self._blocks: Dict[int, Block] = {}
+
+        # the whole map, as drawn at a zoom level; cleared, whenever the layout or any object on it changes
+        self._rendered_maps: Dict[int, QPixmap] = {}
+
+        self._load_objects(self._internal_world_map.layout_bytes)
 
         self._calc_size()
 
-    def _load_objects(self):
+    def _load_objects(self, layout_bytes: bytes):
+        """
+        Creates a map object for every tile of the layout, which goes through the screens one at a time, one row at a
+        time.
+        """
         self.objects.clear()
+        self._layout_changed()
 
-        for index, world_position in enumerate(self._internal_world_map.gen_positions()):
+        for index, tile in enumerate(layout_bytes):
             screen_offset = (index // WORLD_MAP_SCREEN_SIZE) * WORLD_MAP_SCREEN_WIDTH
 
             x = screen_offset + (index % WORLD_MAP_SCREEN_WIDTH)
             y = (index // WORLD_MAP_SCREEN_WIDTH) % WORLD_MAP_HEIGHT
 
-            block = Block(world_position.tile(), self.palette_group, self.graphics_set, self.tsa_data)
-
-            self.objects.append(MapObject(block, x, y))
+            self.objects.append(MapObject(self._block(tile), x, y, self._layout_changed))
 
         assert len(self.objects) % WORLD_MAP_HEIGHT == 0
 
+    def _block(self, tile: int) -> Block:
+        if tile not in self._blocks:
+            self._blocks[tile] = Block(tile, self.palette_group, self.graphics_set, self.tsa_data)
+
+        return self._blocks[tile]
+
     def _calc_size(self):
         self.width = len(self.objects) // WORLD_MAP_HEIGHT
         self.height = WORLD_MAP_HEIGHT
 
         self.size = self.width, self.height
 
+    def _layout_changed(self):
+        self._rendered_maps.clear()
+
     def add_object(self, obj, _):
+        obj.on_change = self._layout_changed
+
         self.objects.append(obj)
 
         self.objects.sort(key=self._array_index)
 
+        self._layout_changed()
+
     @property
     def q_size(self):
         return QSize(*self.size) * Block.SIDE_LENGTH
 
     @staticmethod
     def _array_index(obj):
-        return obj.y_position * WORLD_MAP_SCREEN_WIDTH + obj.x_position
+        screen, column = divmod(obj.x_position, WORLD_MAP_SCREEN_WIDTH)
+
+        return screen * WORLD_MAP_SCREEN_SIZE + obj.y_position * WORLD_MAP_SCREEN_WIDTH + column
 
     def get_object_names(self):
         return [obj.name for obj in self.objects]
 
     def draw(self, dc, zoom, transparency=None, show_expansion=None):
+        dc.drawPixmap(0, 0, self.rendered_map(zoom))
+
+        # selected objects look different, so they are drawn over the rendered map
         for obj in self.objects:
-            obj.draw(dc, Block.SIDE_LENGTH * zoom, transparency)
+            if obj.selected:
+                obj.draw(dc, Block.SIDE_LENGTH * zoom, transparency)
+
+    def rendered_map(self, zoom: int) -> QPixmap:
+        """
+        Returns the whole map drawn at the given zoom level, without any objects being selected. It is only drawn
+        again, after the layout or an object on it changed.
+        """
+        if zoom not in self._rendered_maps:
+            pixmap = QPixmap(self.q_size * zoom)
+
+            painter = QPainter(pixmap)
+
+            for obj in self.objects:
+                obj.block.draw(
+                    painter,
+                    obj.x_position * Block.SIDE_LENGTH * zoom,
+                    obj.y_position * Block.SIDE_LENGTH * zoom,
+                    block_length=Block.SIDE_LENGTH * zoom,
+                )
+
+            painter.end()
+
+            self._rendered_maps[zoom] = pixmap
+
+        return self._rendered_maps[zoom]
 
     def index_of(self, obj):
         return self.objects.index(obj)
@@ -120,6 +175,10 @@ class WorldMap(LevelLike):
     def remove_object(self, obj):
         self.objects.remove(obj)
 
+        obj.on_change = None
+
+        self._layout_changed()
+
     def level_at_position(self, x: int, y: int):
         screen = x // WORLD_MAP_SCREEN_WIDTH + 1
 
@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
 
 from foundry import data_dir
 from foundry.game.Data import Mario3Level
@@ -8,6 +9,34 @@ EnemyItemData = Tuple[int, bytearray]
 LevelByteData = Tuple[ObjectData, EnemyItemData]
 
 
+class LevelList(NamedTuple):
+    offsets: List[Mario3Level]
+    world_indexes: List[int]
+    sorted_offsets: List[Mario3Level]
+
+
+@lru_cache(maxsize=None)
+def level_list() -> LevelList:
+    """
+    Returns the levels listed in levels.dat, reading the file the first time they are needed.
+    """
+    offsets, world_indexes = _load_level_offsets()
+
+    return LevelList(offsets, world_indexes, sorted(offsets, key=lambda level: level.rom_level_offset))
+
+
+class _LevelListAttribute:
+    """
+    Gives access to one of the attributes of the level list on a class, without reading levels.dat on import.
+    """
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+
+    def __get__(self, instance, owner):
+        return getattr(level_list(), self.attribute)
+
+
 def _load_level_offsets() -> Tuple[List[Mario3Level], List[int]]:
     offsets = [Mario3Level(0, 0, 0, 0, 0, "Placeholder")]
     world_indexes = [0]
@@ -0,0 +1,30 @@
+import pytest
+
+from foundry.game.level.ClipboardData import ClipboardData, CopiedObject
+
+
+def test_round_trip():
+    # GIVEN copied objects of every kind
+    clipboard_data = ClipboardData(
+        [
+            CopiedObject(False, 1, 0x35, 10, 20, None),
+            CopiedObject(False, 0, 0x0A, 300, 5, 0x12),
+            CopiedObject(True, 0, 0x72, -3, 24, None),
+        ],
+        (0, 5),
+    )
+
+    # WHEN they are turned into bytes and back
+    data = clipboard_data.to_bytes()
+
+    # THEN nothing changed
+    assert ClipboardData.from_bytes(data) == clipboard_data
+
+
+@pytest.mark.parametrize("data", [b"", b"not clipboard data", ClipboardData([], (0, 0)).to_bytes() + b"\x00"])
+def test_unknown_data(data):
+    # GIVEN data, that was not made by the editor
+    # WHEN reading it
+    # THEN it is rejected
+    with pytest.raises(ValueError):
+        ClipboardData.from_bytes(data)
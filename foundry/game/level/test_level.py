@@ -3,7 +3,9 @@ import pytest
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
-from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT
+from foundry.game.level.ClipboardData import ClipboardData
+from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT, LevelChange, changes_between
+from foundry.game.level.LevelRef import LevelRef
 
 
 @pytest.mark.parametrize(
@@ -94,3 +96,86 @@ def test_level_insert_in_vertical_level(level):
     assert added_object.obj_index == object_index
     assert added_object.rendered_base_x == x
     assert added_object.rendered_base_y == y
+
+
+def test_paste_objects_at(level):
+    # GIVEN some objects of a level, copied to the clipboard
+    copied_objects = level.objects[:5] + level.enemies[:2]
+
+    clipboard_data = ClipboardData.from_objects(copied_objects)
+
+    object_count = len(level.objects)
+    enemy_count = len(level.enemies)
+
+    emitted_signals = []
+    level.data_changed.connect(lambda: emitted_signals.append(None))
+
+    # WHEN they are pasted further to the right
+    origin_x, origin_y = clipboard_data.origin
+
+    pasted_objects = level.paste_objects_at(clipboard_data, origin_x + 20, origin_y)
+
+    # THEN they were added to the end of the level, keeping their distance to each other
+    assert pasted_objects == level.objects[object_count:] + level.enemies[enemy_count:]
+    assert len(pasted_objects) == len(copied_objects)
+
+    for original, pasted in zip(copied_objects[:5], pasted_objects[:5]):
+        assert pasted.get_position() == (original.x_position + 20, original.y_position)
+        assert pasted.obj_index == original.obj_index
+
+    # THEN the level only notified about it once
+    assert len(emitted_signals) == 1
+
+
+def test_batch_changes(level):
+    # GIVEN a level and a listener, that records what changed
+    received_changes = []
+    level.level_changed.connect(received_changes.append)
+
+    # WHEN several changes are made in a batch, some of them in a nested one
+    with level.batch_changes():
+        level.add_jump()
+
+        with level.batch_changes():
+            level.notify_change(LevelChange.OBJECTS)
+
+        level.remove_jump(level.jumps[-1])
+
+        # THEN nothing is notified, while the batch is still going on
+        assert received_changes == []
+
+    # THEN the listener is notified once about all of them
+    assert received_changes == [LevelChange.JUMPS | LevelChange.OBJECTS]
+
+
+def test_changes_between(level):
+    # GIVEN the data of a level
+    old_data = level.to_bytes()
+
+    # WHEN an enemy is moved
+    level.enemies[0].x_position += 1
+
+    # THEN only the enemies changed
+    assert changes_between(old_data, level.to_bytes()) == LevelChange.ENEMIES
+
+    # WHEN nothing is changed
+    # THEN nothing changed
+    assert changes_between(level.to_bytes(), level.to_bytes()) == LevelChange.NOTHING
+
+
+def test_undo_only_reports_what_changed(level):
+    # GIVEN a level, in which an enemy was moved and saved as an undoable step
+    level_ref = LevelRef()
+    level_ref.set_level(level)
+
+    level.enemies[0].x_position += 1
+    level_ref.save_level_state()
+
+    received_changes = []
+    level_ref.level_changed.connect(received_changes.append)
+
+    # WHEN the move is undone
+    level_ref.undo()
+
+    # THEN only the enemies and the history are reported as changed, not the header, that was loaded again
+    assert received_changes == [LevelChange.ENEMIES | LevelChange.HISTORY]
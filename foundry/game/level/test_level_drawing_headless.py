@@ -0,0 +1,48 @@
+"""
+Headless counterpart to test_level_drawing. Levels are rendered with the LevelRenderer and compared against their
+references by hash, so no display is needed. Run it across multiple processes with pytest-xdist, e. g. "-n auto".
+
+The references are not made by the GUI, so they differ from test_refs in the editor overlays. Generate them with the
+original ROM, by running this module once with SMB3_UPDATE_REFS=1. Until then, the module is skipped.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from foundry.batch_render import LEVEL_JOB, list_render_jobs
+from foundry.conftest import UPDATE_REFERENCES, compare_framebuffer
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelRenderer import LevelRenderer
+
+reference_image_dir = Path(__file__).parent.joinpath("test_refs_headless")
+
+pytestmark = pytest.mark.skipif(
+    not reference_image_dir.exists() and not UPDATE_REFERENCES,
+    reason=f"No ref images were made in {reference_image_dir}. Set SMB3_UPDATE_REFS=1 to save them.",
+)
+
+level_jobs = [job for job in list_render_jobs() if job.kind == LEVEL_JOB]
+
+level_data = []
+test_name = []
+
+for job in level_jobs:
+    level_data.append((job, False))
+    level_data.append((job, True))
+
+    test_name.append(f"{job.name}, no transparency")
+    test_name.append(job.name)
+
+_renderers = {False: LevelRenderer(transparency=False), True: LevelRenderer(transparency=True)}
+
+
+@pytest.mark.parametrize("level_info", level_data, ids=test_name)
+def test_level(level_info):
+    job, transparent = level_info
+
+    framebuffer = _renderers[transparent].render(Level(*job.arguments))
+
+    image_name = job.file_name if transparent else job.file_name.replace(".png", " no transparency.png")
+
+    compare_framebuffer(image_name, reference_image_dir / image_name, framebuffer)
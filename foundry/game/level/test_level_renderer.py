@@ -0,0 +1,84 @@
+import numpy
+import pytest
+from PySide2.QtGui import QImage, QPainter
+
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.LevelRenderer import LevelRenderer, image_to_array, save_png
+from foundry.gui.LevelDrawer import LevelDrawer
+from smb3parse.levels.world_map import WorldMap as _WorldMap
+
+
+def _draw_with_level_drawer(level, transparency) -> numpy.ndarray:
+    drawer = LevelDrawer()
+    drawer.transparency = transparency
+
+    # the headless renderer does not draw any editor overlays
+    drawer.draw_jumps_on_objects = False
+    drawer.draw_items_in_blocks = False
+    drawer.draw_invisible_items = False
+    drawer.draw_autoscroll = False
+
+    image = QImage(level.get_rect(Block.SIDE_LENGTH).size(), QImage.Format_RGB888)
+
+    painter = QPainter(image)
+    drawer.draw(painter, level)
+    painter.end()
+
+    return image_to_array(image)
+
+
+@pytest.mark.parametrize("transparency", [False, True])
+def test_render_matches_level_drawer(level, transparency):
+    # GIVEN a level and a headless renderer
+    renderer = LevelRenderer(transparency=transparency)
+
+    # WHEN the level is rendered
+    framebuffer = renderer.render(level)
+
+    # THEN it looks the same, as when drawn by the LevelDrawer
+    assert framebuffer.shape == (level.height * Block.HEIGHT, level.width * Block.WIDTH, 3)
+    assert framebuffer.dtype == numpy.uint8
+
+    assert numpy.array_equal(framebuffer, _draw_with_level_drawer(level, transparency))
+
+
+def test_render_scaled(level):
+    # GIVEN a level and a renderer with a block length of double the normal size
+    renderer = LevelRenderer(block_length=2 * Block.SIDE_LENGTH)
+
+    # WHEN the level is rendered
+    framebuffer = renderer.render(level)
+
+    # THEN every pixel of the normal sized rendering is scaled up by two
+    normal_framebuffer = LevelRenderer().render(level)
+
+    assert numpy.array_equal(framebuffer[::2, ::2], normal_framebuffer)
+
+
+def test_invalid_block_length():
+    with pytest.raises(ValueError):
+        LevelRenderer(block_length=Block.SIDE_LENGTH + 1)
+
+
+def test_save_png(level, tmp_path):
+    # GIVEN a rendered level
+    framebuffer = LevelRenderer().render(level)
+
+    # WHEN it is saved as a PNG
+    png_path = tmp_path / "level.png"
+
+    assert save_png(framebuffer, png_path)
+
+    # THEN the saved file has the same pixels
+    assert numpy.array_equal(image_to_array(QImage(str(png_path))), framebuffer)
+
+
+def test_render_world_map(rom):
+    # GIVEN the first world map
+    world_map = _WorldMap.from_world_number(rom, 1)
+
+    # WHEN it is rendered
+    framebuffer = LevelRenderer().render_world_map(world_map)
+
+    # THEN the framebuffer has the size of the world map
+    assert framebuffer.shape == (world_map.height * Block.HEIGHT, world_map.width * Block.WIDTH, 3)
@@ -0,0 +1,84 @@
+from foundry.conftest import level_1_2_enemy_address, level_1_2_object_address
+from foundry.game.level.Level import Level, LevelChange
+from foundry.game.level.LevelValidator import LevelValidator
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+
+def test_validating_unchanged_level_runs_no_checks(level):
+    # GIVEN a level, that was validated once
+    validator = LevelValidator()
+
+    warnings = validator.validate(level)
+    checks_run = validator.checks_run
+
+    # WHEN it is validated again, without changes
+    assert validator.validate(level, LevelChange.NOTHING) == warnings
+
+    # THEN nothing had to be checked again
+    assert validator.checks_run == checks_run
+
+
+def test_moving_object_only_checks_it(level):
+    # GIVEN a level, that was validated once
+    validator = LevelValidator()
+
+    warnings = validator.validate(level)
+    checks_run = validator.checks_run
+
+    # WHEN a single object is moved
+    level.objects[0].move_by(1, 0)
+
+    # THEN only the rules checking objects one by one check it again and nothing else, with the same result
+    assert validator.validate(level, LevelChange.OBJECTS) == warnings
+
+    object_rules = [rule for rule in validator.rules if rule.subjects_in & LevelChange.OBJECTS]
+
+    assert 0 < len(object_rules) < len(validator.rules)
+    assert validator.checks_run - checks_run == len(object_rules)
+
+
+def test_header_change_checks_every_object(level):
+    # GIVEN a level, that was validated once
+    validator = LevelValidator()
+
+    validator.validate(level)
+    checks_run = validator.checks_run
+
+    # WHEN the header changes, e. g. the size of the level
+    validator.validate(level, LevelChange.HEADER)
+
+    # THEN every object is checked again by the rules, that depend on the size of the level
+    assert validator.checks_run - checks_run >= len(level.get_all_objects())
+
+
+def test_object_outside_of_level_is_reported(level):
+    # GIVEN a validated level
+    validator = LevelValidator()
+
+    assert not any("outside of level bounds" in warning for warning in validator.validate(level))
+
+    # WHEN an object is moved outside of it
+    level.objects[0].set_position(level.width + 10, 0)
+
+    # THEN the validator warns about it
+    assert any("outside of level bounds" in warning for warning in validator.validate(level, LevelChange.OBJECTS))
+
+
+def test_other_level_is_checked_completely(level):
+    # GIVEN a validator, that validated a level
+    validator = LevelValidator()
+
+    validator.validate(level)
+
+    # WHEN a different level is validated, even without reporting a change
+    other_level = Level("Level 1-2", level_1_2_object_address, level_1_2_enemy_address, PLAINS_OBJECT_SET)
+
+    checks_run = validator.checks_run
+
+    warnings = validator.validate(other_level, LevelChange.NOTHING)
+
+    # THEN it is checked as completely as by a new validator
+    new_validator = LevelValidator()
+
+    assert warnings == new_validator.validate(other_level)
+    assert validator.checks_run - checks_run == new_validator.checks_run
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+from PySide2.QtCore import QRect
+
+from foundry.game.level.SpatialIndex import SpatialIndex
+
+
+class _FakeObject:
+    def __init__(self, rect: QRect):
+        self.rect = rect
+
+    def get_rect(self):
+        return self.rect
+
+
+def _random_rect():
+    return QRect(random.randint(0, 200), random.randint(0, 27), random.randint(0, 20), random.randint(0, 5))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_same_as_checking_every_object(seed):
+    # GIVEN randomly placed objects and an index of them
+    random.seed(seed)
+
+    objects = [_FakeObject(_random_rect()) for _ in range(100)]
+
+    spatial_index = SpatialIndex(objects)
+
+    for _ in range(20):
+        # WHEN looking for the objects in a rect, that might have been drawn from right to left
+        start_x, start_y = random.randint(0, 200), random.randint(0, 27)
+        end_x, end_y = random.randint(0, 200), random.randint(0, 27)
+
+        rect = QRect(start_x, start_y, end_x - start_x + 1, end_y - start_y + 1)
+
+        # THEN the same objects are found, as when checking all of them, in the same order
+        assert spatial_index.intersecting(rect) == [obj for obj in objects if rect.intersects(obj.get_rect())]
+
+
+def test_empty_objects_are_never_found():
+    # GIVEN an object without a size
+    obj = _FakeObject(QRect(5, 5, 0, 0))
+
+    spatial_index = SpatialIndex([obj])
+
+    # WHEN looking at the whole area around it
+    # THEN it is not found
+    assert spatial_index.intersecting(QRect(0, 0, 20, 20)) == []
@@ -0,0 +1,60 @@
+import pytest
+
+from foundry.game import ObjectDefinitions
+from foundry.game.ObjectDefinitions import (
+    compile_object_definitions,
+    load_object_definition_tables,
+    load_object_definitions,
+    object_definition_tables,
+)
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+
+def test_load_object_definitions_is_lookup():
+    # WHEN the definitions of an object set are loaded twice
+    # THEN the same, shared table is returned both times
+    assert load_object_definitions(PLAINS_OBJECT_SET) is load_object_definitions(PLAINS_OBJECT_SET)
+
+
+def test_definitions_are_immutable():
+    definition = load_object_definitions(PLAINS_OBJECT_SET)[0]
+
+    with pytest.raises(AttributeError):
+        definition.bmp_width = 5
+
+    with pytest.raises(TypeError):
+        definition.rom_object_design[0] = 5
+
+
+def test_cache(tmp_path, monkeypatch):
+    # GIVEN an empty cache directory
+    monkeypatch.setattr(ObjectDefinitions, "cache_dir", tmp_path)
+
+    # WHEN the tables are loaded
+    tables = load_object_definition_tables()
+
+    # THEN they were compiled and saved in the cache
+    assert tables == object_definition_tables()
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    # WHEN they are loaded again
+    # THEN they come out of the cache and do not need to be compiled
+    monkeypatch.setattr(ObjectDefinitions, "compile_object_definitions", None)
+
+    assert load_object_definition_tables() == tables
+
+
+def test_cache_invalidated(tmp_path, monkeypatch):
+    # GIVEN a cache of the current tables
+    monkeypatch.setattr(ObjectDefinitions, "cache_dir", tmp_path)
+
+    load_object_definition_tables()
+
+    # WHEN the data files change
+    monkeypatch.setattr(ObjectDefinitions, "CACHE_VERSION", ObjectDefinitions.CACHE_VERSION + 1)
+
+    tables = load_object_definition_tables()
+
+    # THEN the tables are compiled anew and the old cache is removed
+    assert tables == compile_object_definitions()
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
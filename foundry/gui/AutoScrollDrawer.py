@@ -1,5 +1,7 @@
-from PySide2.QtCore import QPoint, QPointF, QRectF, QSizeF
-from PySide2.QtGui import QBrush, QPainter, QPen, QPolygonF, Qt
+from typing import Dict, List, NamedTuple, Tuple
+
+from PySide2.QtCore import QLineF, QPoint, QPointF, QRectF, QSizeF
+from PySide2.QtGui import QBrush, QPainter, QPen, QPolygonF, QTransform, Qt
 
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable.Block import Block
@@ -26,81 +28,85 @@ WATER_LEVEL_SCROLL = 5
 _ASCROLL_SCREEN_HEIGHT = 12
 
 
-class AutoScrollDrawer:
-    def __init__(self, auto_scroll_row: int, level: Level):
-        self.auto_scroll_row = auto_scroll_row
-        self.level = level
+class AutoScrollSegment(NamedTuple):
+    """
+    The movement of the screen during one movement command, in level pixels.
+    """
 
-        self.current_pos = QPointF()
-        self.horizontal_speed = 0
-        self.vertical_speed = 0
+    is_acceleration: bool
+    start: QPointF
+    lines: List[QLineF]
 
-        self.rom = ROM()
 
-        self.pixel_length = 1
+class AutoScrollPath(NamedTuple):
+    """
+    The simulated movement of the screen during an auto scroll, in level pixels, i. e. at a block length of 16.
+    """
 
-        self.acceleration_pen = Qt.NoPen
-        self.acceleration_brush = Qt.NoBrush
-        self.scroll_pen = Qt.NoPen
-        self.scroll_brush = Qt.NoBrush
+    segments: List[AutoScrollSegment]
+    end: QPointF
+    screen_polygon: QPolygonF
 
-        self.screen_polygon = QPolygonF()
+    # address and value of every ROM byte the path was simulated from
+    rom_bytes: Dict[int, int]
 
-    def draw(self, painter: QPainter, block_length: int):
-        self.pixel_length = block_length / Block.WIDTH
+    def matches_rom(self, rom: ROM) -> bool:
+        return all(rom.int(address) == value for address, value in self.rom_bytes.items())
 
-        self.scroll_brush = QBrush(Qt.blue)
-        self.scroll_pen = QPen(self.scroll_brush, 2 * self.pixel_length)
 
-        self.acceleration_brush = QBrush(Qt.red)
-        self.acceleration_pen = QPen(self.acceleration_brush, 2 * self.pixel_length)
+# simulated paths by auto scroll row and start position
+_path_cache: Dict[Tuple[int, int], AutoScrollPath] = {}
 
-        painter.setPen(self.scroll_pen)
-        painter.setBrush(self.scroll_brush)
 
-        auto_scroll_type_index = self.auto_scroll_row >> 4
-        auto_scroll_routine_index = self.auto_scroll_row & 0b0001_1111
+def clear_auto_scroll_path_cache():
+    """
+    Forgets all simulated paths. Cached paths are also checked against the ROM before use, so this is only necessary
+    to free the memory, e. g. when a different ROM is loaded.
+    """
+    _path_cache.clear()
 
-        if auto_scroll_type_index in [
-            SPIKE_CEILING_SCROLL,
-            UP_TIL_DOOR_SCROLL,
-            WATER_LEVEL_SCROLL,
-            UP_RIGHT_DIAG_SCROLL,
-        ]:
-            # not visualized
-            return
-        elif auto_scroll_type_index not in [HORIZONTAL_SCROLL_0, HORIZONTAL_SCROLL_1]:
-            # illegal value, those appear in the vanilla ROM, though; so error out
-            return
 
-        first_movement_command_index = (self.rom.int(AScroll_HorizontalInitMove + auto_scroll_routine_index) + 1) % 256
-        last_movement_command_index = (self.rom.int(AScroll_HorizontalInitMove + auto_scroll_routine_index + 1)) % 256
+class _AutoScrollSimulation:
+    """
+    Follows the movement commands of an auto scroll routine, like the game does, remembering every ROM byte it read.
+    """
 
+    def __init__(self, auto_scroll_routine_index: int, start: QPointF):
+        self.auto_scroll_routine_index = auto_scroll_routine_index
+
+        self.rom = ROM()
+        self.rom_bytes: Dict[int, int] = {}
+
+        self.current_pos = QPointF(start)
         self.horizontal_speed = 0
         self.vertical_speed = 0
 
-        self.current_pos = self._determine_auto_scroll_start(block_length)
+        self.segments: List[AutoScrollSegment] = []
+        self.screen_polygon = QPolygonF()
 
-        for movement_command_index in range(first_movement_command_index, last_movement_command_index + 1):
+    def _read(self, address: int) -> int:
+        value = self.rom.int(address)
 
-            movement_command = self.rom.int(AScroll_Movement + movement_command_index)
-            movement_repeat = self.rom.int(AScroll_MovementRepeat + movement_command_index)
+        self.rom_bytes[address] = value
 
-            self._execute_movement_command(painter, movement_command, movement_repeat)
+        return value
 
-        stop_marker = QRectF(QPoint(0, 0), QSizeF(10, 10) * self.pixel_length)
-        stop_marker.moveCenter(self.current_pos)
+    def run(self) -> AutoScrollPath:
+        init_move_offset = AScroll_HorizontalInitMove + self.auto_scroll_routine_index
 
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(stop_marker)
+        first_movement_command_index = (self._read(init_move_offset) + 1) % 256
+        last_movement_command_index = (self._read(init_move_offset + 1)) % 256
 
-        painter.setPen(self.scroll_pen)
-        painter.setBrush(self.scroll_brush)
+        for movement_command_index in range(first_movement_command_index, last_movement_command_index + 1):
 
-        painter.setOpacity(0.2)
-        painter.drawPolygon(self.screen_polygon)
+            movement_command = self._read(AScroll_Movement + movement_command_index)
+            movement_repeat = self._read(AScroll_MovementRepeat + movement_command_index)
+
+            self._execute_movement_command(movement_command, movement_repeat)
 
-    def _execute_movement_command(self, painter: QPainter, command: int, repeat: int):
+        return AutoScrollPath(self.segments, QPointF(self.current_pos), self.screen_polygon, self.rom_bytes)
+
+    def _execute_movement_command(self, command: int, repeat: int):
         h_updates_per_tick = 4  # got those by reading the auto scroll routine
         v_updates_per_tick = 2
 
@@ -114,8 +120,8 @@ class AutoScrollDrawer:
             assert h_acceleration_index != 3
             assert v_acceleration_index != 3
 
-            h_acceleration = self.rom.int(AScroll_VelAccel + h_acceleration_index)
-            v_acceleration = self.rom.int(AScroll_VelAccel + v_acceleration_index)
+            h_acceleration = self._read(AScroll_VelAccel + h_acceleration_index)
+            v_acceleration = self._read(AScroll_VelAccel + v_acceleration_index)
 
             if h_acceleration == 0xFF:
                 h_acceleration = -0x01
@@ -135,57 +141,45 @@ class AutoScrollDrawer:
 
             if auto_scroll_loop_selector in [0, 1]:
                 # normal movement command
-                movement_ticks = self.rom.int(loop_start_offset)
+                movement_ticks = self._read(loop_start_offset)
 
                 h_acceleration = 0
                 v_acceleration = 0
             else:
                 # loop command
-                movement_loop_start_index = self.rom.int(loop_start_offset)
-                movement_loop_end_index = self.rom.int(loop_start_offset + 1)
+                movement_loop_start_index = self._read(loop_start_offset)
+                movement_loop_end_index = self._read(loop_start_offset + 1)
 
-                number_of_commands = movement_loop_end_index - movement_loop_start_index
+                movement_loop_indexes = range(movement_loop_start_index, movement_loop_end_index)
 
-                movement_loop_commands = self.rom.read(
-                    AScroll_MovementLoop + movement_loop_start_index, number_of_commands
-                )
-                movement_loop_repeats = self.rom.read(
-                    AScroll_MovementLoopTicks + movement_loop_start_index, number_of_commands
-                )
+                movement_loop_commands = [self._read(AScroll_MovementLoop + i) for i in movement_loop_indexes]
+                movement_loop_repeats = [self._read(AScroll_MovementLoopTicks + i) for i in movement_loop_indexes]
 
                 for _ in range(repeat):
                     for sub_command, sub_repeat in zip(movement_loop_commands, movement_loop_repeats):
-                        self._execute_movement_command(painter, sub_command, sub_repeat)
+                        self._execute_movement_command(sub_command, sub_repeat)
 
                 return
 
-        if is_acceleration_command and (h_acceleration or v_acceleration):
-            painter.setPen(self.acceleration_pen)
-            painter.setBrush(self.acceleration_brush)
-        else:
-            painter.setPen(self.scroll_pen)
-            painter.setBrush(self.scroll_brush)
+        is_accelerating = is_acceleration_command and bool(h_acceleration or v_acceleration)
 
-        # circle at start of new command
-        painter.drawEllipse(self.current_pos, 4 * self.pixel_length, 4 * self.pixel_length)
+        # a circle is drawn at the start of every command
+        segment = AutoScrollSegment(is_accelerating, QPointF(self.current_pos), [])
+        self.segments.append(segment)
 
         self._add_points_for_position(self.current_pos)
 
-        if is_acceleration_command and (h_acceleration or v_acceleration):
+        if is_accelerating:
             for _ in range(movement_ticks):
                 self.horizontal_speed += h_acceleration
                 self.vertical_speed += v_acceleration
 
-                old_pos = self.current_pos
-
-                self.current_pos += (
-                    QPointF(
-                        h_updates_per_tick * self.horizontal_speed / 256, v_updates_per_tick * self.vertical_speed / 256
-                    )
-                    * self.pixel_length
+                self.current_pos += QPointF(
+                    h_updates_per_tick * self.horizontal_speed / 256, v_updates_per_tick * self.vertical_speed / 256
                 )
 
-                painter.drawLine(old_pos, self.current_pos)
+                # marks every tick with a dot, so the distance between them shows the change in speed
+                segment.lines.append(QLineF(self.current_pos, self.current_pos))
                 self._add_points_for_position(self.current_pos)
         else:
             old_pos = QPointF(self.current_pos)
@@ -193,9 +187,9 @@ class AutoScrollDrawer:
             h_movement = h_updates_per_tick * self.horizontal_speed / 256 * movement_ticks * repeat
             v_movement = v_updates_per_tick * self.vertical_speed / 256 * movement_ticks * repeat
 
-            self.current_pos += QPointF(h_movement, v_movement) * self.pixel_length
+            self.current_pos += QPointF(h_movement, v_movement)
 
-            painter.drawLine(old_pos, self.current_pos)
+            segment.lines.append(QLineF(old_pos, self.current_pos))
 
             self._add_points_for_line(old_pos, self.current_pos)
 
@@ -221,19 +215,106 @@ class AutoScrollDrawer:
 
         self.screen_polygon = self.screen_polygon.united(QPolygonF.fromList(point_list))
 
-    def _rect_for_point(self, pos: QPointF):
-        top_right = pos + QPointF(SCREEN_WIDTH // 2, -_ASCROLL_SCREEN_HEIGHT // 2) * self.pixel_length * Block.WIDTH
-        bottom_right = pos + QPoint(SCREEN_WIDTH // 2, _ASCROLL_SCREEN_HEIGHT // 2) * self.pixel_length * Block.WIDTH
+    @staticmethod
+    def _rect_for_point(pos: QPointF):
+        top_right = pos + QPointF(SCREEN_WIDTH // 2, -_ASCROLL_SCREEN_HEIGHT // 2) * Block.WIDTH
+        bottom_right = pos + QPoint(SCREEN_WIDTH // 2, _ASCROLL_SCREEN_HEIGHT // 2) * Block.WIDTH
 
-        top_left = top_right - QPointF(SCREEN_WIDTH, 0) * self.pixel_length * Block.WIDTH
-        bottom_left = bottom_right - QPointF(SCREEN_WIDTH, 0) * self.pixel_length * Block.WIDTH
+        top_left = top_right - QPointF(SCREEN_WIDTH, 0) * Block.WIDTH
+        bottom_left = bottom_right - QPointF(SCREEN_WIDTH, 0) * Block.WIDTH
 
         return top_left, top_right, bottom_right, bottom_left
 
-    def _determine_auto_scroll_start(self, block_length: int) -> QPointF:
+
+def auto_scroll_path(auto_scroll_routine_index: int, start_y: int) -> AutoScrollPath:
+    """
+    Returns the path of the given horizontal auto scroll routine, simulating it only, if it wasn't simulated before or
+    the ROM bytes it depends on changed since then.
+
+    :param auto_scroll_routine_index: The lower bits of the auto scroll row.
+    :param start_y: The row, the center of the screen starts in.
+    """
+    cache_key = (auto_scroll_routine_index, start_y)
+
+    if cache_key not in _path_cache or not _path_cache[cache_key].matches_rom(ROM()):
+        start = QPointF(SCREEN_WIDTH // 2, start_y) * Block.WIDTH
+
+        _path_cache[cache_key] = _AutoScrollSimulation(auto_scroll_routine_index, start).run()
+
+    return _path_cache[cache_key]
+
+
+class AutoScrollDrawer:
+    def __init__(self, auto_scroll_row: int, level: Level):
+        self.auto_scroll_row = auto_scroll_row
+        self.level = level
+
+        self.pixel_length = 1
+
+        self.acceleration_pen = Qt.NoPen
+        self.acceleration_brush = Qt.NoBrush
+        self.scroll_pen = Qt.NoPen
+        self.scroll_brush = Qt.NoBrush
+
+    def draw(self, painter: QPainter, block_length: int):
+        self.pixel_length = block_length / Block.WIDTH
+
+        self.scroll_brush = QBrush(Qt.blue)
+        self.scroll_pen = QPen(self.scroll_brush, 2 * self.pixel_length)
+
+        self.acceleration_brush = QBrush(Qt.red)
+        self.acceleration_pen = QPen(self.acceleration_brush, 2 * self.pixel_length)
+
+        painter.setPen(self.scroll_pen)
+        painter.setBrush(self.scroll_brush)
+
+        auto_scroll_type_index = self.auto_scroll_row >> 4
+        auto_scroll_routine_index = self.auto_scroll_row & 0b0001_1111
+
+        if auto_scroll_type_index in [
+            SPIKE_CEILING_SCROLL,
+            UP_TIL_DOOR_SCROLL,
+            WATER_LEVEL_SCROLL,
+            UP_RIGHT_DIAG_SCROLL,
+        ]:
+            # not visualized
+            return
+        elif auto_scroll_type_index not in [HORIZONTAL_SCROLL_0, HORIZONTAL_SCROLL_1]:
+            # illegal value, those appear in the vanilla ROM, though; so error out
+            return
+
+        path = auto_scroll_path(auto_scroll_routine_index, self._determine_auto_scroll_start_y())
+
+        # the path is simulated at a block length of 16, so only needs to be scaled to the current one
+        transform = QTransform.fromScale(self.pixel_length, self.pixel_length)
+
+        for segment in path.segments:
+            if segment.is_acceleration:
+                painter.setPen(self.acceleration_pen)
+                painter.setBrush(self.acceleration_brush)
+            else:
+                painter.setPen(self.scroll_pen)
+                painter.setBrush(self.scroll_brush)
+
+            # circle at start of new command
+            painter.drawEllipse(transform.map(segment.start), 4 * self.pixel_length, 4 * self.pixel_length)
+
+            painter.drawLines([transform.map(line) for line in segment.lines])
+
+        stop_marker = QRectF(QPoint(0, 0), QSizeF(10, 10) * self.pixel_length)
+        stop_marker.moveCenter(transform.map(path.end))
+
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(stop_marker)
+
+        painter.setPen(self.scroll_pen)
+        painter.setBrush(self.scroll_brush)
+
+        painter.setOpacity(0.2)
+        painter.drawPolygon(transform.map(path.screen_polygon))
+
+    def _determine_auto_scroll_start_y(self) -> int:
         # only support horizontal levels for now
         _, mario_y = self.level.header.mario_position()
 
-        scroll_x, scroll_y = SCREEN_WIDTH // 2, min(mario_y + 2, GROUND - _ASCROLL_SCREEN_HEIGHT // 2)
-
-        return QPointF(scroll_x, scroll_y) * block_length
+        return min(mario_y + 2, GROUND - _ASCROLL_SCREEN_HEIGHT // 2)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from PySide2.QtWidgets import QCheckBox, QLabel, QVBoxLayout
 
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.level.Level import LevelChange
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.CustomDialog import CustomDialog
 from foundry.gui.Spinner import Spinner
@@ -59,7 +60,7 @@ class AutoScrollEditor(CustomDialog):
 
         autoscroll_item.y_position = self.y_position_spinner.value()
 
-        self.level_ref.data_changed.emit()
+        self.level_ref.notify_change(LevelChange.ENEMIES)
 
         self.update()
 
@@ -72,7 +73,7 @@ class AutoScrollEditor(CustomDialog):
         if should_insert:
             self.level_ref.enemies.insert(0, self._create_autoscroll_object())
 
-        self.level_ref.data_changed.emit()
+        self.level_ref.notify_change(LevelChange.ENEMIES)
 
         self.update()
 
@@ -1,11 +1,12 @@
 from enum import Enum
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
-from PySide2.QtCore import QPoint
-from PySide2.QtWidgets import QMenu
+from PySide2.QtCore import QByteArray, QMimeData, QPoint
+from PySide2.QtWidgets import QApplication, QMenu
 
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.LevelObject import LevelObject
+from foundry.game.level.ClipboardData import CLIPBOARD_MIME_TYPE, ClipboardData
 from foundry.game.level.LevelRef import LevelRef
 
 
@@ -27,8 +28,6 @@ class CMMode(Enum):
 
 ID_PROP: bytes = "ID"
 
-MAX_ORIGIN = 0xFF, 0xFF
-
 
 class ContextMenu(QMenu):
     def __init__(self, level_ref: LevelRef):
@@ -36,8 +35,7 @@ class ContextMenu(QMenu):
 
         self.level_ref = level_ref
 
-        self.copied_objects = None
-        self.copied_objects_origin = 0, 0
+        self.copied_objects: Optional[ClipboardData] = None
         self.last_opened_at = QPoint(0, 0)
 
         self.cut_action = self.addAction("Cut")
@@ -69,23 +67,28 @@ class ContextMenu(QMenu):
         if not objects:
             return
 
-        self.copied_objects = objects
-
-        min_x, min_y = MAX_ORIGIN
+        self.copied_objects = ClipboardData.from_objects(objects)
 
-        for obj in objects:
-            obj_x, obj_y = obj.get_position()
+        mime_data = QMimeData()
+        mime_data.setData(CLIPBOARD_MIME_TYPE, QByteArray(self.copied_objects.to_bytes()))
 
-            min_x = min(min_x, obj_x)
-            min_y = min(min_y, obj_y)
+        QApplication.clipboard().setMimeData(mime_data)
 
-        min_x = max(min_x, 0)
-        min_y = max(min_y, 0)
+    def get_copied_objects(self) -> Optional[ClipboardData]:
+        """
+        Returns the objects on the system clipboard, e. g. copied in another instance of the editor, or the objects
+        last copied in this one, if there are none.
+        """
+        mime_data = QApplication.clipboard().mimeData()
 
-        self.copied_objects_origin = min_x, min_y
+        if mime_data is not None and mime_data.hasFormat(CLIPBOARD_MIME_TYPE):
+            try:
+                return ClipboardData.from_bytes(mime_data.data(CLIPBOARD_MIME_TYPE).data())
+            except ValueError:
+                # e. g. copied in a different version of the editor
+                pass
 
-    def get_copied_objects(self) -> Tuple[List[Union[LevelObject, EnemyObject]], Tuple[int, int]]:
-        return self.copied_objects, self.copied_objects_origin
+        return self.copied_objects
 
     def set_position(self, position: QPoint):
         self.last_opened_at = position
@@ -109,7 +112,7 @@ class ContextMenu(QMenu):
 
     def _setup_items(self, mode: CMMode):
         objects_selected = bool(self.level_ref.selected_objects)
-        objects_copied = bool(self.copied_objects)
+        objects_copied = self.get_copied_objects() is not None
 
         self.cut_action.setEnabled(not mode == CMMode.BG and objects_selected)
         self.copy_action.setEnabled(not mode == CMMode.BG and objects_selected)
@@ -1,4 +1,5 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from PySide2.QtCore import Signal, SignalInstance
 from PySide2.QtGui import QWindow, Qt
@@ -15,6 +16,7 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
+from foundry.game.Data import SCROLL_DIRECTIONS
 from foundry.game.gfx.GraphicsSet import GRAPHIC_SET_NAMES
 from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
@@ -62,14 +64,6 @@ MUSIC_ITEMS = [
 
 TIMES = ["300", "400", "200", "Unlimited"]
 
-SCROLL_DIRECTIONS = [
-    "Locked, unless climbing/flying",
-    "Free vertical scrolling",
-    "Locked 'by start coordinates'?",
-    "Shouldn't appear in game, do not use.",
-]
-
-
 SPINNER_MAX_VALUE = 0x0F_FF_FF
 
 
@@ -263,89 +257,93 @@ class HeaderEditor(CustomDialog):
 
         self.header_change.emit()
 
+    @contextmanager
+    def _changing_header(self) -> Iterator[None]:
+        """
+        Notifies about the edits made inside of it at once and saves them for undo, if the header actually changed.
+        """
+        header_bytes = bytes(self.level.header_bytes)
+
+        with self.level.batch_changes():
+            yield
+
+            if self.level.header_bytes != header_bytes:
+                self.header_change.emit()
+
     def on_spin(self, _):
         if self.level is None:
             return
 
         spinner = self.sender()
 
-        self.level.data_changed.connect(self.header_change.emit)
+        with self._changing_header():
+            if spinner == self.object_palette_spinner:
+                new_index = self.object_palette_spinner.value()
+                self.level.object_palette_index = new_index
 
-        if spinner == self.object_palette_spinner:
-            new_index = self.object_palette_spinner.value()
-            self.level.object_palette_index = new_index
+            elif spinner == self.enemy_palette_spinner:
+                new_index = self.enemy_palette_spinner.value()
+                self.level.enemy_palette_index = new_index
 
-        elif spinner == self.enemy_palette_spinner:
-            new_index = self.enemy_palette_spinner.value()
-            self.level.enemy_palette_index = new_index
+            elif spinner == self.level_pointer_spinner:
+                new_offset = self.level_pointer_spinner.value()
+                self.level.next_area_objects = new_offset
 
-        elif spinner == self.level_pointer_spinner:
-            new_offset = self.level_pointer_spinner.value()
-            self.level.next_area_objects = new_offset
-
-        elif spinner == self.enemy_pointer_spinner:
-            new_offset = self.enemy_pointer_spinner.value()
-            self.level.next_area_enemies = new_offset
-
-        self.level.data_changed.disconnect(self.header_change.emit)
+            elif spinner == self.enemy_pointer_spinner:
+                new_offset = self.enemy_pointer_spinner.value()
+                self.level.next_area_enemies = new_offset
 
         self.update()
 
     def on_combo(self, _):
         dropdown = self.sender()
 
-        self.level.data_changed.connect(self.header_change.emit)
-
-        if dropdown == self.length_dropdown:
-            new_length = LEVEL_LENGTHS[self.length_dropdown.currentIndex()]
-            self.level.length = new_length
+        with self._changing_header():
+            if dropdown == self.length_dropdown:
+                new_length = LEVEL_LENGTHS[self.length_dropdown.currentIndex()]
+                self.level.length = new_length
 
-        elif dropdown == self.music_dropdown:
-            new_music = self.music_dropdown.currentIndex()
-            self.level.music_index = new_music
+            elif dropdown == self.music_dropdown:
+                new_music = self.music_dropdown.currentIndex()
+                self.level.music_index = new_music
 
-        elif dropdown == self.time_dropdown:
-            new_time = self.time_dropdown.currentIndex()
-            self.level.time_index = new_time
+            elif dropdown == self.time_dropdown:
+                new_time = self.time_dropdown.currentIndex()
+                self.level.time_index = new_time
 
-        elif dropdown == self.v_scroll_direction_dropdown:
-            new_scroll = self.v_scroll_direction_dropdown.currentIndex()
-            self.level.scroll_type = new_scroll
+            elif dropdown == self.v_scroll_direction_dropdown:
+                new_scroll = self.v_scroll_direction_dropdown.currentIndex()
+                self.level.scroll_type = new_scroll
 
-        elif dropdown == self.x_position_dropdown:
-            new_x = self.x_position_dropdown.currentIndex()
-            self.level.start_x_index = new_x
+            elif dropdown == self.x_position_dropdown:
+                new_x = self.x_position_dropdown.currentIndex()
+                self.level.start_x_index = new_x
 
-        elif dropdown == self.y_position_dropdown:
-            new_y = self.y_position_dropdown.currentIndex()
-            self.level.start_y_index = new_y
+            elif dropdown == self.y_position_dropdown:
+                new_y = self.y_position_dropdown.currentIndex()
+                self.level.start_y_index = new_y
 
-        elif dropdown == self.action_dropdown:
-            new_action = self.action_dropdown.currentIndex()
-            self.level.start_action = new_action
+            elif dropdown == self.action_dropdown:
+                new_action = self.action_dropdown.currentIndex()
+                self.level.start_action = new_action
 
-        elif dropdown == self.graphic_set_dropdown:
-            new_gfx_set = self.graphic_set_dropdown.currentIndex()
-            self.level.graphic_set = new_gfx_set
+            elif dropdown == self.graphic_set_dropdown:
+                new_gfx_set = self.graphic_set_dropdown.currentIndex()
+                self.level.graphic_set = new_gfx_set
 
-        elif dropdown == self.next_area_object_set_dropdown:
-            new_object_set = self.next_area_object_set_dropdown.currentIndex()
-            self.level.next_area_object_set = new_object_set
-
-        self.level.data_changed.disconnect(self.header_change.emit)
+            elif dropdown == self.next_area_object_set_dropdown:
+                new_object_set = self.next_area_object_set_dropdown.currentIndex()
+                self.level.next_area_object_set = new_object_set
 
         self.update()
 
     def on_check_box(self, _):
         checkbox = self.sender()
 
-        self.level.data_changed.connect(self.header_change.emit)
-
-        if checkbox == self.pipe_ends_level_cb:
-            self.level.pipe_ends_level = self.pipe_ends_level_cb.isChecked()
-        elif checkbox == self.level_is_vertical_cb:
-            self.level.is_vertical = self.level_is_vertical_cb.isChecked()
-
-        self.level.data_changed.disconnect(self.header_change.emit)
+        with self._changing_header():
+            if checkbox == self.pipe_ends_level_cb:
+                self.level.pipe_ends_level = self.pipe_ends_level_cb.isChecked()
+            elif checkbox == self.level_is_vertical_cb:
+                self.level.is_vertical = self.level_is_vertical_cb.isChecked()
 
         self.update()
@@ -1,27 +1,31 @@
 from itertools import product
-from typing import Tuple
+from typing import Dict, Optional, Tuple, Union
 
 from PySide2.QtCore import QPoint, QRect
 from PySide2.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
 
-from foundry import data_dir
 from foundry.game.File import ROM
 from foundry.game.gfx.GraphicsSet import GraphicsSet
-from foundry.game.gfx.Palette import NESPalette, bg_color_for_object_set, load_palette_group
+from foundry.game.gfx.Palette import bg_color_for_palette, load_palette_group, nes_palette
 from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
-from foundry.game.gfx.objects.EnemyItem import EnemyObject, MASK_COLOR
-from foundry.game.gfx.objects.LevelObject import GROUND, SCREEN_HEIGHT, SCREEN_WIDTH
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import (
+    GROUND,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SPECIAL_BACKGROUND_OBJECTS,
+    LevelObject,
+)
 from foundry.game.gfx.objects.ObjectLike import EXPANDS_BOTH, EXPANDS_HORIZ, EXPANDS_VERT
+from foundry.game.gfx.sprites import load_sprite, mario_actions
 from foundry.game.level.Level import Level
 from foundry.gui.AutoScrollDrawer import AutoScrollDrawer
+from foundry.gui.PaintProfiler import PaintProfiler
 from smb3parse.constants import OBJ_AUTOSCROLL
 from smb3parse.levels import LEVEL_MAX_LENGTH
 from smb3parse.objects.object_set import CLOUDY_OBJECT_SET, DESERT_OBJECT_SET, DUNGEON_OBJECT_SET, ICE_OBJECT_SET
 
-png = QImage(str(data_dir / "gfx.png"))
-png.convertTo(QImage.Format_RGB888)
-
 
 def _make_image_selected(image: QImage) -> QImage:
     alpha_mask = image.createAlphaMask()
@@ -34,60 +38,65 @@ def _make_image_selected(image: QImage) -> QImage:
     return selected_image
 
 
-def _load_from_png(x: int, y: int):
-    image = png.copy(QRect(x * 16, y * 16, 16, 16))
-    mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
-    image.setAlphaChannel(mask)
+# positions of the overlay images in the sprite sheet
+FIRE_FLOWER = (16, 53)
+LEAF = (17, 53)
+NORMAL_STAR = (18, 53)
+CONTINUOUS_STAR = (19, 53)
+MULTI_COIN = (20, 53)
+ONE_UP = (21, 53)
+COIN = (22, 53)
+VINE = (23, 53)
+P_SWITCH = (24, 53)
+SILVER_COIN = (25, 53)
+INVISIBLE_COIN = (26, 53)
+INVISIBLE_1_UP = (27, 53)
 
-    return image
+NO_JUMP = (32, 53)
+UP_ARROW = (33, 53)
+DOWN_ARROW = (34, 53)
+LEFT_ARROW = (35, 53)
+RIGHT_ARROW = (36, 53)
 
+ITEM_ARROW = (53, 53)
 
-FIRE_FLOWER = _load_from_png(16, 53)
-LEAF = _load_from_png(17, 53)
-NORMAL_STAR = _load_from_png(18, 53)
-CONTINUOUS_STAR = _load_from_png(19, 53)
-MULTI_COIN = _load_from_png(20, 53)
-ONE_UP = _load_from_png(21, 53)
-COIN = _load_from_png(22, 53)
-VINE = _load_from_png(23, 53)
-P_SWITCH = _load_from_png(24, 53)
-SILVER_COIN = _load_from_png(25, 53)
-INVISIBLE_COIN = _load_from_png(26, 53)
-INVISIBLE_1_UP = _load_from_png(27, 53)
+EMPTY_IMAGE = (0, 53)
 
-NO_JUMP = _load_from_png(32, 53)
-UP_ARROW = _load_from_png(33, 53)
-DOWN_ARROW = _load_from_png(34, 53)
-LEFT_ARROW = _load_from_png(35, 53)
-RIGHT_ARROW = _load_from_png(36, 53)
 
-ITEM_ARROW = _load_from_png(53, 53)
+class _RenderContext:
+    """
+    Holds everything taken from the ROM, that is needed to draw the blocks of a level, so that it does not have to be
+    read again on every paint.
 
-EMPTY_IMAGE = _load_from_png(0, 53)
+    All of it depends on the level header, so the context has to be replaced, when the header changed.
+    """
 
+    def __init__(self, level: Level):
+        self.header = level.header
 
-SPECIAL_BACKGROUND_OBJECTS = [
-    "blue background",
-    "starry background",
-    "underground background under this",
-    "sets background to actual background color",
-]
+        self.palette_group = load_palette_group(level.object_set_number, level.header.object_palette_index)
+        self.graphics_set = GraphicsSet(level.header.graphic_set_index)
+        self.tsa_data = ROM().get_tsa_data(level.object_set_number)
 
+        if level.object_set_number == CLOUDY_OBJECT_SET:
+            self.bg_color = QColor(*nes_palette()[self.palette_group[3][2]])
+        else:
+            self.bg_color = QColor(*bg_color_for_palette(self.palette_group))
 
-def _block_from_index(block_index: int, level: Level) -> Block:
-    """
-    Returns the block at the given index, from the TSA table for the given level.
+        self._blocks: Dict[int, Block] = {}
 
-    :param block_index:
-    :param level:
-    :return:
-    """
+    def is_valid_for(self, level: Level) -> bool:
+        # every change to the header parses it again, into a new object
+        return self.header is level.header
 
-    palette_group = load_palette_group(level.object_set_number, level.header.object_palette_index)
-    graphics_set = GraphicsSet(level.header.graphic_set_index)
-    tsa_data = ROM().get_tsa_data(level.object_set_number)
+    def block(self, block_index: int) -> Block:
+        """
+        Returns the block at the given index, from the TSA table of the level.
+        """
+        if block_index not in self._blocks:
+            self._blocks[block_index] = Block(block_index, self.palette_group, self.graphics_set, self.tsa_data)
 
-    return Block(block_index, palette_group, graphics_set, tsa_data)
+        return self._blocks[block_index]
 
 
 class LevelDrawer:
@@ -107,96 +116,166 @@ class LevelDrawer:
         self.grid_pen = QPen(QColor(0x80, 0x80, 0x80, 0x80), width=1)
         self.screen_pen = QPen(QColor(0xFF, 0x00, 0x00, 0xFF), width=1)
 
-    def draw(self, painter: QPainter, level: Level):
-        self._draw_background(painter, level)
+        self.profiler = PaintProfiler()
+
+        self._render_context: Optional[_RenderContext] = None
+
+        # the part of the level, that is currently drawn, in pixels
+        self._dirty_rect = QRect()
+
+    def _context_for(self, level: Level) -> _RenderContext:
+        if self._render_context is None or not self._render_context.is_valid_for(level):
+            self._render_context = _RenderContext(level)
 
-        if level.object_set_number == DESERT_OBJECT_SET:
-            self._draw_desert_default_graphics(painter, level)
-        elif level.object_set_number == DUNGEON_OBJECT_SET:
-            self._draw_dungeon_default_graphics(painter, level)
-        elif level.object_set_number == ICE_OBJECT_SET:
-            self._draw_ice_default_graphics(painter, level)
+        return self._render_context
+
+    def draw(self, painter: QPainter, level: Level, dirty_rect: Optional[QRect] = None):
+        """
+        :param dirty_rect: The part of the level to draw, in pixels, e. g. the rect of a paint event. Objects outside of
+            it are skipped. Everything is drawn, if it is not given.
+        """
+        if dirty_rect is None:
+            self._dirty_rect = level.get_rect(self.block_length)
+        else:
+            self._dirty_rect = dirty_rect
+
+        self.profiler.begin_frame(len(level.objects), len(level.enemies))
+
+        with self.profiler.stage("background"):
+            self._draw_background(painter, level)
+
+        with self.profiler.stage("default graphics"):
+            if level.object_set_number == DESERT_OBJECT_SET:
+                self._draw_desert_default_graphics(painter, level)
+            elif level.object_set_number == DUNGEON_OBJECT_SET:
+                self._draw_dungeon_default_graphics(painter, level)
+            elif level.object_set_number == ICE_OBJECT_SET:
+                self._draw_ice_default_graphics(painter, level)
 
         # painter.setPen(QPen(QColor(0x00, 0x00, 0x00, 0x80), width=1))
         # painter.setBrush(Qt.NoBrush)
 
-        self._draw_objects(painter, level)
+        with self.profiler.stage("objects"):
+            self._draw_objects(painter, level)
 
-        self._draw_overlays(painter, level)
+        with self.profiler.stage("overlays"):
+            self._draw_overlays(painter, level)
 
         if self.draw_expansions:
-            self._draw_expansions(painter, level)
+            with self.profiler.stage("expansions"):
+                self._draw_expansions(painter, level)
 
         if self.draw_mario:
-            self._draw_mario(painter, level)
+            with self.profiler.stage("mario"):
+                self._draw_mario(painter, level)
 
         if self.draw_jumps:
-            self._draw_jumps(painter, level)
+            with self.profiler.stage("jumps"):
+                self._draw_jumps(painter, level)
 
         if self.draw_grid:
-            self._draw_grid(painter, level)
+            with self.profiler.stage("grid"):
+                self._draw_grid(painter, level)
 
         if self.draw_autoscroll:
-            self._draw_auto_scroll(painter, level)
+            with self.profiler.stage("autoscroll"):
+                self._draw_auto_scroll(painter, level)
+
+        self.profiler.end_frame()
+
+    def _is_dirty(self, level_object: Union[LevelObject, EnemyObject]) -> bool:
+        """
+        Whether the object, its overlays or its outline might be drawn into the part of the level, that is drawn.
+        """
+        if level_object.description.lower() in SPECIAL_BACKGROUND_OBJECTS:
+            return True
+
+        # overlays, like the items in blocks, are drawn up to a block next to the object
+        rect = level_object.get_rect(self.block_length).adjusted(
+            -self.block_length, -self.block_length, self.block_length, self.block_length
+        )
+
+        return rect.intersects(self._dirty_rect)
+
+    def _dirty_blocks(self, level: Level) -> Tuple[range, range]:
+        """
+        Returns the columns and rows of the level, that are part of what is drawn.
+        """
+        left = max(self._dirty_rect.left() // self.block_length, 0)
+        top = max(self._dirty_rect.top() // self.block_length, 0)
+
+        right = min(self._dirty_rect.right() // self.block_length + 1, level.width)
+        bottom = min(self._dirty_rect.bottom() // self.block_length + 1, level.height)
+
+        return range(left, right), range(top, bottom)
 
     def _draw_background(self, painter: QPainter, level: Level):
         painter.save()
 
-        if level.object_set_number == CLOUDY_OBJECT_SET:
-            bg_color = QColor(
-                *NESPalette[load_palette_group(level.object_set_number, level.header.object_palette_index)[3][2]]
-            )
-        else:
-            bg_color = bg_color_for_object_set(level.object_set_number, level.header.object_palette_index)
-
-        painter.fillRect(level.get_rect(self.block_length), bg_color)
+        painter.fillRect(level.get_rect(self.block_length), self._context_for(level).bg_color)
 
         painter.restore()
 
     def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level):
+        context = self._context_for(level)
+
+        dirty_columns, dirty_rows = self._dirty_blocks(level)
+
         # draw_background
-        bg_block = _block_from_index(140, level)
+        bg_block = context.block(140)
 
-        for x, y in product(range(level.width), range(level.height)):
+        for x, y in product(dirty_columns, dirty_rows):
             bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
 
         # draw ceiling
-        ceiling_block = _block_from_index(139, level)
+        ceiling_block = context.block(139)
 
-        for x in range(level.width):
+        for x in dirty_columns:
             ceiling_block.draw(painter, x * self.block_length, 0, self.block_length)
 
         # draw floor
-        upper_floor_blocks = [_block_from_index(20, level), _block_from_index(21, level)]
-        lower_floor_blocks = [_block_from_index(22, level), _block_from_index(23, level)]
+        upper_floor_blocks = [context.block(20), context.block(21)]
+        lower_floor_blocks = [context.block(22), context.block(23)]
 
         upper_y = (GROUND - 2) * self.block_length
         lower_y = (GROUND - 1) * self.block_length
 
-        for block_x in range(level.width):
+        for block_x in dirty_columns:
             pixel_x = block_x * self.block_length
 
             upper_floor_blocks[block_x % 2].draw(painter, pixel_x, upper_y, self.block_length)
             lower_floor_blocks[block_x % 2].draw(painter, pixel_x, lower_y, self.block_length)
 
     def _draw_desert_default_graphics(self, painter: QPainter, level: Level):
+        context = self._context_for(level)
+
         floor_level = (GROUND - 1) * self.block_length
         floor_block_index = 86
 
-        floor_block = _block_from_index(floor_block_index, level)
+        floor_block = context.block(floor_block_index)
+
+        dirty_columns, _ = self._dirty_blocks(level)
 
-        for x in range(level.width):
+        for x in dirty_columns:
             floor_block.draw(painter, x * self.block_length, floor_level, self.block_length)
 
     def _draw_ice_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(0x80, level)
+        context = self._context_for(level)
 
-        for x, y in product(range(level.width), range(level.height)):
+        bg_block = context.block(0x80)
+
+        for x, y in product(*self._dirty_blocks(level)):
             bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
 
     def _draw_objects(self, painter: QPainter, level: Level):
+        # objects render themselves, when they are changed, so only the ones depending on them might be outdated
+        # also part of the time of the objects stage
+        with self.profiler.stage("render()"):
+            level.objects.ground_map.render_outdated_objects()
+
         for level_object in level.get_all_objects():
-            level_object.render()
+            if not self._is_dirty(level_object):
+                continue
 
             if level_object.description.lower() in SPECIAL_BACKGROUND_OBJECTS:
                 width = LEVEL_MAX_LENGTH
@@ -230,6 +309,9 @@ class LevelDrawer:
             if isinstance(level_object, EnemyObject) and "invisible door" not in name:
                 continue
 
+            if not self._is_dirty(level_object):
+                continue
+
             pos = level_object.get_rect(self.block_length).topLeft()
             rect = level_object.get_rect(self.block_length)
 
@@ -327,7 +409,7 @@ class LevelDrawer:
                 # draw little arrow for the offset item overlay
                 arrow_pos = QPoint(pos)
                 arrow_pos.setY(arrow_pos.y() + self.block_length / 4)
-                painter.drawImage(arrow_pos, ITEM_ARROW.scaled(self.block_length, self.block_length))
+                painter.drawImage(arrow_pos, load_sprite(*ITEM_ARROW).scaled(self.block_length, self.block_length))
 
             elif "invisible" in name:
                 if not self.draw_invisible_items:
@@ -348,6 +430,8 @@ class LevelDrawer:
             else:
                 continue
 
+            image = load_sprite(*image)
+
             if fill_object:
                 for x in range(level_object.rendered_width):
                     adapted_pos = QPoint(pos)
@@ -377,6 +461,9 @@ class LevelDrawer:
 
     def _draw_expansions(self, painter: QPainter, level: Level):
         for level_object in level.get_all_objects():
+            if not self._is_dirty(level_object):
+                continue
+
             if level_object.selected:
                 painter.drawRect(level_object.get_rect(self.block_length))
 
@@ -397,15 +484,11 @@ class LevelDrawer:
                 painter.restore()
 
     def _draw_mario(self, painter: QPainter, level: Level):
-        mario_actions = QImage(str(data_dir / "mario.png"))
-
-        mario_actions.convertTo(QImage.Format_RGBA8888)
-
         mario_position = QPoint(*level.header.mario_position()) * self.block_length
 
         x_offset = 32 * level.start_action
 
-        mario_cutout = mario_actions.copy(QRect(x_offset, 0, 32, 32)).scaled(
+        mario_cutout = mario_actions().copy(QRect(x_offset, 0, 32, 32)).scaled(
             2 * self.block_length, 2 * self.block_length
         )
 
@@ -0,0 +1,265 @@
+"""
+Loads levels in a worker thread, so that the window stays responsive, while the objects are parsed and rendered.
+
+After a level was opened, the levels next to it in the level list and the level its jumps lead to are loaded in the
+background as well, since those are likely to be opened next.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+from PySide2.QtCore import QCoreApplication, QObject, QThread, Signal, SignalInstance
+
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level, world_and_level_for_level_address
+from smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+# how many levels, that were loaded ahead of time, to keep around
+PREFETCH_CACHE_SIZE = 8
+
+
+class LevelAddress(NamedTuple):
+    """
+    Everything needed to load a level from the ROM.
+    """
+
+    name: str
+    object_data_offset: int
+    enemy_data_offset: int
+    object_set: int
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        # the same level can be opened under different names, e. g. from the level selector or as a jump destination
+        return self.object_data_offset, self.enemy_data_offset, self.object_set
+
+
+def jump_destination(level: Level) -> LevelAddress:
+    level_address = level.next_area_objects
+    enemy_address = level.next_area_enemies + 1
+    object_set = level.next_area_object_set
+
+    world, level_in_world = world_and_level_for_level_address(level_address)
+
+    return LevelAddress(f"Level {world}-{level_in_world}", level_address, enemy_address, object_set)
+
+
+def neighbouring_levels(level: Level) -> List[LevelAddress]:
+    """
+    Returns the levels before and after the given one in the same world, as they are listed in the level selector, and
+    the destination of its jumps, if it has any.
+    """
+    neighbours = []
+
+    for index, level_info in enumerate(Level.offsets):
+        if index == 0 or level_info.rom_level_offset - Level.HEADER_LENGTH != level.header_offset:
+            continue
+
+        for neighbour_index in [index - 1, index + 1]:
+            if not 0 < neighbour_index < len(Level.offsets):
+                continue
+
+            neighbour = Level.offsets[neighbour_index]
+
+            if neighbour.game_world != level_info.game_world or neighbour.real_obj_set == WORLD_MAP_OBJECT_SET:
+                continue
+
+            # the level selector only shows the enemy offset one byte earlier, but opens the level at this one
+            neighbours.append(
+                LevelAddress(
+                    f"World {neighbour.game_world}, {neighbour.name}",
+                    neighbour.rom_level_offset - Level.HEADER_LENGTH,
+                    neighbour.enemy_offset,
+                    neighbour.real_obj_set,
+                )
+            )
+
+        break
+
+    if level.has_next_area:
+        neighbours.append(jump_destination(level))
+
+    return neighbours
+
+
+def _rom_hash() -> str:
+    return hashlib.sha256(ROM.rom_data).hexdigest()
+
+
+class _LevelLoadJob(QThread):
+    def __init__(self, address: LevelAddress):
+        super(_LevelLoadJob, self).__init__()
+
+        self.address = address
+
+        # to notice, when the ROM was changed, while the level was waiting to be opened
+        self.rom_hash = _rom_hash()
+
+        self.level: Optional[Level] = None
+        self.error: Optional[Exception] = None
+
+    def run(self):
+        try:
+            level = Level(*self.address)
+        except Exception as error:
+            # handed to the GUI thread, which decides how to report it
+            self.error = error
+            return
+
+        # the level is used in the GUI thread from now on, so its signals need to live there as well
+        level.move_to_thread(QCoreApplication.instance().thread())
+
+        self.level = level
+
+
+class LevelLoader(QObject):
+    """
+    Loads one level at a time in the background. Loading another level, before the last one is done, cancels the last
+    one, i. e. its result is thrown away, once its thread finishes.
+
+    Levels, that are asked to be prefetched, are loaded one after the other with a low priority and kept, until they
+    are opened or pushed out by others. Opening a prefetched level hands it out right away.
+    """
+
+    loading_started: SignalInstance = Signal(object)
+    level_loaded: SignalInstance = Signal(object)
+    loading_failed: SignalInstance = Signal(object, object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super(LevelLoader, self).__init__(parent)
+
+        self._current_job: Optional[_LevelLoadJob] = None
+
+        # jobs, including cancelled ones, need to be referenced, until their thread stopped
+        self._jobs: List[_LevelLoadJob] = []
+
+        self._prefetch_queue: List[LevelAddress] = []
+        self._prefetch_job: Optional[_LevelLoadJob] = None
+
+        # prefetched levels and the hash of the ROM, they were loaded from, by their address key
+        self._prefetched: "OrderedDict[Tuple[int, int, int], Tuple[Level, str]]" = OrderedDict()
+
+    @property
+    def is_loading(self) -> bool:
+        return self._current_job is not None
+
+    def load(self, address: LevelAddress):
+        """
+        Starts loading the level. Emits level_loaded with it, once done, or loading_failed with the address and the
+        exception, that was raised while loading it.
+        """
+        self.loading_started.emit(address)
+
+        level = self._take_prefetched(address)
+
+        if level is not None:
+            self._current_job = None
+
+            self.level_loaded.emit(level)
+
+            return
+
+        if self._prefetch_job is not None and self._prefetch_job.address.key == address.key:
+            # already being loaded, so just wait for it
+            self._current_job = self._prefetch_job
+            self._current_job.address = address
+            self._prefetch_job = None
+
+            return
+
+        job = _LevelLoadJob(address)
+
+        self._current_job = job
+        self._start(job)
+
+    def prefetch(self, addresses: List[LevelAddress]):
+        """
+        Loads the levels in the background, so that they can be opened right away. Replaces the levels, that were
+        asked to be prefetched before, but are not yet loaded.
+        """
+        self._prefetch_queue = [address for address in addresses if address.key not in self._prefetched]
+
+        self._prefetch_next()
+
+    def cancel(self):
+        self._current_job = None
+
+    def wait_for_done(self):
+        """
+        Blocks, until all levels, including the prefetched ones, are loaded and handed out.
+        """
+        while self._jobs:
+            self._jobs[0].wait()
+
+            QCoreApplication.processEvents()
+
+    def _start(self, job: _LevelLoadJob, priority=QThread.InheritPriority):
+        job.finished.connect(self._on_job_finished)
+
+        self._jobs.append(job)
+
+        job.start(priority)
+
+    def _take_prefetched(self, address: LevelAddress) -> Optional[Level]:
+        level, rom_hash = self._prefetched.pop(address.key, (None, None))
+
+        if level is None or rom_hash != _rom_hash():
+            return None
+
+        level.name = address.name
+
+        return level
+
+    def _prefetch_next(self):
+        if self._prefetch_job is not None:
+            return
+
+        while self._prefetch_queue:
+            address = self._prefetch_queue.pop(0)
+
+            already_loading = self._current_job is not None and self._current_job.address.key == address.key
+
+            if address.key in self._prefetched or already_loading:
+                continue
+
+            self._prefetch_job = _LevelLoadJob(address)
+            self._start(self._prefetch_job, QThread.LowPriority)
+
+            return
+
+    def _on_job_finished(self):
+        job = self.sender()
+
+        self._jobs.remove(job)
+
+        if job is self._prefetch_job:
+            self._prefetch_job = None
+
+            if job.level is not None:
+                self._prefetched[job.address.key] = (job.level, job.rom_hash)
+
+                while len(self._prefetched) > PREFETCH_CACHE_SIZE:
+                    self._prefetched.popitem(last=False)
+
+            self._prefetch_next()
+
+            return
+
+        if job is not self._current_job:
+            # cancelled
+            return
+
+        self._current_job = None
+
+        if job.level is None:
+            self.loading_failed.emit(job.address, job.error)
+        elif job.rom_hash != _rom_hash():
+            # the ROM changed while loading, e. g. it was saved, so load it again from the current one
+            self.load(job.address)
+        else:
+            job.level.name = job.address.name
+
+            self.level_loaded.emit(job.level)
+
+        self._prefetch_next()
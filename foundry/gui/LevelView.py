@@ -1,8 +1,7 @@
 from bisect import bisect_right
 from typing import List, Optional, Tuple, Union
-from warnings import warn
 
-from PySide2.QtCore import QMimeData, QPoint, QSize
+from PySide2.QtCore import QMimeData, QPoint, QRect, QSize
 from PySide2.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
@@ -16,15 +15,18 @@ from PySide2.QtWidgets import QSizePolicy, QWidget
 
 from foundry.game.gfx.drawable.Block import Block
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
-from foundry.game.gfx.objects.LevelObject import LevelObject
+from foundry.game.gfx.objects.LevelObject import SPECIAL_BACKGROUND_OBJECTS, LevelObject
 from foundry.game.gfx.objects.ObjectLike import EXPANDS_BOTH, EXPANDS_HORIZ, EXPANDS_VERT
-from foundry.game.level.Level import Level
+from foundry.game.level.ClipboardData import ClipboardData
+from foundry.game.level.Level import Level, LevelChange
 from foundry.game.level.LevelRef import LevelRef
+from foundry.game.level.SpatialIndex import SpatialIndex
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import ContextMenu
 from foundry.gui.LevelDrawer import LevelDrawer
 from foundry.gui.SelectionSquare import SelectionSquare
 from foundry.gui.settings import RESIZE_LEFT_CLICK, RESIZE_RIGHT_CLICK, SETTINGS
+from smb3parse.constants import OBJ_AUTOSCROLL
 
 HIGHEST_ZOOM_LEVEL = 8  # on linux, at least
 LOWEST_ZOOM_LEVEL = 1 / 16  # on linux, but makes sense with 16x16 blocks
@@ -41,8 +43,10 @@ RESIZE_MODES = [MODE_RESIZE_HORIZ, MODE_RESIZE_VERT, MODE_RESIZE_DIAG]
 
 def undoable(func):
     def wrapped(self, *args):
-        func(self, *args)
-        self.level_ref.save_level_state()
+        # the edit and saving it are one change for the listeners of the level
+        with self.level_ref.batch_changes():
+            func(self, *args)
+            self.level_ref.save_level_state()
 
     return wrapped
 
@@ -56,7 +60,10 @@ class LevelView(QWidget):
         self.setAcceptDrops(True)
 
         self.level_ref: LevelRef = level
-        self.level_ref.data_changed.connect(self.update)
+        self.level_ref.level_changed.connect(self._on_level_changed)
+
+        # set while the view changes the selection itself, since it knows better, which part needs to be repainted
+        self._changing_selection = False
 
         self.context_menu = context_menu
 
@@ -79,6 +86,10 @@ class LevelView(QWidget):
 
         self.selection_square = SelectionSquare()
 
+        # where the objects were, when the selection square was started, and what it selected since then
+        self._selection_index: Optional[SpatialIndex] = None
+        self._selected_by_square: List[Union[LevelObject, EnemyObject]] = []
+
         self.mouse_mode = MODE_FREE
 
         self.last_mouse_position = 0, 0
@@ -364,12 +375,14 @@ class LevelView(QWidget):
 
         selected_objects = self.get_selected_objects()
 
+        dirty_rect = self._area_of(selected_objects)
+
         for obj in selected_objects:
             obj.resize_by(dx, dy)
 
             self.level_ref.changed = True
 
-        self.update()
+        self.update(dirty_rect.united(self._area_of(selected_objects)).united(self._render_outdated_objects()))
 
     def on_right_mouse_button_up(self, event):
         if self.resizing_happened:
@@ -446,12 +459,14 @@ class LevelView(QWidget):
 
         selected_objects = self.get_selected_objects()
 
+        dirty_rect = self._area_of(selected_objects)
+
         for obj in selected_objects:
             obj.move_by(dx, dy)
 
             self.level_ref.changed = True
 
-        self.update()
+        self.update(dirty_rect.united(self._area_of(selected_objects)).united(self._render_outdated_objects()))
 
     def on_left_mouse_button_up(self, event: QMouseEvent):
         if self.mouse_mode == MODE_DRAG and self.dragging_happened:
@@ -520,25 +535,49 @@ class LevelView(QWidget):
     def start_selection_square(self, position):
         self.selection_square.start(position)
 
+        # objects don't move, while the selection square is drawn
+        self._selection_index = SpatialIndex(self.level_ref.get_all_objects())
+        self._selected_by_square = self.level_ref.selected_objects
+
     def set_selection_end(self, position):
         if not self.selection_square.is_active():
             return
 
+        dirty_rect = self._selection_square_area()
+
         self.selection_square.set_current_end(position)
 
         sel_rect = self.selection_square.get_adjusted_rect(self.block_length, self.block_length)
 
-        touched_objects = [obj for obj in self.level_ref.get_all_objects() if sel_rect.intersects(obj.get_rect())]
+        touched_objects = self._selection_index.intersecting(sel_rect)
 
-        if touched_objects != self.level_ref.selected_objects:
-            self._set_selected_objects(touched_objects)
+        # only tell the level about the objects, that the square moved over or away from, since the last mouse move
+        touched_ids = {id(obj) for obj in touched_objects}
+        selected_ids = {id(obj) for obj in self._selected_by_square}
 
-        self.update()
+        newly_touched = [obj for obj in touched_objects if id(obj) not in selected_ids]
+        not_touched_anymore = [obj for obj in self._selected_by_square if id(obj) not in touched_ids]
+
+        self._selected_by_square = touched_objects
+
+        self._changing_selection = True
+        self.level_ref.change_selection(newly_touched, not_touched_anymore)
+        self._changing_selection = False
+
+        dirty_rect = dirty_rect.united(self._selection_square_area())
+        dirty_rect = dirty_rect.united(self._area_of(newly_touched + not_touched_anymore))
+
+        self.update(dirty_rect)
 
     def stop_selection_square(self):
+        dirty_rect = self._selection_square_area()
+
         self.selection_square.stop()
 
-        self.update()
+        self._selection_index = None
+        self._selected_by_square = []
+
+        self.update(dirty_rect)
 
     def select_all(self):
         self.select_objects(self.level_ref.get_all_objects())
@@ -550,15 +589,76 @@ class LevelView(QWidget):
             self.select_objects([])
 
     def select_objects(self, objects):
+        previously_selected_objects = self.level_ref.selected_objects
+
         self._set_selected_objects(objects)
 
-        self.update()
+        self.update(self._area_of(previously_selected_objects + self.level_ref.selected_objects))
 
     def _set_selected_objects(self, objects):
-        if self.level_ref.selected_objects == objects:
+        self._changing_selection = True
+        self.level_ref.selected_objects = objects
+        self._changing_selection = False
+
+    def _on_level_changed(self, changes: LevelChange):
+        if changes == LevelChange.SELECTION and self._changing_selection:
             return
 
-        self.level_ref.selected_objects = objects
+        self.update()
+
+    def _area_of(self, objects: List[Union[LevelObject, EnemyObject]]) -> QRect:
+        """
+        Returns the part of the view, that the given objects are drawn in, including their overlays and outlines.
+        """
+        area = QRect()
+
+        for obj in objects:
+            if obj.description.lower() in SPECIAL_BACKGROUND_OBJECTS or (
+                isinstance(obj, EnemyObject) and obj.obj_index == OBJ_AUTOSCROLL
+            ):
+                # drawn across the level, in front of or behind everything else
+                return self.rect()
+
+            area = area.united(self._area_of_rect(obj.get_rect()))
+
+        return area
+
+    def _area_of_rect(self, rect: QRect) -> QRect:
+        # overlays, like the items in blocks, are drawn up to a block next to the object
+        return QRect(
+            (rect.x() - 1) * self.block_length,
+            (rect.y() - 1) * self.block_length,
+            (rect.width() + 2) * self.block_length,
+            (rect.height() + 2) * self.block_length,
+        )
+
+    def _selection_square_area(self) -> QRect:
+        if not self.selection_square.should_draw:
+            return QRect()
+
+        # the outline is drawn around the rect
+        return self.selection_square.get_rect().normalized().adjusted(-1, -1, 1, 1)
+
+    def _render_outdated_objects(self) -> QRect:
+        """
+        Renders the objects, that extend to the ground, which an edit moved, and returns the part of the view, that
+        they were drawn in before and are drawn in now.
+
+        The drawer would do the same, but it doesn't know, what it has to repaint for that.
+        """
+        if isinstance(self.level_ref.level, WorldMap):
+            return QRect()
+
+        ground_map = self.level_ref.objects.ground_map
+
+        previous_rects = {id(obj): obj.get_rect() for obj in ground_map.objects_extending_to_ground()}
+
+        area = QRect()
+
+        for obj in ground_map.render_outdated_objects():
+            area = area.united(self._area_of_rect(previous_rects[id(obj)])).united(self._area_of([obj]))
+
+        return area
 
     def get_selected_objects(self) -> List[Union[LevelObject, EnemyObject]]:
         return self.level_ref.selected_objects
@@ -716,32 +816,16 @@ class LevelView(QWidget):
 
         self.update()
 
-    def paste_objects_at(
-        self,
-        paste_data: Tuple[List[Union[LevelObject, EnemyObject]], Tuple[int, int]],
-        x: Optional[int] = None,
-        y: Optional[int] = None,
-    ):
+    def paste_objects_at(self, paste_data: Optional[ClipboardData], x: Optional[int] = None, y: Optional[int] = None):
+        if paste_data is None:
+            return
+
         if x is None or y is None:
             level_x, level_y = self.last_mouse_position
         else:
             level_x, level_y = self.to_level_point(x, y)
 
-        objects, origin = paste_data
-
-        ori_x, ori_y = origin
-
-        pasted_objects = []
-
-        for obj in objects:
-            obj_x, obj_y = obj.get_position()
-
-            offset_x, offset_y = obj_x - ori_x, obj_y - ori_y
-
-            try:
-                pasted_objects.append(self.level_ref.paste_object_at(level_x + offset_x, level_y + offset_y, obj))
-            except ValueError:
-                warn("Tried pasting outside of level.", RuntimeWarning)
+        pasted_objects = self.level_ref.paste_objects_at(paste_data, level_x, level_y)
 
         self.select_objects(pasted_objects)
 
@@ -789,8 +873,6 @@ class LevelView(QWidget):
 
         self.currently_dragged_object = None
 
-        self.level_ref.data_changed.emit()
-
     def get_object_from_mime_data(self, mime_data: QMimeData) -> Union[LevelObject, EnemyObject]:
         object_type, *object_bytes = mime_data.data("application/level-object")
 
@@ -811,10 +893,20 @@ class LevelView(QWidget):
             return
 
         self.level_drawer.block_length = self.block_length
+        self.level_drawer.profiler.enabled = SETTINGS["show_paint_statistics"]
 
-        self.level_drawer.draw(painter, self.level_ref.level)
+        self.level_drawer.draw(painter, self.level_ref.level, event.rect())
 
         self.selection_square.draw(painter)
 
         if self.currently_dragged_object is not None:
             self.currently_dragged_object.draw(painter, self.block_length, self.transparency)
+
+        if self.level_drawer.profiler.enabled:
+            visible_rect = self.visibleRegion().boundingRect()
+
+            self.level_drawer.profiler.draw_overlay(painter, visible_rect)
+
+            if not event.rect().contains(visible_rect):
+                # scrolling only repaints the newly visible part, which would leave copies of the overlay behind
+                self.update()
@@ -15,6 +15,7 @@ from PySide2.QtWidgets import (
     QMainWindow,
     QMenu,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QScrollArea,
     QShortcut,
@@ -37,7 +38,8 @@ from foundry import (
 from foundry.game.File import ROM
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.LevelObject import LevelObject
-from foundry.game.level.Level import Level, world_and_level_for_level_address
+from foundry.game.level.ClipboardData import ClipboardData
+from foundry.game.level.Level import Level, LevelChange
 from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.AboutWindow import AboutDialog
@@ -48,6 +50,7 @@ from foundry.gui.EnemySizeBar import EnemySizeBar
 from foundry.gui.HeaderEditor import HeaderEditor
 from foundry.gui.JumpEditor import JumpEditor
 from foundry.gui.JumpList import JumpList
+from foundry.gui.LevelLoader import LevelAddress, LevelLoader, jump_destination, neighbouring_levels
 from foundry.gui.LevelSelector import LevelSelector
 from foundry.gui.LevelSizeBar import LevelSizeBar
 from foundry.gui.LevelView import LevelView, undoable
@@ -284,7 +287,7 @@ class MainWindow(QMainWindow):
         self.object_viewer = None
 
         self.level_ref = LevelRef()
-        self.level_ref.data_changed.connect(self._on_level_data_changed)
+        self.level_ref.level_changed.connect(self._on_level_changed)
 
         self.context_menu = ContextMenu(self.level_ref)
         self.context_menu.triggered.connect(self.on_menu)
@@ -417,6 +420,19 @@ class MainWindow(QMainWindow):
         self.status_bar = ObjectStatusBar(self, self.level_ref)
         self.setStatusBar(self.status_bar)
 
+        # the time it takes to load a level is not known, so the progress bar only shows, that it is still loading
+        self.level_loading_bar = QProgressBar(self)
+        self.level_loading_bar.setRange(0, 0)
+        self.level_loading_bar.setMaximumWidth(150)
+        self.level_loading_bar.hide()
+
+        self.status_bar.addPermanentWidget(self.level_loading_bar)
+
+        self.level_loader = LevelLoader(self)
+        self.level_loader.loading_started.connect(self._on_level_loading_started)
+        self.level_loader.level_loaded.connect(self._on_level_loaded)
+        self.level_loader.loading_failed.connect(self._on_level_loading_failed)
+
         self.delete_shortcut = QShortcut(QKeySequence(Qt.Key_Delete), self, self.remove_selected_objects)
 
         QShortcut(QKeySequence(Qt.CTRL + Qt.Key_X), self, self._cut_objects)
@@ -436,7 +452,10 @@ class MainWindow(QMainWindow):
 
         self.showMaximized()
 
-    def _on_level_data_changed(self):
+    def _on_level_changed(self, changes: LevelChange):
+        if not changes & (LevelChange.HISTORY | LevelChange.HEADER):
+            return
+
         self.undo_action.setEnabled(self.level_ref.undo_stack.undo_available)
         self.redo_action.setEnabled(self.level_ref.undo_stack.redo_available)
 
@@ -446,13 +465,7 @@ class MainWindow(QMainWindow):
         if not self.safe_to_change():
             return
 
-        level_address = self.level_ref.level.next_area_objects
-        enemy_address = self.level_ref.level.next_area_enemies + 1
-        object_set = self.level_ref.level.next_area_object_set
-
-        world, level = world_and_level_for_level_address(level_address)
-
-        self.update_level(f"Level {world}-{level}", level_address, enemy_address, object_set)
+        self.open_level(*jump_destination(self.level_ref.level))
 
     def on_play(self):
         """
@@ -842,7 +855,7 @@ class MainWindow(QMainWindow):
         enemy_data = self.level_view.level_ref.enemy_offset
         object_set = self.level_view.level_ref.object_set_number
 
-        self.update_level(level_name, object_data, enemy_data, object_set)
+        self.open_level(level_name, object_data, enemy_data, object_set)
 
     def _on_placeable_object_selected(self, level_object: Union[LevelObject, EnemyObject]):
         if self.sender() is self.object_toolbar:
@@ -876,9 +889,18 @@ class MainWindow(QMainWindow):
         if selected_objects:
             self.context_menu.set_copied_objects(selected_objects)
 
-    @undoable
     def _paste_objects(self, x=None, y=None):
-        self.level_view.paste_objects_at(self.context_menu.get_copied_objects(), x, y)
+        clipboard_data = self.context_menu.get_copied_objects()
+
+        # don't add a step to the undo stack, when there is nothing to paste
+        if clipboard_data is None or not clipboard_data.objects:
+            return
+
+        self._paste_clipboard_data(clipboard_data, x, y)
+
+    @undoable
+    def _paste_clipboard_data(self, clipboard_data: ClipboardData, x=None, y=None):
+        self.level_view.paste_objects_at(clipboard_data, x, y)
 
     @undoable
     def remove_selected_objects(self):
@@ -946,8 +968,6 @@ class MainWindow(QMainWindow):
         else:
             self.level_view.replace_enemy(selected_object, obj_type)
 
-        self.level_ref.data_changed.emit()
-
     def fill_object_list(self):
         self.object_list.Clear()
 
@@ -962,7 +982,7 @@ class MainWindow(QMainWindow):
         level_was_selected = level_selector.exec_() == QDialog.Accepted
 
         if level_was_selected:
-            self.update_level(
+            self.open_level(
                 level_selector.level_name,
                 level_selector.object_data_offset,
                 level_selector.enemy_data_offset,
@@ -1011,6 +1031,10 @@ class MainWindow(QMainWindow):
         HeaderEditor(self, self.level_ref).exec_()
 
     def update_level(self, level_name: str, object_data_offset: int, enemy_data_offset: int, object_set: int):
+        # a level, that is still loading in the background, would replace this one, once it is done
+        self.level_loader.cancel()
+        self._on_level_loading_stopped()
+
         try:
             self.level_ref.load_level(level_name, object_data_offset, enemy_data_offset, object_set)
         except IndexError:
@@ -1020,6 +1044,45 @@ class MainWindow(QMainWindow):
 
         self.update_gui_for_level()
 
+        self.level_loader.prefetch(neighbouring_levels(self.level_ref.level))
+
+    def open_level(self, level_name: str, object_data_offset: int, enemy_data_offset: int, object_set: int):
+        """
+        Like update_level, but loads the level in the background and shows it, once it is done. Opening another level
+        before that cancels it. Levels next to the opened one are loaded ahead of time, so they open right away.
+        """
+        self.level_loader.load(LevelAddress(level_name, object_data_offset, enemy_data_offset, object_set))
+
+    def _on_level_loading_started(self, address: LevelAddress):
+        # changes to the current level would be lost, once the new one is shown
+        self.level_view.setEnabled(False)
+
+        self.status_bar.showMessage(f"Loading {address.name}...")
+        self.level_loading_bar.show()
+
+    def _on_level_loading_stopped(self):
+        self.level_view.setEnabled(True)
+
+        self.status_bar.clearMessage()
+        self.level_loading_bar.hide()
+
+    def _on_level_loaded(self, level: Level):
+        self._on_level_loading_stopped()
+
+        self.level_ref.set_level(level)
+
+        self.update_gui_for_level()
+
+        self.level_loader.prefetch(neighbouring_levels(level))
+
+    def _on_level_loading_failed(self, _: LevelAddress, error: Exception):
+        self._on_level_loading_stopped()
+
+        if not isinstance(error, IndexError):
+            raise error
+
+        QMessageBox.critical(self, "Please confirm", "Failed loading level. The level offsets don't match.")
+
     def update_gui_for_level(self):
         self._enable_disable_gui_elements()
 
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import List, Optional, Union
 
 from PySide2.QtCore import Qt, Signal, SignalInstance
 from PySide2.QtGui import QIcon, QImage, QPixmap
@@ -6,11 +6,9 @@ from PySide2.QtWidgets import QApplication, QComboBox, QCompleter, QWidget
 
 from foundry.game.gfx.drawable.Block import Block
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
-from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
-from foundry.game.gfx.objects.LevelObject import LevelObject, get_minimal_icon_object
-from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
-from smb3parse.objects import MAX_DOMAIN, MAX_ENEMY_ITEM_ID, MAX_ID_VALUE, MIN_DOMAIN
+from foundry.gui.ObjectIconLoader import IconSetKey, ObjectIconEntry, object_icon_loader
 
 
 class ObjectDropdown(QComboBox):
@@ -29,6 +27,10 @@ class ObjectDropdown(QComboBox):
 
         self.currentIndexChanged.connect(self._on_object_selected)
 
+        # the icon set, that is currently being added, to ignore the icons of ones, that were requested before
+        self._icon_set_key: Optional[IconSetKey] = None
+        self._has_separator = False
+
         # guard against overly long item descriptions
         self.setMaximumWidth(QApplication.desktop().geometry().width() / 5)
 
@@ -41,11 +43,19 @@ class ObjectDropdown(QComboBox):
         )
 
     def set_object_set(self, object_set_index: int, graphic_set_index: int) -> None:
-        factory = LevelObjectFactory(
-            object_set_index, graphic_set_index, 0, [], vertical_level=False, size_minimal=True
-        )
+        """
+        Replaces the items with the objects and enemies/items of the object set, adding them as soon as their icons are
+        rendered in the background.
+        """
+        self.clear()
 
-        self._on_object_factory_change(factory)
+        self._has_separator = False
+
+        loader = object_icon_loader()
+
+        self._icon_set_key = loader.key_for(object_set_index, graphic_set_index)
+
+        loader.load(self._icon_set_key, self._on_icons_loaded)
 
     def _on_object_selected(self, _):
         if self.currentIndex() == -1:
@@ -71,53 +81,27 @@ class ObjectDropdown(QComboBox):
         self.setCurrentIndex(index_of_object)
         self.blockSignals(was_blocked)
 
-    def _on_object_factory_change(self, object_factory: LevelObjectFactory) -> None:
-        self.clear()
-
-        self._object_factory = object_factory
-
-        if self._object_factory is None:
+    def _on_icons_loaded(self, key: IconSetKey, entries: List[ObjectIconEntry]):
+        if key != self._icon_set_key:
             return
 
-        # adds level objects
-        for domain in range(MIN_DOMAIN, MAX_DOMAIN + 1):
-            for static_object_id in range(0, 0x10):
-                level_object = self._object_factory.from_properties(
-                    domain, static_object_id, x=0, y=0, length=1, index=0
-                )
-
-                level_object = get_minimal_icon_object(level_object)
-
-                self._add_item(level_object)
-
-            for expanding_object_id in range(0x10, MAX_ID_VALUE, 0x10):
-                level_object = self._object_factory.from_properties(
-                    domain, expanding_object_id, x=0, y=0, length=1, index=0
-                )
-
-                level_object = get_minimal_icon_object(level_object)
-
-                self._add_item(level_object)
-
-        # insert visual separator between level objects and enemies/items
-        self.insertSeparator(self.count())
-
-        # adds enemies and items
-        factory = EnemyItemFactory(object_factory.object_set, 0)
+        for entry in entries:
+            if isinstance(entry.object, EnemyObject) and not self._has_separator:
+                # insert visual separator between level objects and enemies/items
+                self.insertSeparator(self.count())
 
-        for obj_index in range(MAX_ENEMY_ITEM_ID + 1):
-            enemy_item = factory.from_properties(obj_index, x=0, y=0)
+                self._has_separator = True
 
-            self._add_item(enemy_item)
+            self._add_item(entry.object, entry.image)
 
-    def _add_item(self, level_object: Union[LevelObject, EnemyObject]):
+    def _add_item(self, level_object: Union[LevelObject, EnemyObject], image: QImage):
         if not isinstance(level_object, (LevelObject, EnemyObject)):
             return
 
         if level_object.description in ["MSG_CRASH", "MSG_NOTHING", "MSG_POINTER"]:
             return
 
-        icon = QIcon(QPixmap(self._resize_bitmap(level_object.as_image())))
+        icon = QIcon(QPixmap(self._resize_bitmap(image)))
 
         self.addItem(icon, level_object.description, level_object)
 
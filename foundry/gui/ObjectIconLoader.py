@@ -0,0 +1,320 @@
+"""
+Renders the icons of all objects and enemies/items of an object set, for the object toolbox and dropdown.
+
+Rendering them takes a while, since most objects have to be re-rendered a couple of times, before every one of their
+blocks shows up. So this happens in a worker thread, which hands the icons out in batches, as they are done. Finished
+icon sets are kept in memory and on disk, keyed by object set, graphics set, palette and the ROM they came from.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import product
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from PySide2.QtCore import QBuffer, QByteArray, QCoreApplication, QIODevice, QObject, QThread, Signal, SignalInstance
+from PySide2.QtGui import QImage
+
+from foundry.game.File import ROM
+from foundry.game.ObjectDefinitions import cache_dir, object_definitions_version
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
+from foundry.game.gfx.objects.LevelObject import LevelObject, get_minimal_icon_object
+from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
+from smb3parse.objects import MAX_DOMAIN, MAX_ENEMY_ITEM_ID, MAX_ID_VALUE, MIN_DOMAIN
+
+ICON_CACHE_VERSION = 1
+ICON_CACHE_FILE_PREFIX = "object_icons-"
+
+# every saved level changes the ROM and therefore the key, so only keep the most recently written icon sets
+MAX_ICON_CACHE_FILES = 32
+
+# how many icon sets to keep in memory, e. g. when switching back and forth between levels
+MEMORY_CACHE_SIZE = 8
+
+# how many icons to render, before handing them to the widgets
+ICON_BATCH_SIZE = 16
+
+HIDDEN_OBJECTS = ["MSG_NOTHING", "MSG_CRASH"]
+
+
+class IconSetKey(NamedTuple):
+    object_set: int
+    graphics_set: int
+    palette_index: int
+    rom_hash: str
+
+
+class ObjectIconEntry(NamedTuple):
+    object: Union[LevelObject, EnemyObject]
+    image: QImage
+
+
+IconCallback = Callable[[IconSetKey, List[ObjectIconEntry]], None]
+
+# what is saved on disk for every icon: whether it is an enemy, the bytes of the object and the image as a PNG
+_CachedIcon = Tuple[bool, bytes, bytes]
+
+
+def _cache_file(key: IconSetKey):
+    hash_ = hashlib.sha256(f"{ICON_CACHE_VERSION} {tuple(key)} {object_definitions_version()}".encode("ascii"))
+
+    return cache_dir / f"{ICON_CACHE_FILE_PREFIX}{hash_.hexdigest()}.pickle"
+
+
+def _image_to_png(image: QImage) -> bytes:
+    byte_array = QByteArray()
+
+    buffer = QBuffer(byte_array)
+    buffer.open(QIODevice.WriteOnly)
+
+    image.save(buffer, "PNG")
+
+    return bytes(byte_array.data())
+
+
+def _render_icons(key: IconSetKey) -> Iterator[ObjectIconEntry]:
+    """
+    Creates every object and enemy/item of the object set and renders them, so that all of their blocks are visible.
+    """
+    factory = LevelObjectFactory(
+        key.object_set, key.graphics_set, key.palette_index, LevelObjectList(), vertical_level=False, size_minimal=True
+    )
+
+    object_ids = list(range(0x00, 0x10)) + list(range(0x10, MAX_ID_VALUE, 0x10))
+
+    for domain, obj_index in product(range(MIN_DOMAIN, MAX_DOMAIN + 1), object_ids):
+        level_object = factory.from_properties(domain=domain, object_index=obj_index, x=0, y=0, length=None, index=0)
+
+        if not isinstance(level_object, LevelObject) or level_object.description in HIDDEN_OBJECTS:
+            continue
+
+        level_object = get_minimal_icon_object(level_object)
+
+        yield ObjectIconEntry(level_object, level_object.as_image())
+
+    enemy_factory = EnemyItemFactory(key.object_set, key.palette_index)
+
+    for obj_index in range(MAX_ENEMY_ITEM_ID + 1):
+        enemy_item = enemy_factory.from_properties(obj_index, x=0, y=0)
+
+        if enemy_item.description in HIDDEN_OBJECTS:
+            continue
+
+        yield ObjectIconEntry(enemy_item, enemy_item.as_image())
+
+
+def _restore_icons(key: IconSetKey, cached_icons: List[_CachedIcon]) -> Iterator[ObjectIconEntry]:
+    """
+    Creates the objects and enemies/items from their cached bytes, which already have the right length, so they only
+    need to be rendered once, and takes their icons from the cache as well.
+    """
+    factory = LevelObjectFactory(
+        key.object_set, key.graphics_set, key.palette_index, LevelObjectList(), vertical_level=False, size_minimal=True
+    )
+    enemy_factory = EnemyItemFactory(key.object_set, key.palette_index)
+
+    for is_enemy, data, png in cached_icons:
+        if is_enemy:
+            level_object = enemy_factory.from_data(bytearray(data), 0)
+        else:
+            level_object = get_minimal_icon_object(factory.from_data(bytearray(data), 0))
+
+        yield ObjectIconEntry(level_object, QImage.fromData(png, "PNG"))
+
+
+class _IconJob(QThread):
+    icons_rendered: SignalInstance = Signal(object, list)
+
+    def __init__(self, key: IconSetKey):
+        super(_IconJob, self).__init__()
+
+        self.key = key
+
+        # only read by the thread, so setting it is enough to stop it, after the current icon
+        self.cancelled = False
+        self.completed = False
+
+    def run(self):
+        cache_file = _cache_file(self.key)
+
+        try:
+            with open(cache_file, "rb") as cache:
+                cached_icons: Optional[List[_CachedIcon]] = pickle.load(cache)
+        except Exception:
+            # missing, unreadable or from an incompatible version; either way, the icons have to be rendered
+            cached_icons = None
+
+        if cached_icons is None:
+            entries = _render_icons(self.key)
+        else:
+            entries = _restore_icons(self.key, cached_icons)
+
+        rendered_entries = []
+        batch = []
+
+        for entry in entries:
+            if self.cancelled:
+                return
+
+            rendered_entries.append(entry)
+            batch.append(entry)
+
+            if len(batch) == ICON_BATCH_SIZE:
+                self.icons_rendered.emit(self, batch)
+                batch = []
+
+        if batch:
+            self.icons_rendered.emit(self, batch)
+
+        self.completed = True
+
+        if cached_icons is None:
+            self._save(cache_file, rendered_entries)
+
+    @staticmethod
+    def _save(cache_file, entries: List[ObjectIconEntry]):
+        cached_icons = [
+            (isinstance(entry.object, EnemyObject), bytes(entry.object.to_bytes()), _image_to_png(entry.image))
+            for entry in entries
+        ]
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.{id(entries)}.tmp")
+
+            with open(temp_file, "wb") as cache:
+                pickle.dump(cached_icons, cache, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_file, cache_file)
+
+            old_cache_files = sorted(
+                cache_dir.glob(f"{ICON_CACHE_FILE_PREFIX}*.pickle"), key=lambda file: file.stat().st_mtime
+            )
+
+            for old_cache_file in old_cache_files[:-MAX_ICON_CACHE_FILES]:
+                old_cache_file.unlink()
+        except OSError:
+            # not being able to cache only makes the next time slower
+            pass
+
+
+class _LoadingIconSet:
+    def __init__(self, job: _IconJob):
+        self.job = job
+
+        self.entries: List[ObjectIconEntry] = []
+        self.callbacks: List[IconCallback] = []
+
+
+class ObjectIconLoader(QObject):
+    """
+    Hands out the icons of object sets to the widgets, that show them, rendering them in the background, if necessary.
+
+    Only the icons of one object set are rendered at a time. Asking for another one cancels the ones still running,
+    since they belonged to a level, that is not shown anymore.
+    """
+
+    def __init__(self):
+        super(ObjectIconLoader, self).__init__()
+
+        self._memory_cache: "OrderedDict[IconSetKey, List[ObjectIconEntry]]" = OrderedDict()
+        self._loading: Dict[IconSetKey, _LoadingIconSet] = {}
+
+        # jobs, including cancelled ones, need to be referenced, until their thread stopped
+        self._jobs: List[_IconJob] = []
+
+    @staticmethod
+    def key_for(object_set: int, graphics_set: int, palette_index: int = 0) -> IconSetKey:
+        rom_hash = hashlib.sha256(ROM.rom_data).hexdigest()
+
+        return IconSetKey(object_set, graphics_set, palette_index, rom_hash)
+
+    def load(self, key: IconSetKey, callback: IconCallback):
+        """
+        Calls the callback with the icons of the given set, in the order of the objects, followed by the enemies/items.
+
+        If the icons are already known, the callback is called with all of them right away. Otherwise it is called
+        with every batch of icons, as soon as they are rendered, and with the ones, that were rendered before, first.
+        """
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+
+            callback(key, list(self._memory_cache[key]))
+
+            return
+
+        self._cancel_all_but(key)
+
+        if key not in self._loading:
+            job = _IconJob(key)
+            job.icons_rendered.connect(self._on_icons_rendered)
+            job.finished.connect(self._on_job_finished)
+
+            self._loading[key] = _LoadingIconSet(job)
+            self._jobs.append(job)
+
+            job.start(QThread.LowPriority)
+
+        loading_icon_set = self._loading[key]
+
+        if loading_icon_set.entries:
+            callback(key, list(loading_icon_set.entries))
+
+        loading_icon_set.callbacks.append(callback)
+
+    def wait_for_done(self):
+        """
+        Blocks, until all icons are rendered and handed out.
+        """
+        while self._jobs:
+            self._jobs[0].wait()
+
+            # hands out the icons, that are still queued up
+            QCoreApplication.processEvents()
+
+    def _cancel_all_but(self, key: IconSetKey):
+        for other_key in [other_key for other_key in self._loading if other_key != key]:
+            self._loading.pop(other_key).job.cancelled = True
+
+    def _on_icons_rendered(self, job: _IconJob, entries: List[ObjectIconEntry]):
+        loading_icon_set = self._loading.get(job.key)
+
+        if loading_icon_set is None or loading_icon_set.job is not job:
+            # cancelled
+            return
+
+        loading_icon_set.entries.extend(entries)
+
+        for callback in loading_icon_set.callbacks:
+            callback(job.key, entries)
+
+    def _on_job_finished(self):
+        job = self.sender()
+
+        self._jobs.remove(job)
+
+        loading_icon_set = self._loading.get(job.key)
+
+        if loading_icon_set is None or loading_icon_set.job is not job:
+            return
+
+        del self._loading[job.key]
+
+        if job.completed:
+            self._memory_cache[job.key] = loading_icon_set.entries
+
+            while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def object_icon_loader() -> ObjectIconLoader:
+    """
+    Returns the loader shared by all widgets, so that every icon set is only rendered once.
+    """
+    return ObjectIconLoader()
@@ -1,24 +1,216 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Union
+
+from PySide2.QtCore import QAbstractListModel, QItemSelection, QItemSelectionModel, QModelIndex, QObject
 from PySide2.QtGui import QMouseEvent, QWindow, Qt
-from PySide2.QtWidgets import QListWidget, QSizePolicy
+from PySide2.QtWidgets import QListView, QSizePolicy
 
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import LevelObject
+from foundry.game.level.Level import LevelChange
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.ContextMenu import ContextMenu
 
+ListObject = Union[LevelObject, EnemyObject]
+
+
+class ObjectListModel(QAbstractListModel):
+    """
+    The objects and enemies/items of a level, by their description.
+
+    Changes are compared against the last known objects by identity, so that only the rows, that were actually
+    inserted, removed, moved or changed, are reported to the view, which then keeps its scroll position and doesn't
+    have to lay out every row again.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super(ObjectListModel, self).__init__(parent)
+
+        self._objects: List[ListObject] = []
+        self._descriptions: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._objects)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._descriptions[index.row()]
+        elif role == Qt.UserRole:
+            return self._objects[index.row()]
+
+        return None
+
+    def object_at(self, row: int) -> ListObject:
+        return self._objects[row]
+
+    def set_objects(self, objects: List[ListObject]):
+        new_ids = {id(obj) for obj in objects}
+
+        if not any(id(obj) in new_ids for obj in self._objects):
+            # e. g. a new level or an undo, which recreates all objects; nothing to keep
+            self.beginResetModel()
+
+            self._objects = list(objects)
+            self._descriptions = [obj.description for obj in objects]
+
+            self.endResetModel()
+
+            return
+
+        self._remove_missing(new_ids)
+        self._move_into_order(objects)
+        self._insert_new(objects)
+        self._update_descriptions()
+
+    def _remove_missing(self, new_ids):
+        row = len(self._objects) - 1
+
+        # from the back, so that the rows still to be checked don't shift
+        while row >= 0:
+            if id(self._objects[row]) in new_ids:
+                row -= 1
+                continue
+
+            last_row = row
+
+            while row >= 0 and id(self._objects[row]) not in new_ids:
+                row -= 1
+
+            self.beginRemoveRows(QModelIndex(), row + 1, last_row)
+
+            del self._objects[row + 1 : last_row + 1]
+            del self._descriptions[row + 1 : last_row + 1]
+
+            self.endRemoveRows()
+
+    def _move_into_order(self, objects: List[ListObject]):
+        old_rows = {id(obj): row for row, obj in enumerate(self._objects)}
+
+        kept_objects = [obj for obj in objects if id(obj) in old_rows]
+
+        # the longest sequence of objects, that are already in the right order, stays; only the others are moved
+        staying_ids = {id(obj) for obj in _longest_increasing_subsequence(kept_objects, old_rows)}
+
+        for target_index, obj in enumerate(kept_objects):
+            if id(obj) in staying_ids:
+                continue
+
+            row = self._row_of(obj)
+
+            # the object before it is either staying or was already moved into place
+            destination = self._row_of(kept_objects[target_index - 1]) + 1 if target_index > 0 else 0
+
+            if destination in (row, row + 1):
+                continue
+
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+
+            if destination > row:
+                destination -= 1
+
+            self._objects.insert(destination, self._objects.pop(row))
+            self._descriptions.insert(destination, self._descriptions.pop(row))
 
-class ObjectList(QListWidget):
+            self.endMoveRows()
+
+    def _row_of(self, obj: ListObject) -> int:
+        return next(row for row, other_object in enumerate(self._objects) if other_object is obj)
+
+    def _insert_new(self, objects: List[ListObject]):
+        # the kept objects are in the right order now, so the new ones only need to be put into the gaps
+        row = 0
+
+        while row < len(objects):
+            if row < len(self._objects) and self._objects[row] is objects[row]:
+                row += 1
+                continue
+
+            # the new objects go on until the next kept one, which is still in this row
+            next_kept_object = self._objects[row] if row < len(self._objects) else None
+
+            last_row = row
+
+            while last_row + 1 < len(objects) and objects[last_row + 1] is not next_kept_object:
+                last_row += 1
+
+            new_objects = objects[row : last_row + 1]
+
+            self.beginInsertRows(QModelIndex(), row, last_row)
+
+            self._objects[row:row] = new_objects
+            self._descriptions[row:row] = [obj.description for obj in new_objects]
+
+            self.endInsertRows()
+
+            row = last_row + 1
+
+    def _update_descriptions(self):
+        for row, obj in enumerate(self._objects):
+            if self._descriptions[row] != obj.description:
+                self._descriptions[row] = obj.description
+
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+
+def _longest_increasing_subsequence(objects: List[ListObject], rows: Dict[int, int]) -> List[ListObject]:
+    """
+    Returns the longest subsequence of the objects, whose rows are increasing, using patience sorting.
+    """
+    # the last object of the best subsequence of every length, and the object before each object in its subsequence
+    tails: List[ListObject] = []
+    tail_rows: List[int] = []
+    previous: Dict[int, Optional[ListObject]] = {}
+
+    for obj in objects:
+        row = rows[id(obj)]
+        length = bisect_left(tail_rows, row)
+
+        previous[id(obj)] = tails[length - 1] if length > 0 else None
+
+        if length == len(tails):
+            tails.append(obj)
+            tail_rows.append(row)
+        else:
+            tails[length] = obj
+            tail_rows[length] = row
+
+    run = []
+    obj = tails[-1] if tails else None
+
+    while obj is not None:
+        run.append(obj)
+        obj = previous[id(obj)]
+
+    return run[::-1]
+
+
+class ObjectList(QListView):
     def __init__(self, parent: QWindow, level_ref: LevelRef, context_menu: ContextMenu):
         super(ObjectList, self).__init__(parent=parent)
 
         self.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
 
         self.setSelectionMode(self.ExtendedSelection)
+        self.setUniformItemSizes(True)
+
+        self.setModel(ObjectListModel(self))
 
         self.level_ref: LevelRef = level_ref
-        self.level_ref.data_changed.connect(self.update_content)
+        self.level_ref.level_changed.connect(self._on_level_changed)
 
         self.context_menu = context_menu
 
-        self.itemSelectionChanged.connect(self.on_selection_changed)
+        # set while the selection is taken over from the level, so it is not reported back to it
+        self._updating_selection = False
+
+        self.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
         self.setWhatsThis(
             "<b>Object List</b><br/>"
@@ -44,56 +236,69 @@ class ObjectList(QListWidget):
             return super(ObjectList, self).mouseReleaseEvent(event)
 
     def on_right_down(self, event: QMouseEvent):
-        item_under_mouse = self.itemAt(event.pos())
+        index = self.indexAt(event.pos())
 
-        if item_under_mouse is None:
+        if not index.isValid():
             event.ignore()
             return
 
-        if not item_under_mouse.isSelected():
+        if not self.selectionModel().isSelected(index):
             self.clearSelection()
 
-            index = self.indexFromItem(item_under_mouse)
-
             selected_object = self.level_ref.level.get_all_objects()[index.row()]
 
             self.level_ref.selected_objects = [selected_object]
 
     def on_right_up(self, event):
-        item_under_mouse = self.itemAt(event.pos())
-
-        if item_under_mouse is None:
+        if not self.indexAt(event.pos()).isValid():
             event.ignore()
             return
 
         self.context_menu.as_list_menu().popup(event.globalPos())
 
+    def _on_level_changed(self, changes: LevelChange):
+        if changes & (LevelChange.OBJECTS | LevelChange.ENEMIES):
+            self.update_content()
+        elif changes & LevelChange.SELECTION:
+            # the objects are still the same, so only the selection needs to be taken over
+            self._take_over_selection(self.level_ref.get_all_objects())
+
     def update_content(self):
         level_objects = self.level_ref.get_all_objects()
 
-        labels = [obj.description for obj in level_objects]
+        self.model().set_objects(level_objects)
+
+        self._take_over_selection(level_objects)
+
+    def _take_over_selection(self, level_objects: List[ListObject]):
+        selected_rows = [row for row, level_object in enumerate(level_objects) if level_object.selected]
 
-        self.blockSignals(True)
+        if selected_rows == sorted(index.row() for index in self.selectionModel().selectedRows()):
+            return
 
-        self.clear()
+        selection = QItemSelection()
 
-        self.addItems(labels)
+        for row in selected_rows:
+            selection.select(self.model().index(row), self.model().index(row))
 
-        for index, level_object in enumerate(level_objects):
-            item = self.item(index)
+        self._updating_selection = True
 
-            item.setData(Qt.UserRole, level_object)
-            item.setSelected(level_object.selected)
+        self.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
 
-        self.blockSignals(False)
+        self._updating_selection = False
 
-        if self.selectedIndexes():
-            self.scrollTo(self.selectedIndexes()[-1])
+        if selected_rows:
+            self.scrollTo(self.model().index(selected_rows[-1]))
 
     def selected_objects(self):
-        return [self.item(index.row()).data(Qt.UserRole) for index in self.selectedIndexes()]
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+
+        return [self.model().object_at(row) for row in rows]
 
     def on_selection_changed(self):
+        if self._updating_selection:
+            return
+
         selected_objects = self.selected_objects()
 
         selection_not_changed = selected_objects == self.level_ref.selected_objects
@@ -1,5 +1,4 @@
-from itertools import product
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from PySide2.QtCore import QMimeData, QSize, Qt, Signal, SignalInstance
 from PySide2.QtGui import QColor, QDrag, QImage, QMouseEvent, QPaintEvent, QPainter
@@ -7,10 +6,8 @@ from PySide2.QtWidgets import QGridLayout, QSizePolicy, QWidget
 
 from foundry.game.gfx.Palette import bg_color_for_palette
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
-from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
 from foundry.game.gfx.objects.LevelObject import LevelObject, get_minimal_icon_object
-from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
-from smb3parse.objects import MAX_DOMAIN, MAX_ENEMY_ITEM_ID, MAX_ID_VALUE
+from foundry.gui.ObjectIconLoader import IconSetKey, ObjectIconEntry, object_icon_loader
 from smb3parse.objects.enemy_item import EnemyItem
 
 
@@ -21,7 +18,7 @@ class ObjectIcon(QWidget):
     clicked: SignalInstance = Signal()
     object_placed: SignalInstance = Signal()
 
-    def __init__(self, level_object: Optional[LevelObject] = None):
+    def __init__(self, level_object: Optional[LevelObject] = None, image: Optional[QImage] = None):
         super(ObjectIcon, self).__init__()
 
         size_policy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -33,7 +30,7 @@ class ObjectIcon(QWidget):
         self.object = None
         self.image = QImage()
 
-        self.set_object(level_object)
+        self.set_object(level_object, image)
 
         self.draw_background_color = True
 
@@ -63,11 +60,15 @@ class ObjectIcon(QWidget):
         if drag.exec_() == Qt.MoveAction:
             self.object_placed.emit()
 
-    def set_object(self, level_object: Union[LevelObject, EnemyObject]):
+    def set_object(self, level_object: Union[LevelObject, EnemyObject], image: Optional[QImage] = None):
+        """
+        :param level_object: The object to show, or None to show nothing.
+        :param image: The already rendered icon of the object, if there is one.
+        """
         if level_object is not None:
             self.object = get_minimal_icon_object(level_object)
 
-            self.image = self.object.as_image()
+            self.image = image if image is not None else self.object.as_image()
             self.setToolTip(self.object.description)
         else:
             self.image = QImage()
@@ -128,8 +129,11 @@ class ObjectToolBox(QWidget):
 
         self._layout.setAlignment(Qt.AlignHCenter)
 
-    def add_object(self, level_object: Union[EnemyItem, LevelObject], index: int = -1):
-        icon = ObjectIcon(level_object)
+        # the icon set, that is currently being added, to ignore the icons of ones, that were requested before
+        self._icon_set_key: Optional[IconSetKey] = None
+
+    def add_object(self, level_object: Union[EnemyItem, LevelObject], index: int = -1, image: Optional[QImage] = None):
+        icon = ObjectIcon(level_object, image)
 
         icon.clicked.connect(self._on_icon_clicked)
         icon.object_placed.connect(lambda: self.object_placed.emit(icon))
@@ -140,37 +144,49 @@ class ObjectToolBox(QWidget):
         self._layout.addWidget(icon, index // 2, index % 2)
 
     def add_from_object_set(self, object_set_index: int, graphic_set_index: int = -1):
+        """
+        Adds the objects of the object set, as soon as their icons are rendered in the background.
+        """
         if graphic_set_index == -1:
             graphic_set_index = object_set_index
 
-        factory = LevelObjectFactory(
-            object_set_index, graphic_set_index, 0, [], vertical_level=False, size_minimal=True
-        )
+        self._load_icons(object_set_index, graphic_set_index, self._add_level_object_icons)
+
+    def add_from_enemy_set(self, object_set_index: int, graphic_set_index: int = -1):
+        """
+        Adds the enemies/items of the object set, as soon as their icons are rendered in the background.
+
+        The graphics set doesn't change how enemies/items look, but asking for the same icon set as the object toolbox
+        means, they are only rendered once.
+        """
+        if graphic_set_index == -1:
+            graphic_set_index = object_set_index
 
-        object_ids = list(range(0x00, 0x10)) + list(range(0x10, MAX_ID_VALUE, 0x10))
+        self._load_icons(object_set_index, graphic_set_index, self._add_enemy_icons)
 
-        for domain, obj_index in product(range(MAX_DOMAIN + 1), object_ids):
-            level_object = factory.from_properties(
-                domain=domain, object_index=obj_index, x=0, y=0, length=None, index=0
-            )
+    def _load_icons(self, object_set_index: int, graphic_set_index: int, callback):
+        loader = object_icon_loader()
 
-            if not isinstance(level_object, LevelObject) or level_object.description in ["MSG_NOTHING", "MSG_CRASH"]:
-                continue
+        self._icon_set_key = loader.key_for(object_set_index, graphic_set_index)
 
-            self.add_object(level_object)
+        loader.load(self._icon_set_key, callback)
 
-    def add_from_enemy_set(self, object_set_index: int):
-        factory = EnemyItemFactory(object_set_index, 0)
+    def _add_level_object_icons(self, key: IconSetKey, entries: List[ObjectIconEntry]):
+        self._add_icons(key, [entry for entry in entries if isinstance(entry.object, LevelObject)])
 
-        for obj_index in range(MAX_ENEMY_ITEM_ID + 1):
-            enemy_item = factory.from_properties(obj_index, x=0, y=0)
+    def _add_enemy_icons(self, key: IconSetKey, entries: List[ObjectIconEntry]):
+        self._add_icons(key, [entry for entry in entries if isinstance(entry.object, EnemyObject)])
 
-            if enemy_item.description in ["MSG_NOTHING", "MSG_CRASH"]:
-                continue
+    def _add_icons(self, key: IconSetKey, entries: List[ObjectIconEntry]):
+        if key != self._icon_set_key:
+            return
 
-            self.add_object(enemy_item)
+        for entry in entries:
+            self.add_object(entry.object, image=entry.image)
 
     def clear(self):
+        self._icon_set_key = None
+
         self._extract_objects()
 
     def _on_icon_clicked(self):
@@ -190,7 +206,7 @@ class ObjectToolBox(QWidget):
 
     def index_of_object(self, level_object):
         for index in range(self._layout.count()):
-            if self._layout.itemAtPosition(index // 2, index % 2).widget().object == level_object:
+            if self._layout.itemAtPosition(index // 2, index % 2).widget().object.has_same_data(level_object):
                 return index
         else:
             return -1
@@ -212,8 +228,8 @@ class ObjectToolBox(QWidget):
     def place_at_front(self, level_object):
         objects = self._extract_objects()
 
-        if level_object in objects:
-            objects.remove(level_object)
+        # the same object might come from another toolbox or the dropdown as a different instance
+        objects = [obj for obj in objects if not obj.has_same_data(level_object)]
 
         objects.insert(0, level_object)
 
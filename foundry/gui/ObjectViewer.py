@@ -9,6 +9,7 @@ from foundry.game.gfx.drawable.Block import Block, get_block
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.gfx.objects.LevelObjectList import LevelObjectList
 from foundry.gui.CustomChildWindow import CustomChildWindow
 from foundry.gui.LevelSelector import OBJECT_SET_ITEMS
 from foundry.gui.Spinner import Spinner
@@ -142,7 +143,9 @@ class ObjectDrawArea(QWidget):
     def __init__(self, parent, object_set, graphic_set=1, palette_index=0):
         super(ObjectDrawArea, self).__init__(parent)
 
-        self.object_factory = LevelObjectFactory(object_set, graphic_set, palette_index, [], False, size_minimal=True)
+        self.object_factory = LevelObjectFactory(
+            object_set, graphic_set, palette_index, LevelObjectList(), False, size_minimal=True
+        )
 
         self.current_object = self.object_factory.from_data(bytearray([0x0, 0x0, 0x0]), 0)
 
@@ -0,0 +1,218 @@
+import logging
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from time import perf_counter
+from typing import Deque, Dict, List, Optional
+
+from PySide2.QtCore import QPoint, QRect, QSize
+from PySide2.QtGui import QColor, QFont, QFontMetrics, QPainter, Qt
+
+from foundry.game.gfx.drawable.Block import Block
+from foundry.gui.settings import default_settings_dir
+
+logger = logging.getLogger(__name__)
+# every frame would be a line, so they only go into the log file and not wherever else the application logs to
+logger.propagate = False
+
+# how many frames to keep around, for averaging and the log
+HISTORY_LENGTH = 100
+
+LOG_FILE = default_settings_dir / "paint.log"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+
+OVERLAY_BACKGROUND = QColor(0x00, 0x00, 0x00, 0xB0)
+OVERLAY_TEXT_COLOR = QColor(0xFF, 0xFF, 0xFF)
+OVERLAY_MARGIN = 5
+
+
+class FrameStatistics:
+    def __init__(self):
+        self.stage_times: Dict[str, float] = {}
+        self.total_time = 0.0
+
+        self.object_count = 0
+        self.enemy_count = 0
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        blocks_drawn = self.cache_hits + self.cache_misses
+
+        if blocks_drawn == 0:
+            return 1.0
+
+        return self.cache_hits / blocks_drawn
+
+    def __str__(self):
+        stages = ", ".join(f"{name} {seconds * 1000:.2f}ms" for name, seconds in self.stage_times.items())
+
+        return (
+            f"{self.total_time * 1000:.2f}ms total ({stages}); "
+            f"{self.object_count} objects, {self.enemy_count} enemies; "
+            f"block cache {self.cache_hits} hits, {self.cache_misses} misses"
+        )
+
+
+class _Stage:
+    def __init__(self, frame: FrameStatistics, name: str):
+        self.frame = frame
+        self.name = name
+
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *_):
+        # stages can be entered multiple times a frame, e. g. in a loop over all objects
+        self.frame.stage_times[self.name] = self.frame.stage_times.get(self.name, 0.0) + perf_counter() - self.start
+
+
+class _NoStage:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *_):
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+
+class PaintProfiler:
+    """
+    Measures how long the stages of drawing a level take, together with the block cache hit rate and object counts.
+
+    Does nothing, unless enabled. The last frames are kept in the history, for the on screen overlay, and are written
+    into a rotating log file in the settings directory.
+    """
+
+    def __init__(self):
+        self._enabled = False
+
+        self.history: Deque[FrameStatistics] = deque(maxlen=HISTORY_LENGTH)
+
+        self._frame: Optional[FrameStatistics] = None
+        self._frame_start = 0.0
+
+        self._cache_hits_at_start = 0
+        self._cache_misses_at_start = 0
+
+        self._log_handler: Optional[RotatingFileHandler] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        if value == self._enabled:
+            return
+
+        self._enabled = value
+
+        if value:
+            self._log_handler = RotatingFileHandler(str(LOG_FILE), maxBytes=LOG_FILE_MAX_BYTES, backupCount=1)
+            self._log_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+
+            logger.addHandler(self._log_handler)
+            logger.setLevel(logging.INFO)
+        else:
+            logger.removeHandler(self._log_handler)
+            self._log_handler.close()
+
+            self._log_handler = None
+            self.history.clear()
+
+    def begin_frame(self, object_count: int, enemy_count: int):
+        if not self._enabled:
+            return
+
+        self._frame = FrameStatistics()
+        self._frame.object_count = object_count
+        self._frame.enemy_count = enemy_count
+
+        self._cache_hits_at_start = Block.cache_hits
+        self._cache_misses_at_start = Block.cache_misses
+
+        self._frame_start = perf_counter()
+
+    def stage(self, name: str):
+        """
+        Returns a context manager, that adds the time spent in it to the given stage of the current frame.
+        """
+        if self._frame is None:
+            return _NO_STAGE
+
+        return _Stage(self._frame, name)
+
+    def end_frame(self):
+        if self._frame is None:
+            return
+
+        self._frame.total_time = perf_counter() - self._frame_start
+
+        self._frame.cache_hits = Block.cache_hits - self._cache_hits_at_start
+        self._frame.cache_misses = Block.cache_misses - self._cache_misses_at_start
+
+        self.history.append(self._frame)
+
+        logger.info(str(self._frame))
+
+        self._frame = None
+
+    def overlay_lines(self) -> List[str]:
+        if not self.history:
+            return []
+
+        last_frame = self.history[-1]
+        average_time = sum(frame.total_time for frame in self.history) / len(self.history)
+
+        lines = [
+            f"Frame: {last_frame.total_time * 1000:.2f}ms (avg of {len(self.history)}: {average_time * 1000:.2f}ms)",
+        ]
+
+        for name, seconds in last_frame.stage_times.items():
+            lines.append(f"  {name}: {seconds * 1000:.2f}ms")
+
+        lines.append(f"Objects: {last_frame.object_count}, Enemies: {last_frame.enemy_count}")
+        lines.append(
+            f"Block cache: {last_frame.cache_hit_rate:.0%} hits "
+            f"({last_frame.cache_hits} hits, {last_frame.cache_misses} misses, {len(Block._block_cache)} cached)"
+        )
+
+        return lines
+
+    def draw_overlay(self, painter: QPainter, visible_rect: QRect):
+        lines = self.overlay_lines()
+
+        if not lines:
+            return
+
+        painter.save()
+
+        font = QFont("Monospace")
+        font.setStyleHint(QFont.TypeWriter)
+
+        painter.setFont(font)
+
+        metrics = QFontMetrics(font)
+
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 2 * OVERLAY_MARGIN
+        height = metrics.height() * len(lines) + 2 * OVERLAY_MARGIN
+
+        # draw into the top left corner of the part of the level, that is currently scrolled into view
+        overlay_rect = QRect(visible_rect.topLeft() + QPoint(OVERLAY_MARGIN, OVERLAY_MARGIN), QSize(width, height))
+
+        painter.fillRect(overlay_rect, OVERLAY_BACKGROUND)
+
+        painter.setPen(OVERLAY_TEXT_COLOR)
+        painter.drawText(
+            overlay_rect.adjusted(OVERLAY_MARGIN, OVERLAY_MARGIN, -OVERLAY_MARGIN, -OVERLAY_MARGIN),
+            Qt.AlignLeft | Qt.AlignTop,
+            "\n".join(lines),
+        )
+
+        painter.restore()
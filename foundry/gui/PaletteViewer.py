@@ -6,10 +6,10 @@ from PySide2.QtWidgets import QFrame, QGridLayout, QGroupBox, QHBoxLayout, QLabe
 
 from foundry.game.gfx.Palette import (
     COLORS_PER_PALETTE,
-    NESPalette,
     PALETTES_PER_PALETTES_GROUP,
     PALETTE_GROUPS_PER_OBJECT_SET,
     load_palette_group,
+    nes_palette,
 )
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.CustomDialog import CustomDialog
@@ -52,7 +52,7 @@ class PaletteWidget(QWidget):
         layout = QHBoxLayout(self)
 
         for color_index in range(COLORS_PER_PALETTE):
-            color = QColor(*NESPalette[palette[palette_number][color_index]])
+            color = QColor(*nes_palette()[palette[palette_number][color_index]])
 
             layout.addWidget(ColorSquare(color))
 
@@ -12,14 +12,14 @@ from PySide2.QtWidgets import (
     QComboBox,
 )
 
-from PySide2.QtGui import QIcon, QImage, QColor, Qt, QPixmap
-from PySide2.QtCore import QRect
-from foundry.game.gfx.objects.EnemyItem import MASK_COLOR
+from PySide2.QtGui import QIcon, QPixmap
 
-from foundry import icon, data_dir
+from foundry import icon
+from foundry.game.gfx.sprites import load_sprite
 from foundry.gui.CustomDialog import CustomDialog
 from foundry.gui.settings import RESIZE_LEFT_CLICK, RESIZE_RIGHT_CLICK, SETTINGS, load_settings, save_settings
 from foundry.gui.HorizontalLine import HorizontalLine
+from foundry.gui.PaintProfiler import LOG_FILE
 from smb3parse.constants import (
     POWERUP_MUSHROOM,
     POWERUP_RACCOON,
@@ -49,9 +49,6 @@ POWERUPS = [
     ("Tanooki Mario with P-Wing", 55, 53, POWERUP_TANOOKI, True),
 ]
 
-png = QImage(str(data_dir / "gfx.png"))
-png.convertTo(QImage.Format_RGB888)
-
 
 class SettingsDialog(CustomDialog):
     def __init__(self, parent=None):
@@ -94,6 +91,28 @@ class SettingsDialog(CustomDialog):
         mouse_box.layout().addLayout(scroll_layout)
         mouse_box.layout().addLayout(resize_layout)
 
+        # debug
+
+        debug_box = QGroupBox("Debug", self)
+        debug_box.setLayout(QVBoxLayout())
+
+        paint_statistics_layout = QHBoxLayout()
+
+        label = QLabel("Show paint statistics:")
+        label.setToolTip(
+            "Shows how long drawing the level took and where the time went. "
+            f"The statistics are also logged to {LOG_FILE}."
+        )
+        self._paint_statistics_check_box = QCheckBox("Enabled")
+        self._paint_statistics_check_box.setChecked(SETTINGS["show_paint_statistics"])
+        self._paint_statistics_check_box.toggled.connect(self._update_settings)
+
+        paint_statistics_layout.addWidget(label)
+        paint_statistics_layout.addStretch(1)
+        paint_statistics_layout.addWidget(self._paint_statistics_check_box)
+
+        debug_box.layout().addLayout(paint_statistics_layout)
+
         # emulator command
 
         self.emulator_command_input = QLineEdit(self)
@@ -149,6 +168,7 @@ class SettingsDialog(CustomDialog):
         layout = QVBoxLayout(self)
         layout.addWidget(mouse_box)
         layout.addWidget(command_box)
+        layout.addWidget(debug_box)
 
         self.update()
 
@@ -168,6 +188,8 @@ class SettingsDialog(CustomDialog):
 
         SETTINGS["default_powerup"] = self.powerup_combo_box.currentIndex()
 
+        SETTINGS["show_paint_statistics"] = self._paint_statistics_check_box.isChecked()
+
         self.update()
 
     def _get_emulator_path(self):
@@ -180,11 +202,7 @@ class SettingsDialog(CustomDialog):
 
     @staticmethod
     def _load_from_png(x: int, y: int) -> QIcon:
-        image = png.copy(QRect(x * 16, y * 16, 16, 16))
-        mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
-        image.setAlphaChannel(mask)
-
-        pixmap = QPixmap.fromImage(image)
+        pixmap = QPixmap.fromImage(load_sprite(x, y))
         icon = QIcon(pixmap)
 
         return icon
@@ -91,7 +91,7 @@ class TabbedToolBox(QTabWidget):
         self._objects_toolbox.add_from_object_set(object_set_index, graphic_set_index)
 
         self._enemies_toolbox.clear()
-        self._enemies_toolbox.add_from_enemy_set(object_set_index)
+        self._enemies_toolbox.add_from_enemy_set(object_set_index, graphic_set_index)
 
     def add_recent_object(self, level_object: Union[EnemyObject, LevelObject]):
         self._recent_toolbox.place_at_front(level_object)
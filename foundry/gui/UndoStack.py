@@ -1,12 +1,11 @@
 from typing import List, Optional
 
-from PySide2.QtCore import Signal, SignalInstance
-from PySide2.QtWidgets import QWidget
+from PySide2.QtCore import QObject, Signal, SignalInstance
 
 from foundry.game.level import LevelByteData
 
 
-class UndoStack(QWidget):
+class UndoStack(QObject):
     undo_stack_cleared: SignalInstance = Signal()
     undo_stack_saved: SignalInstance = Signal()
     undo_complete: SignalInstance = Signal()
@@ -59,6 +58,16 @@ class UndoStack(QWidget):
 
         return data
 
+    @property
+    def current_state(self) -> Optional[LevelByteData]:
+        """
+        The level data, that an undo would go back from, i. e. the last one saved, undone to or redone to.
+        """
+        if not self.undo_stack:
+            return None
+
+        return self.undo_stack[self.undo_index]
+
     @property
     def undo_available(self):
         return self.undo_index > 0
@@ -2,9 +2,28 @@ import pytest
 
 from foundry.conftest import level_1_1_enemy_address, level_1_1_object_address
 from foundry.gui.MainWindow import MainWindow
+from foundry.gui.ObjectIconLoader import object_icon_loader
 from smb3parse.objects.object_set import PLAINS_OBJECT_SET
 
 
+@pytest.fixture(autouse=True)
+def icon_cache_dir(tmp_path, monkeypatch):
+    # keep the tests from reading or filling the icon cache in the home directory of whoever runs them
+    monkeypatch.setattr("foundry.gui.ObjectIconLoader.cache_dir", tmp_path)
+
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def paint_log_file(tmp_path, monkeypatch):
+    # the same for the log of the paint statistics
+    log_file = tmp_path / "paint.log"
+
+    monkeypatch.setattr("foundry.gui.PaintProfiler.LOG_FILE", log_file)
+
+    return log_file
+
+
 @pytest.fixture
 def main_window(qtbot):
     # mock the rom loading, since it is a modal dialog. the rom is loaded in conftest.py
@@ -16,7 +35,13 @@ def main_window(qtbot):
 
     qtbot.addWidget(main_window)
 
-    return main_window
+    # the object icons are rendered in the background
+    object_icon_loader().wait_for_done()
+
+    yield main_window
+
+    # the levels next to the current one are loaded in the background, which needs to finish before the window is gone
+    main_window.level_loader.wait_for_done()
 
 
 def mocked_open_rom_and_level_select(self: MainWindow, _):
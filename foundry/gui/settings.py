@@ -21,6 +21,7 @@ SETTINGS["draw_invisible_items"] = True
 SETTINGS["draw_autoscroll"] = False
 SETTINGS["block_transparency"] = True
 SETTINGS["object_scroll_enabled"] = False
+SETTINGS["show_paint_statistics"] = False
 
 default_settings_dir = pathlib.Path.home() / ".smb3foundry"
 default_settings_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,37 @@
+from foundry.game.File import ROM
+from foundry.gui.AutoScrollDrawer import auto_scroll_path, clear_auto_scroll_path_cache
+
+
+def test_path_is_cached():
+    # GIVEN a simulated auto scroll path
+    clear_auto_scroll_path_cache()
+
+    path = auto_scroll_path(0, 10)
+
+    # WHEN the same path is requested again
+    # THEN it is not simulated again
+    assert auto_scroll_path(0, 10) is path
+
+    # WHEN it is requested for a different start position
+    # THEN it is simulated separately
+    assert auto_scroll_path(0, 11) is not path
+
+
+def test_path_is_simulated_again_on_rom_change():
+    # GIVEN a simulated auto scroll path
+    clear_auto_scroll_path_cache()
+
+    path = auto_scroll_path(0, 10)
+
+    # WHEN one of the ROM bytes it was simulated from changes
+    address, value = next(iter(path.rom_bytes.items()))
+
+    rom = ROM()
+
+    try:
+        rom.write(address, bytes([(value + 1) % 256]))
+
+        # THEN it is simulated again
+        assert auto_scroll_path(0, 10) is not path
+    finally:
+        rom.write(address, bytes([value]))
@@ -0,0 +1,71 @@
+from PySide2.QtCore import QRect
+from PySide2.QtGui import QImage, QPainter
+
+from foundry.game.gfx.drawable.Block import Block
+from foundry.gui.LevelDrawer import LevelDrawer
+
+
+def _draw(drawer, level, dirty_rect=None):
+    image = QImage(level.get_rect(Block.SIDE_LENGTH).size(), QImage.Format_RGB888)
+    image.fill(0)
+
+    painter = QPainter(image)
+
+    if dirty_rect is not None:
+        # like the paint event of a widget does
+        painter.setClipRect(dirty_rect)
+
+    drawer.draw(painter, level, dirty_rect)
+    painter.end()
+
+    return image
+
+
+def test_render_context_is_kept_between_paints(level):
+    # GIVEN a level, that was drawn once
+    drawer = LevelDrawer()
+
+    _draw(drawer, level)
+
+    context = drawer._context_for(level)
+    block = context.block(0)
+
+    # WHEN it is drawn again
+    _draw(drawer, level)
+
+    # THEN the same context and blocks are used, instead of being read from the ROM again
+    assert drawer._context_for(level) is context
+    assert context.block(0) is block
+
+
+def test_render_context_is_replaced_on_header_change(level):
+    # GIVEN a level, that was drawn once
+    drawer = LevelDrawer()
+
+    _draw(drawer, level)
+
+    context = drawer._context_for(level)
+
+    # WHEN its header is changed
+    level.object_palette_index = (level.object_palette_index + 1) % 8
+
+    # THEN a new context is made for the changed palette
+    new_context = drawer._context_for(level)
+
+    assert new_context is not context
+    assert new_context.header is level.header
+
+
+def test_draw_dirty_rect(level):
+    # GIVEN a level and a part of it, that needs to be drawn again, e. g. after an object was moved
+    drawer = LevelDrawer()
+
+    dirty_rect = QRect(5 * Block.SIDE_LENGTH, 10 * Block.SIDE_LENGTH, 8 * Block.SIDE_LENGTH, 6 * Block.SIDE_LENGTH)
+
+    # WHEN only that part is drawn
+    partial_image = _draw(drawer, level, dirty_rect)
+
+    # THEN it looks the same, as when drawing the whole level
+    full_image = _draw(drawer, level)
+
+    assert partial_image.copy(dirty_rect) == full_image.copy(dirty_rect)
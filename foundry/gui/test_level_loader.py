@@ -0,0 +1,100 @@
+from PySide2.QtCore import QThread
+
+from foundry.conftest import (
+    level_1_1_enemy_address,
+    level_1_1_object_address,
+    level_1_2_enemy_address,
+    level_1_2_object_address,
+)
+from foundry.game.level.Level import Level
+from foundry.gui.LevelLoader import LevelAddress, LevelLoader, neighbouring_levels
+from foundry.gui.LevelSelector import LevelSelector
+from smb3parse.objects.object_set import HILLY_OBJECT_SET, PLAINS_OBJECT_SET
+
+level_1_1 = LevelAddress("Level 1-1", level_1_1_object_address, level_1_1_enemy_address, PLAINS_OBJECT_SET)
+level_1_2 = LevelAddress("Level 1-2", level_1_2_object_address, level_1_2_enemy_address, HILLY_OBJECT_SET)
+
+
+def test_level_is_loaded_in_background(qtbot):
+    # GIVEN a level loader
+    loader = LevelLoader()
+
+    # WHEN a level is loaded
+    with qtbot.waitSignal(loader.level_loaded) as blocker:
+        loader.load(level_1_1)
+
+    # THEN it is handed out, once it is done, with its signals usable in the GUI thread
+    level = blocker.args[0]
+
+    assert level.name == level_1_1.name
+    assert level.objects
+    assert level._signal_emitter.thread() == QThread.currentThread()
+    assert not loader.is_loading
+
+
+def test_loading_another_level_cancels_the_last(qtbot):
+    # GIVEN a level loader, that is loading a level
+    loader = LevelLoader()
+
+    loaded_levels = []
+    loader.level_loaded.connect(loaded_levels.append)
+
+    loader.load(level_1_1)
+
+    # WHEN another level is picked, before it is done
+    loader.load(level_1_2)
+    loader.wait_for_done()
+
+    # THEN only the level picked last is handed out
+    assert [level.name for level in loaded_levels] == [level_1_2.name]
+
+
+def _opened_from_level_selector(qtbot, world: int, level_in_world: int) -> LevelAddress:
+    level_selector = LevelSelector(None)
+    qtbot.addWidget(level_selector)
+
+    level_selector.world_list.setCurrentRow(world)
+    level_selector.level_list.setCurrentRow(level_in_world - 1)
+    level_selector.on_ok()
+
+    # the same as MainWindow.open_level_selector() opens
+    return LevelAddress(
+        level_selector.level_name,
+        level_selector.object_data_offset,
+        level_selector.enemy_data_offset,
+        level_selector.object_set,
+    )
+
+
+def test_prefetched_level_is_handed_out_right_away(qtbot):
+    # GIVEN a level loader, that prefetched the levels next to level 1-1
+    loader = LevelLoader()
+
+    loader.prefetch(neighbouring_levels(Level(*level_1_1)))
+    loader.wait_for_done()
+
+    # WHEN level 1-2 is opened from the level selector
+    level_1_2_from_selector = _opened_from_level_selector(qtbot, 1, 2)
+
+    loaded_levels = []
+    loader.level_loaded.connect(loaded_levels.append)
+
+    loader.load(level_1_2_from_selector)
+
+    # THEN it is handed out without waiting, under the name it was opened with
+    assert not loader.is_loading
+    assert [level.name for level in loaded_levels] == [level_1_2_from_selector.name]
+
+
+def test_neighbouring_levels(qtbot):
+    # GIVEN level 1-1
+    level = Level(*level_1_1)
+
+    # WHEN looking for the levels, that are likely to be opened next
+    neighbours = neighbouring_levels(level)
+
+    # THEN level 1-2, which comes after it in the level list, is one of them, as the level selector would open it
+    level_1_2_from_selector = _opened_from_level_selector(qtbot, 1, 2)
+
+    assert level_1_2_from_selector.key == level_1_2.key
+    assert level_1_2.key in [neighbour.key for neighbour in neighbours]
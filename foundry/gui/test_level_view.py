@@ -111,3 +111,27 @@ def test_wheel_event(scroll_amount, coordinates, wheel_delta, type_change, main_
     new_type = level_view.object_at(*coordinates).type
 
     assert new_type == original_type + type_change, (original_type, new_type)
+
+
+def test_paint_statistics(level_view, monkeypatch, paint_log_file):
+    # GIVEN the paint statistics are turned on
+    monkeypatch.setitem(SETTINGS, "show_paint_statistics", True)
+
+    # WHEN the level view is painted
+    level_view.repaint()
+
+    # THEN the time of every stage, the object counts and the block cache usage were recorded
+    profiler = level_view.level_drawer.profiler
+    frame = profiler.history[-1]
+
+    assert {"background", "objects", "render()", "overlays"} <= frame.stage_times.keys()
+    assert frame.object_count == len(level_view.level_ref.level.objects)
+    assert frame.enemy_count == len(level_view.level_ref.level.enemies)
+    assert frame.cache_hits + frame.cache_misses > 0
+
+    assert profiler.overlay_lines()
+
+    profiler.enabled = False
+
+    # THEN the frame was logged into the given log file
+    assert str(frame) in paint_log_file.read_text()
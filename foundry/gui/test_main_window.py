@@ -1,5 +1,6 @@
 from PySide2.QtCore import QPoint
 from PySide2.QtGui import Qt
+from PySide2.QtWidgets import QApplication
 
 
 def test_open(main_window):
@@ -27,3 +28,17 @@ def test_middle_click_adds_object(main_window, qtbot):
     assert new_object is not None
     assert new_object.domain == selected_object.domain
     assert new_object.obj_index == selected_object.obj_index
+
+
+def test_paste_without_copied_objects(main_window):
+    # GIVEN that nothing was copied
+    QApplication.clipboard().clear()
+    main_window.context_menu.copied_objects = None
+
+    undo_steps = len(main_window.level_ref.undo_stack)
+
+    # WHEN pasting
+    main_window._paste_objects()
+
+    # THEN there is nothing new to undo
+    assert len(main_window.level_ref.undo_stack) == undo_steps
@@ -1,4 +1,5 @@
 from foundry.conftest import level_1_2_enemy_address, level_1_2_object_address
+from foundry.gui.ObjectIconLoader import object_icon_loader
 from smb3parse.objects.object_set import HILLY_OBJECT_SET
 
 
@@ -14,6 +15,8 @@ def test_object_update_on_level_change(main_window):
 
     assert original_object_set != main_window.level_ref.object_set_number
 
+    object_icon_loader().wait_for_done()
+
     # THEN the objects in the dropdown should be changed
     new_first_object = object_dropdown.itemText(0)
 
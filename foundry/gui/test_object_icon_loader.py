@@ -0,0 +1,70 @@
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import LevelObject
+from foundry.gui.ObjectIconLoader import ObjectIconLoader
+from smb3parse.objects.object_set import PLAINS_GRAPHICS_SET, PLAINS_OBJECT_SET
+
+
+def test_icons_are_handed_out_in_order(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setattr("foundry.gui.ObjectIconLoader.cache_dir", tmp_path)
+
+    # GIVEN a loader without any cached icons
+    loader = ObjectIconLoader()
+    key = loader.key_for(PLAINS_OBJECT_SET, PLAINS_GRAPHICS_SET)
+
+    received = []
+
+    # WHEN the icons of an object set are loaded
+    loader.load(key, lambda _, entries: received.extend(entries))
+    loader.wait_for_done()
+
+    # THEN all level objects come first, followed by the enemies/items, each with an icon
+    assert received
+
+    kinds = [isinstance(entry.object, EnemyObject) for entry in received]
+
+    assert kinds == sorted(kinds)
+    assert isinstance(received[0].object, LevelObject)
+    assert all(not entry.image.isNull() for entry in received)
+
+
+def test_icons_are_restored_from_disk(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setattr("foundry.gui.ObjectIconLoader.cache_dir", tmp_path)
+
+    # GIVEN icons, that were rendered by another instance of the editor
+    first_loader = ObjectIconLoader()
+    key = first_loader.key_for(PLAINS_OBJECT_SET, PLAINS_GRAPHICS_SET)
+
+    rendered = []
+    first_loader.load(key, lambda _, entries: rendered.extend(entries))
+    first_loader.wait_for_done()
+
+    assert list(tmp_path.iterdir())
+
+    # WHEN they are loaded again
+    second_loader = ObjectIconLoader()
+
+    restored = []
+    second_loader.load(key, lambda _, entries: restored.extend(entries))
+    second_loader.wait_for_done()
+
+    # THEN the same objects with the same icons are restored
+    assert [entry.object.to_bytes() for entry in restored] == [entry.object.to_bytes() for entry in rendered]
+    assert [entry.image.size() for entry in restored] == [entry.image.size() for entry in rendered]
+
+
+def test_loaded_icons_are_handed_out_right_away(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setattr("foundry.gui.ObjectIconLoader.cache_dir", tmp_path)
+
+    # GIVEN a loader, that already loaded the icons of an object set
+    loader = ObjectIconLoader()
+    key = loader.key_for(PLAINS_OBJECT_SET, PLAINS_GRAPHICS_SET)
+
+    loader.load(key, lambda *_: None)
+    loader.wait_for_done()
+
+    # WHEN they are asked for again
+    received = []
+    loader.load(key, lambda _, entries: received.extend(entries))
+
+    # THEN they are handed out without waiting
+    assert received
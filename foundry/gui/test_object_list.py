@@ -0,0 +1,92 @@
+from typing import List
+
+from foundry.gui.ObjectList import ObjectListModel
+
+
+class _Object:
+    def __init__(self, description: str):
+        self.description = description
+        self.selected = False
+
+
+def _descriptions(model: ObjectListModel) -> List[str]:
+    return [model.index(row).data() for row in range(model.rowCount())]
+
+
+def _model_with_objects(count: int):
+    model = ObjectListModel()
+    objects = [_Object(f"object {index}") for index in range(count)]
+
+    model.set_objects(objects)
+
+    return model, objects
+
+
+def test_unchanged_objects_emit_nothing(qtbot):
+    # GIVEN a model with some objects
+    model, objects = _model_with_objects(5)
+
+    # WHEN the same objects are set again, e. g. after an object was moved in the level
+    with qtbot.assertNotEmitted(model.rowsInserted), qtbot.assertNotEmitted(model.rowsRemoved):
+        with qtbot.assertNotEmitted(model.modelReset), qtbot.assertNotEmitted(model.dataChanged):
+            model.set_objects(objects)
+
+    # THEN nothing is reported to the view
+    assert _descriptions(model) == [obj.description for obj in objects]
+
+
+def test_removed_object_only_removes_its_row(qtbot):
+    # GIVEN a model with some objects
+    model, objects = _model_with_objects(5)
+
+    # WHEN one of them is removed
+    with qtbot.waitSignal(model.rowsRemoved) as blocker, qtbot.assertNotEmitted(model.modelReset):
+        model.set_objects(objects[:2] + objects[3:])
+
+    # THEN only its row is removed
+    assert blocker.args[1:] == [2, 2]
+    assert _descriptions(model) == ["object 0", "object 1", "object 3", "object 4"]
+
+
+def test_object_brought_to_foreground_is_moved(qtbot):
+    # GIVEN a model with some objects
+    model, objects = _model_with_objects(5)
+
+    # WHEN one of them is moved to the end
+    with qtbot.waitSignal(model.rowsMoved) as blocker, qtbot.assertNotEmitted(model.rowsRemoved):
+        model.set_objects(objects[:1] + objects[2:] + objects[1:2])
+
+    # THEN a single move is reported
+    assert blocker.args[1:3] == [1, 1]
+    assert blocker.args[4] == 5
+    assert _descriptions(model) == ["object 0", "object 2", "object 3", "object 4", "object 1"]
+
+
+def test_inserted_object_only_inserts_its_row(qtbot):
+    # GIVEN a model with some objects
+    model, objects = _model_with_objects(5)
+
+    # WHEN a new object is added in the middle
+    new_object = _Object("new object")
+
+    with qtbot.waitSignal(model.rowsInserted) as blocker:
+        model.set_objects(objects[:3] + [new_object] + objects[3:])
+
+    # THEN only its row is inserted
+    assert blocker.args[1:] == [3, 3]
+    assert model.object_at(3) is new_object
+
+
+def test_changed_description_updates_row(qtbot):
+    # GIVEN a model with some objects
+    model, objects = _model_with_objects(5)
+
+    # WHEN the type of one of them changes
+    objects[4].description = "changed object"
+
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        model.set_objects(objects)
+
+    # THEN only its row is updated
+    assert blocker.args[0].row() == blocker.args[1].row() == 4
+    assert _descriptions(model)[4] == "changed object"
@@ -25,3 +25,52 @@ def test_world_map_drawing(world_number, qtbot):
     reference_image_path = str(reference_image_dir.joinpath(image_name))
 
     compare_images(image_name, reference_image_path, view.grab())
+
+
+def test_blocks_are_shared():
+    # GIVEN a world map
+    world_map = WorldMap(1)
+
+    # WHEN looking at the tiles with the same index
+    blocks_by_index = {}
+
+    for obj in world_map.objects:
+        blocks_by_index.setdefault(obj.block.index, set()).add(id(obj.block))
+
+    # THEN they all use the same block
+    assert all(len(blocks) == 1 for blocks in blocks_by_index.values())
+
+
+def test_rendered_map_is_cached(qtbot):
+    # GIVEN a world map, that was drawn before
+    world_map = WorldMap(1)
+
+    rendered_map = world_map.rendered_map(2)
+
+    # WHEN drawing it again at the same zoom level
+    # THEN it is not drawn again
+    assert world_map.rendered_map(2) is rendered_map
+
+    # WHEN its layout changes
+    address, layout_bytes = world_map.to_bytes()
+
+    layout_bytes[0] = (layout_bytes[0] + 1) % 0x100
+
+    world_map.from_bytes((address, layout_bytes))
+
+    # THEN it is drawn again, with the changed layout
+    assert world_map.rendered_map(2) is not rendered_map
+    assert world_map.to_bytes() == (address, layout_bytes)
+
+
+def test_moved_object_is_drawn_again(qtbot):
+    # GIVEN a world map, that was drawn before
+    world_map = WorldMap(1)
+
+    rendered_map = world_map.rendered_map(2)
+
+    # WHEN an object on it is moved
+    world_map.objects[0].move_by(1, 0)
+
+    # THEN the map is drawn again
+    assert world_map.rendered_map(2) is not rendered_map
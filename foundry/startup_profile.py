@@ -0,0 +1,155 @@
+"""
+Measures how long it takes to import every module and to go through every step of starting the editor.
+
+Enabled by starting smb3-foundry.py with --profile-startup. The report is printed to stderr, once the main window is
+shown. This module may only import from the standard library, so that it can be set up, before anything else is loaded.
+"""
+
+import builtins
+import importlib.util
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional
+
+PROFILE_STARTUP_ARGUMENT = "--profile-startup"
+
+# how many of the slowest imports to put into the report
+REPORTED_IMPORT_COUNT = 30
+
+
+class ImportTiming(NamedTuple):
+    module_name: str
+    total_time: float
+    self_time: float
+
+
+class StartupProfile:
+    """
+    Times imports by replacing builtins.__import__, while it is enabled. The self time of a module is the time it took
+    to import it, minus the time it took to import the modules it imported itself, i. e. mostly the time it took to run
+    its module level code.
+
+    Only meant to be used from the main thread, during startup.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+
+        self.imports: List[ImportTiming] = []
+        self.stage_times: Dict[str, float] = {}
+
+        self._start = perf_counter()
+        self._total_time: Optional[float] = None
+
+        self._original_import = builtins.__import__
+
+        # time spent importing nested modules, for every import currently in progress
+        self._child_times: List[float] = []
+
+        if self.enabled:
+            builtins.__import__ = self._import
+
+    @staticmethod
+    def from_arguments(argv: List[str]) -> "StartupProfile":
+        """
+        Enables the profile, if the startup argument is in the given arguments, and removes it from them.
+        """
+        enabled = PROFILE_STARTUP_ARGUMENT in argv
+
+        if enabled:
+            argv.remove(PROFILE_STARTUP_ARGUMENT)
+
+        return StartupProfile(enabled)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module_name = _absolute_module_name(name, globals, level)
+
+        # the fromlist can name submodules, which would be imported as part of this call
+        candidates = [module_name] + [f"{module_name}.{attribute}" for attribute in fromlist or () if attribute != "*"]
+        new_modules = [candidate for candidate in candidates if candidate not in sys.modules]
+
+        if not new_modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._child_times.append(0.0)
+
+        start = perf_counter()
+
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total_time = perf_counter() - start
+            child_time = self._child_times.pop()
+
+            if self._child_times:
+                self._child_times[-1] += total_time
+
+            imported_modules = [new_module for new_module in new_modules if new_module in sys.modules]
+
+            if imported_modules:
+                self.imports.append(ImportTiming(", ".join(imported_modules), total_time, total_time - child_time))
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Adds the time spent in the context to the given step of the startup.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.stage_times[name] = self.stage_times.get(name, 0.0) + perf_counter() - start
+
+    def finish(self):
+        """
+        Stops timing imports and prints the report. Does nothing, if the profile is not enabled or already finished.
+        """
+        if not self.enabled or self._total_time is not None:
+            return
+
+        self._total_time = perf_counter() - self._start
+
+        builtins.__import__ = self._original_import
+
+        print(self.report(), file=sys.stderr)
+
+    def report(self) -> str:
+        total_time = self._total_time if self._total_time is not None else perf_counter() - self._start
+
+        # the self times of all imports add up to the time spent importing
+        import_time = sum(timing.self_time for timing in self.imports)
+
+        lines = [
+            f"Startup took {total_time * 1000:.1f}ms, {import_time * 1000:.1f}ms of which were spent importing "
+            f"{len(self.imports)} modules.",
+            "",
+            "Steps:",
+        ]
+
+        for name, seconds in self.stage_times.items():
+            lines.append(f"{seconds * 1000:10.1f}ms  {name}")
+
+        lines.append("")
+        lines.append(f"Slowest imports (of {len(self.imports)}):")
+        lines.append(f"{'self':>12}  {'total':>10}  module")
+
+        for timing in sorted(self.imports, key=lambda timing: timing.self_time, reverse=True)[:REPORTED_IMPORT_COUNT]:
+            lines.append(f"{timing.self_time * 1000:10.1f}ms  {timing.total_time * 1000:8.1f}ms  {timing.module_name}")
+
+        return "\n".join(lines)
+
+
+def _absolute_module_name(name: str, globals_: Optional[dict], level: int) -> str:
+    if level == 0 or not globals_:
+        return name
+
+    try:
+        return importlib.util.resolve_name("." * level + name, globals_.get("__package__"))
+    except (ImportError, ValueError):
+        return name
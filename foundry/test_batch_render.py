@@ -0,0 +1,29 @@
+from foundry import root_dir
+from foundry.batch_render import LEVEL_JOB, WORLD_MAP_JOB, list_render_jobs, render_all
+from smb3parse.levels import WORLD_COUNT
+
+
+def test_list_render_jobs():
+    # WHEN all render jobs are listed
+    jobs = list_render_jobs()
+
+    # THEN every world map and level is in there once, with a unique file name
+    assert len([job for job in jobs if job.kind == WORLD_MAP_JOB]) == WORLD_COUNT
+    assert any(job.kind == LEVEL_JOB for job in jobs)
+
+    assert len({job.file_name for job in jobs}) == len(jobs)
+
+
+def test_render_all(tmp_path):
+    # GIVEN a world map and a level to render
+    world_map_job = next(job for job in list_render_jobs() if job.kind == WORLD_MAP_JOB)
+    level_job = next(job for job in list_render_jobs() if job.kind == LEVEL_JOB)
+
+    # WHEN they are rendered
+    results, _ = render_all(str(root_dir / "SMB3.nes"), tmp_path, processes=2, jobs=[world_map_job, level_job])
+
+    # THEN both were successfully saved as PNGs
+    assert [result.error for result in results] == [None, None]
+
+    assert (tmp_path / world_map_job.file_name).exists()
+    assert (tmp_path / level_job.file_name).exists()
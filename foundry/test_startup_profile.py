@@ -0,0 +1,64 @@
+import builtins
+
+from foundry.startup_profile import PROFILE_STARTUP_ARGUMENT, StartupProfile
+
+
+def test_from_arguments():
+    # GIVEN command line arguments with the profiling argument in them
+    argv = ["smb3-foundry.py", PROFILE_STARTUP_ARGUMENT, "SMB3.nes"]
+
+    # WHEN a profile is made from them
+    profile = StartupProfile.from_arguments(argv)
+
+    # THEN it is enabled and the argument was removed, so the ROM path is still the first argument
+    assert profile.enabled
+    assert argv == ["smb3-foundry.py", "SMB3.nes"]
+
+    profile.finish()
+
+
+def test_imports_are_timed(tmp_path, monkeypatch, capsys):
+    # GIVEN a module, that imports another module, neither of which was imported yet
+    (tmp_path / "startup_profile_outer.py").write_text("import startup_profile_inner\n")
+    (tmp_path / "startup_profile_inner.py").write_text("VALUE = 1\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    original_import = builtins.__import__
+
+    # WHEN it is imported, while the profile is enabled
+    profile = StartupProfile(enabled=True)
+
+    with profile.stage("import"):
+        __import__("startup_profile_outer")
+
+    profile.finish()
+
+    # THEN both modules were timed, with the time of the inner module not counting towards the self time of the outer
+    timings = {timing.module_name: timing for timing in profile.imports}
+
+    assert timings["startup_profile_outer"].total_time >= timings["startup_profile_inner"].total_time
+    assert timings["startup_profile_outer"].self_time <= (
+        timings["startup_profile_outer"].total_time - timings["startup_profile_inner"].total_time
+    )
+
+    assert "import" in profile.stage_times
+
+    # THEN the import function is restored and the report was printed
+    assert builtins.__import__ is original_import
+    assert "startup_profile_outer" in capsys.readouterr().err
+
+
+def test_disabled():
+    # GIVEN a profile, that is not enabled
+    original_import = builtins.__import__
+
+    profile = StartupProfile(enabled=False)
+
+    # WHEN a stage is timed
+    with profile.stage("stage"):
+        pass
+
+    # THEN nothing was recorded or changed
+    assert builtins.__import__ is original_import
+    assert not profile.stage_times
@@ -0,0 +1,64 @@
+import numpy
+
+from foundry import root_dir
+from foundry.world_overview import (
+    CELL_PADDING,
+    MARKER_COLOR,
+    compose_atlas,
+    draw_level_markers,
+    render_overview,
+    render_world_maps,
+)
+from smb3parse.levels import WORLD_COUNT
+
+
+def test_compose_atlas():
+    # GIVEN framebuffers of different sizes
+    framebuffers = [
+        numpy.full((height, width, 3), index, dtype=numpy.uint8)
+        for index, (height, width) in enumerate([(2, 4), (3, 2), (1, 1)])
+    ]
+
+    # WHEN they are put into an atlas with two columns
+    atlas = compose_atlas(framebuffers, columns=2)
+
+    # THEN every cell is as big as the largest framebuffer and every framebuffer is in its cell
+    cell_height, cell_width = 3 + CELL_PADDING, 4 + CELL_PADDING
+
+    assert atlas.shape == (2 * cell_height - CELL_PADDING, 2 * cell_width - CELL_PADDING, 3)
+
+    assert (atlas[0:2, 0:4] == 0).all()
+    assert (atlas[0:3, cell_width : cell_width + 2] == 1).all()
+    assert (atlas[cell_height : cell_height + 1, 0:1] == 2).all()
+
+
+def test_draw_level_markers():
+    # GIVEN an empty framebuffer
+    framebuffer = numpy.zeros((32, 32, 3), dtype=numpy.uint8)
+
+    # WHEN a level at the second block of the second row is marked
+    draw_level_markers(framebuffer, [(1, 1)], 16)
+
+    # THEN only the edges of that block are marked
+    assert (framebuffer[16, 16:32] == MARKER_COLOR).all()
+    assert (framebuffer[16:32, 31] == MARKER_COLOR).all()
+
+    assert not framebuffer[24, 24].any()
+    assert not framebuffer[0:16].any()
+
+
+def test_render_world_maps():
+    # WHEN all world maps are rendered with their level positions
+    world_map_images = render_world_maps(str(root_dir / "SMB3.nes"), processes=2, with_markers=True)
+
+    # THEN every world map is there in order, with its levels
+    assert [image.world_number for image in world_map_images] == list(range(1, WORLD_COUNT + 1))
+    assert all(image.level_positions for image in world_map_images)
+
+
+def test_render_overview():
+    # WHEN the overview is rendered with one world map per row
+    overview = render_overview(str(root_dir / "SMB3.nes"), processes=2, columns=1)
+
+    # THEN all world maps are below each other
+    assert overview.shape[0] > WORLD_COUNT * CELL_PADDING
@@ -0,0 +1,206 @@
+"""
+Renders all world maps of a ROM into one overview image, without starting the editor.
+
+The world maps are rendered in parallel, one per process, and then put into a grid, one world map per cell, in the order
+of the worlds. Optionally, the positions of the levels are marked, as they are listed in the ROM.
+"""
+
+import argparse
+import sys
+import time
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy
+
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.LevelRenderer import Framebuffer, LevelRenderer, save_png
+from smb3parse.levels import WORLD_COUNT, WORLD_MAP_SCREEN_WIDTH
+from smb3parse.levels.world_map import WorldMap as _WorldMap, list_world_map_addresses
+
+# how many world maps are put next to each other, so that all nine fit into a 3 by 3 grid
+DEFAULT_COLUMNS = 3
+
+# space between the world maps, in pixels
+CELL_PADDING = 8
+
+BACKGROUND_COLOR = (0x00, 0x00, 0x00)
+MARKER_COLOR = (0xFF, 0x00, 0x00)
+
+# in pixels
+MARKER_WIDTH = 2
+
+LevelPosition = Tuple[int, int]
+
+
+class WorldMapImage(NamedTuple):
+    world_number: int
+    framebuffer: Framebuffer
+    # the x and y of every level, in blocks across all screens
+    level_positions: List[LevelPosition]
+
+
+def level_position_index(world_map: _WorldMap) -> List[LevelPosition]:
+    """
+    Returns the positions of the levels on the given world map, in blocks across all screens, like the foundry WorldMap
+    places its tiles.
+    """
+    return [
+        ((position.screen - 1) * WORLD_MAP_SCREEN_WIDTH + position.column, position.row)
+        for position in world_map.level_positions()
+    ]
+
+
+def draw_level_markers(framebuffer: Framebuffer, level_positions: List[LevelPosition], block_length: int):
+    """
+    Draws a frame around every given level position.
+    """
+    for x, y in level_positions:
+        left, top = x * block_length, y * block_length
+        right, bottom = left + block_length, top + block_length
+
+        framebuffer[top : top + MARKER_WIDTH, left:right] = MARKER_COLOR
+        framebuffer[bottom - MARKER_WIDTH : bottom, left:right] = MARKER_COLOR
+        framebuffer[top:bottom, left : left + MARKER_WIDTH] = MARKER_COLOR
+        framebuffer[top:bottom, right - MARKER_WIDTH : right] = MARKER_COLOR
+
+
+def compose_atlas(framebuffers: List[Framebuffer], columns: int = DEFAULT_COLUMNS) -> Framebuffer:
+    """
+    Puts the given framebuffers into a grid, row by row, with every cell as big as the largest framebuffer.
+    """
+    if not framebuffers:
+        raise ValueError("Need at least one framebuffer to compose an atlas.")
+
+    if columns <= 0:
+        raise ValueError(f"Number of columns must be positive, was {columns}.")
+
+    cell_height = max(framebuffer.shape[0] for framebuffer in framebuffers) + CELL_PADDING
+    cell_width = max(framebuffer.shape[1] for framebuffer in framebuffers) + CELL_PADDING
+
+    rows = (len(framebuffers) + columns - 1) // columns
+    columns = min(columns, len(framebuffers))
+
+    atlas = numpy.empty((rows * cell_height - CELL_PADDING, columns * cell_width - CELL_PADDING, 3), dtype=numpy.uint8)
+    atlas[:] = BACKGROUND_COLOR
+
+    for index, framebuffer in enumerate(framebuffers):
+        row, column = divmod(index, columns)
+
+        top, left = row * cell_height, column * cell_width
+        height, width, _ = framebuffer.shape
+
+        atlas[top : top + height, left : left + width] = framebuffer
+
+    return atlas
+
+
+_renderer: Optional[LevelRenderer] = None
+_with_markers = False
+
+
+def _init_worker(rom_path: str, block_length: int, with_markers: bool):
+    global _renderer, _with_markers
+
+    ROM.load_from_file(rom_path)
+
+    _renderer = LevelRenderer(block_length)
+    _with_markers = with_markers
+
+
+def _render_world_map(world_map_address: int) -> WorldMapImage:
+    world_map = _WorldMap(world_map_address, ROM())
+
+    framebuffer = _renderer.render_world_map(world_map)
+
+    if _with_markers:
+        level_positions = level_position_index(world_map)
+
+        draw_level_markers(framebuffer, level_positions, _renderer.block_length)
+    else:
+        level_positions = []
+
+    return WorldMapImage(world_map.number, framebuffer, level_positions)
+
+
+def render_world_maps(
+    rom_path: str,
+    processes: Optional[int] = None,
+    block_length: int = Block.SIDE_LENGTH,
+    with_markers: bool = False,
+) -> List[WorldMapImage]:
+    """
+    Renders every world map of the ROM in parallel.
+
+    :return: The rendered world maps, in the order of the worlds.
+    """
+    ROM.load_from_file(rom_path)
+
+    world_map_addresses = list_world_map_addresses(ROM())
+
+    assert len(world_map_addresses) == WORLD_COUNT
+
+    with Pool(processes, _init_worker, (rom_path, block_length, with_markers)) as pool:
+        return pool.map(_render_world_map, world_map_addresses)
+
+
+def render_overview(
+    rom_path: str,
+    processes: Optional[int] = None,
+    block_length: int = Block.SIDE_LENGTH,
+    with_markers: bool = False,
+    columns: int = DEFAULT_COLUMNS,
+) -> Framebuffer:
+    """
+    :return: A (height, width, 3) array of uint8 RGB values, with all world maps of the ROM in a grid.
+    """
+    world_map_images = render_world_maps(rom_path, processes, block_length, with_markers)
+
+    return compose_atlas([world_map_image.framebuffer for world_map_image in world_map_images], columns)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Renders all world maps of a SMB3 ROM into one PNG file.")
+    parser.add_argument("rom", help="path to the ROM")
+    parser.add_argument("output", type=Path, help="PNG file to save the overview into")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=cpu_count(), help="number of processes to render with (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-b",
+        "--block-length",
+        type=int,
+        default=Block.SIDE_LENGTH,
+        help=f"side length of a block in pixels, a multiple of {Block.SIDE_LENGTH} (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--columns",
+        type=int,
+        default=DEFAULT_COLUMNS,
+        help="number of world maps next to each other (default: %(default)s)",
+    )
+    parser.add_argument("-m", "--markers", action="store_true", help="mark the positions of the levels")
+
+    args = parser.parse_args(argv)
+
+    if args.block_length <= 0 or args.block_length % Block.SIDE_LENGTH:
+        parser.error(f"block length must be a positive multiple of {Block.SIDE_LENGTH}")
+
+    if args.columns <= 0:
+        parser.error("number of columns must be positive")
+
+    start = time.perf_counter()
+
+    overview = render_overview(args.rom, args.jobs, args.block_length, args.markers, args.columns)
+
+    if not save_png(overview, args.output):
+        print(f"Could not write {args.output}.", file=sys.stderr)
+
+        return 1
+
+    print(f"Rendered {WORLD_COUNT} world maps into {args.output} in {time.perf_counter() - start:.2f}s.")
+
+    return 0
@@ -18,7 +18,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     zip_safe=True,
-    install_requires=["PySide2>=5.15.0"],
+    install_requires=["PySide2>=5.15.0", "numpy"],
     test_suite="tests",
-    scripts=["smb3-foundry.py"],
+    scripts=["smb3-foundry.py", "smb3-render.py", "smb3-validate.py", "smb3-overview.py"],
 )
@@ -4,10 +4,16 @@ import sys
 import traceback
 import logging
 
+from foundry.startup_profile import StartupProfile
+
+# set up first, so that all following imports are timed
+startup_profile = StartupProfile.from_arguments(sys.argv)
+
 from foundry import github_issue_link
 
 logger = logging.getLogger(__name__)
 
+from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QApplication, QMessageBox
 
 # change into the tmp directory pyinstaller uses for the data
@@ -21,10 +27,18 @@ from foundry.gui.MainWindow import MainWindow
 
 
 def main(path_to_rom):
-    load_settings()
+    with startup_profile.stage("load settings"):
+        load_settings()
+
+    with startup_profile.stage("create application"):
+        app = QApplication()
+
+    with startup_profile.stage("create main window"):
+        MainWindow(path_to_rom)
+
+    # runs, once the event loop has shown the window
+    QTimer.singleShot(0, startup_profile.finish)
 
-    app = QApplication()
-    MainWindow(path_to_rom)
     app.exec_()
 
     save_settings()
@@ -400,6 +400,39 @@ class WorldMap(LevelBase):
             else:
                 yield Level(self._rom, *level_info_tuple)
 
+    def level_positions(self) -> List[WorldMapPosition]:
+        """
+        Returns the positions of all levels listed for this world map, read from the level position lists in one go,
+        instead of checking every tile for a level, like gen_levels does.
+        """
+        level_y_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.little_endian(
+            LEVEL_Y_POS_LISTS + OFFSET_SIZE * self.world_index
+        )
+
+        level_x_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.little_endian(
+            LEVEL_X_POS_LISTS + OFFSET_SIZE * self.world_index
+        )
+
+        level_count = level_x_pos_list_start - level_y_pos_list_start
+
+        row_values = self._rom.read(level_y_pos_list_start, level_count)
+        column_values = self._rom.read(level_x_pos_list_start, level_count)
+
+        positions = []
+
+        for row_value, column_value in zip(row_values, column_values):
+            # the rows include the black border and share their byte with the object set, like in level_indexes
+            screen = (column_value >> 4) + 1
+            row = (row_value >> 4) - FIRST_VALID_ROW
+            column = column_value & 0x0F
+
+            if screen > self.screen_count or row not in range(WORLD_MAP_HEIGHT):
+                continue
+
+            positions.append(WorldMapPosition(self, screen, row, column))
+
+        return positions
+
     @staticmethod
     def from_world_number(rom: Rom, world_number: int) -> "WorldMap":
         if not world_number - 1 in range(WORLD_COUNT):
@@ -9,6 +9,7 @@ from smb3parse.levels.world_map import (
 )
 from smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
 from smb3parse.constants import TILE_BOWSER_CASTLE
+from smb3parse.levels.WorldMapPosition import WorldMapPosition
 
 world_map_addresses = [0x185BA, 0x1864B, 0x1876C, 0x1891D, 0x18A3E, 0x18B5F, 0x18D10, 0x18E31, 0x19072]
 world_map_screen_counts = [1, 2, 3, 2, 2, 3, 2, 4, 1]
@@ -165,3 +166,13 @@ def test_special_enterable_tiles(rom):
 
     assert special_enterable_tiles.find(first_special_tile) == 0
     assert special_enterable_tiles.rfind(last_special_tile) == len(special_enterable_tiles) - 1
+
+
+def test_level_positions(world_1, world_8):
+    level_positions_1 = world_1.level_positions()
+
+    assert len(level_positions_1) == world_1.level_count
+    assert all(position.screen == 1 for position in level_positions_1)
+    assert WorldMapPosition(world_1, 1, 0, 10) in level_positions_1
+
+    assert WorldMapPosition(world_8, 4, 5, 12) in world_8.level_positions()